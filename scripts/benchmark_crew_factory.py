@@ -0,0 +1,54 @@
+"""Benchmark: building the crew from scratch vs copying the cached template.
+
+Measures what each job used to pay before kickoff (parse agents.yaml and
+tasks.yaml, create agents, LLM clients and tools) against the per-job
+cost with CrewFactory (copy the template, reset token counters). No LLM
+or search calls are made.
+
+Usage:
+    PYTHONPATH=src uv run python scripts/benchmark_crew_factory.py
+    PYTHONPATH=src uv run python scripts/benchmark_crew_factory.py --repeat 50
+"""
+
+import argparse
+import statistics
+import time
+
+from adapter.crew.crew import ReadingMaterialCreator
+from adapter.crew.factory import CrewFactory
+
+
+def _time_ms(build, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    print(f"{label:<10} mean={statistics.mean(timings):8.2f}ms  "
+          f"median={statistics.median(timings):8.2f}ms  max={max(timings):8.2f}ms")
+
+
+def main(repeat: int) -> None:
+    factory = CrewFactory(ReadingMaterialCreator)
+
+    started = time.perf_counter()
+    factory.create()  # builds the template once
+    print(f"Template build (once per process): {(time.perf_counter() - started) * 1000:.2f}ms")
+
+    fresh = _time_ms(factory.create_uncached, repeat)
+    cached = _time_ms(factory.create, repeat)
+    _report("fresh", fresh)
+    _report("cached", cached)
+    print(f"Saved per job: {statistics.mean(fresh) - statistics.mean(cached):.2f}ms "
+          f"({statistics.mean(fresh) / statistics.mean(cached):.1f}x faster)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-job crew construction")
+    parser.add_argument("--repeat", type=int, default=20, help="Builds per mode")
+    args = parser.parse_args()
+    main(args.repeat)
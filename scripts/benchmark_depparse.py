@@ -0,0 +1,103 @@
+"""Benchmark: full Stanza pipeline vs two-stage (conditional depparse).
+
+Runs every German test case through both StanzaAdapter modes and reports
+per-call latency plus whether resolve_lemma() still yields the same lemma
+and related_words. Models are preloaded before timing starts.
+
+For each test case:
+  1. Extract with the full pipeline (tokenize,mwt,pos,lemma,depparse)
+  2. Extract with two-stage mode (depparse only for verbs / separable prefixes)
+  3. Compare resolved lemma + related_words and record latencies
+
+Usage:
+    PYTHONPATH=src uv run python scripts/benchmark_depparse.py
+    PYTHONPATH=src uv run python scripts/benchmark_depparse.py --limit 50 --repeat 3
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+sys.path.insert(0, "scripts")
+from test_cases import TEST_CASES_DE
+
+from adapter.nlp.stanza import StanzaAdapter
+from services.lemma_extraction import resolve_lemma
+
+
+async def _timed_extract(adapter: StanzaAdapter, word: str, sentence: str) -> tuple[dict | None, float]:
+    start = time.perf_counter()
+    info = await adapter.extract(word, sentence)
+    return info, (time.perf_counter() - start) * 1000
+
+
+def _resolve(info: dict | None, word: str) -> tuple[str, list[str]] | None:
+    return resolve_lemma(info, word) if info else None
+
+
+def _summary(label: str, latencies: list[float]) -> str:
+    if not latencies:
+        return f"{label:<12} n=0"
+    p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else max(latencies)
+    return (
+        f"{label:<12} n={len(latencies):<4} "
+        f"mean={statistics.mean(latencies):7.1f}ms  "
+        f"median={statistics.median(latencies):7.1f}ms  "
+        f"p95={p95:7.1f}ms"
+    )
+
+
+async def main(limit: int | None, repeat: int) -> None:
+    cases = TEST_CASES_DE[:limit] if limit else TEST_CASES_DE
+
+    full = StanzaAdapter(two_stage=False)
+    staged = StanzaAdapter(two_stage=True)
+    print("Loading pipelines...")
+    full.preload()
+    staged.preload()
+
+    full_ms: list[float] = []
+    staged_ms: list[float] = []
+    staged_skipped_ms: list[float] = []
+    staged_parsed_ms: list[float] = []
+    mismatches = []
+
+    for sentence, word, _lemma, _rw, _category in cases:
+        for _ in range(repeat):
+            full_info, t_full = await _timed_extract(full, word, sentence)
+            staged_info, t_staged = await _timed_extract(staged, word, sentence)
+            full_ms.append(t_full)
+            staged_ms.append(t_staged)
+
+            if staged_info and staged_info["pos"] == "verb":
+                staged_parsed_ms.append(t_staged)
+            else:
+                staged_skipped_ms.append(t_staged)
+
+        full_resolved = _resolve(full_info, word)
+        staged_resolved = _resolve(staged_info, word)
+        if full_resolved != staged_resolved:
+            mismatches.append((sentence, word, full_resolved, staged_resolved))
+
+    print()
+    print(_summary("full", full_ms))
+    print(_summary("two-stage", staged_ms))
+    print(_summary("  parsed", staged_parsed_ms))
+    print(_summary("  skipped", staged_skipped_ms))
+    if full_ms and staged_ms:
+        saving = 1 - statistics.mean(staged_ms) / statistics.mean(full_ms)
+        print(f"\nMean latency saving: {saving:.1%}")
+
+    print(f"Resolved lemma mismatches: {len(mismatches)} / {len(cases)}")
+    for sentence, word, full_resolved, staged_resolved in mismatches:
+        print(f"  - {word!r} in {sentence!r}: full={full_resolved} two-stage={staged_resolved}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark conditional depparse")
+    parser.add_argument("--limit", type=int, default=None, help="Limit number of test cases")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per test case")
+    args = parser.parse_args()
+    asyncio.run(main(args.limit, args.repeat))
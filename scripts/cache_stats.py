@@ -0,0 +1,43 @@
+"""Print hit rates of the shared tool caches.
+
+Reads the lookup counters the worker keeps in Redis (see
+adapter.cache.redis_search_cache and adapter.cache.redis_scrape_cache),
+so it works without the API.
+
+Usage:
+    PYTHONPATH=src uv run python scripts/cache_stats.py
+    PYTHONPATH=src uv run python scripts/cache_stats.py --json
+"""
+
+import argparse
+import json
+import sys
+
+from adapter.cache.redis_scrape_cache import RedisScrapeCache
+from adapter.cache.redis_search_cache import RedisSearchCache
+
+
+def main(as_json: bool) -> int:
+    stats = {'search': RedisSearchCache().get_stats(), 'scrape': RedisScrapeCache().get_stats()}
+    if any(s is None for s in stats.values()):
+        print("Redis unavailable", file=sys.stderr)
+        return 1
+
+    if as_json:
+        print(json.dumps(stats, indent=2))
+        return 0
+
+    for name, s in stats.items():
+        rate = f"{s['hit_rate']:.1%}" if s['hit_rate'] is not None else "n/a"
+        print(f"{name:<8} hit rate {rate} ({s['hits']} hits / {s['lookups']} lookups)")
+    scrape = stats['scrape']
+    print(f"         {scrape['revalidated']} revalidated (304), {scrape['evictions']} evicted, "
+          f"{scrape['pages']} pages in {scrape['stored_bytes'] / 1024 / 1024:.1f}/{scrape['max_bytes'] / 1024 / 1024:.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show shared tool cache hit rates")
+    parser.add_argument("--json", action="store_true", help="Print raw stats as JSON")
+    args = parser.parse_args()
+    sys.exit(main(args.json))
@@ -0,0 +1,48 @@
+"""Print job queue telemetry and the recommended worker count.
+
+Reads the same metrics as GET /stats/queue straight from Redis, so it
+works without the API (e.g. from a cron-driven autoscaler or a shell).
+
+Usage:
+    PYTHONPATH=src uv run python scripts/queue_metrics.py
+    PYTHONPATH=src uv run python scripts/queue_metrics.py --json
+    PYTHONPATH=src uv run python scripts/queue_metrics.py --concurrency 4 --target-wait 30
+"""
+
+import argparse
+import json
+import sys
+
+from adapter.queue.redis_job_queue import RedisJobQueueAdapter
+from services.worker_scaling import TARGET_WAIT_SECONDS, recommend_worker_count
+
+
+def main(as_json: bool, concurrency: int | None, target_wait: float) -> int:
+    metrics = RedisJobQueueAdapter().get_queue_metrics()
+    if metrics is None:
+        print("Redis unavailable", file=sys.stderr)
+        return 1
+    scaling = recommend_worker_count(metrics, concurrency=concurrency, target_wait_seconds=target_wait)
+
+    if as_json:
+        print(json.dumps({**metrics, 'scaling': scaling}, indent=2))
+        return 0
+
+    print(f"Queue depth:        {metrics['depth']} (oldest waiting {metrics['oldest_age_seconds']}s)")
+    for lane, lane_metrics in metrics['lanes'].items():
+        print(f"  {lane:<8} depth={lane_metrics['depth']} oldest={lane_metrics['oldest_age_seconds']}s")
+    print(f"Workers:            {metrics['workers']} ({metrics['in_flight']}/{metrics['slots']} slots busy)")
+    runtime = metrics['processing_time']
+    print(f"Processing time:    avg={runtime['avg_seconds']}s over {runtime['count']} jobs")
+    print(f"Recommended workers: {scaling['recommended_workers']} "
+          f"({scaling['required_slots']} slots at {scaling['per_worker_concurrency']} per worker)")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show job queue telemetry")
+    parser.add_argument("--json", action="store_true", help="Print raw metrics as JSON")
+    parser.add_argument("--concurrency", type=int, default=None, help="Per-worker concurrency (default: from heartbeats)")
+    parser.add_argument("--target-wait", type=float, default=TARGET_WAIT_SECONDS, help="Target queue wait in seconds")
+    args = parser.parse_args()
+    sys.exit(main(args.json, args.concurrency, args.target_wait))
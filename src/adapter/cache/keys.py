@@ -0,0 +1,65 @@
+"""Cache keys for the shared tool caches.
+
+Kept free of crewai imports so the key rules can be tested and reused
+outside the crew (scripts, other adapters).
+"""
+
+import hashlib
+import os
+import re
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SEARCH_CACHE_BUCKET_SECONDS = int(os.getenv('SEARCH_CACHE_BUCKET_SECONDS', str(3 * 3600)))
+
+_WORD = re.compile(r'\w+')
+# Query parameters that only track the visit and never change the page
+_TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ocid|cmpid|ref|smid)$', re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """Case-fold and drop punctuation/extra whitespace: ' AI  News!' -> 'ai news'."""
+    return ' '.join(_WORD.findall(query.casefold()))
+
+
+def search_cache_key(
+    query: str,
+    language: str,
+    search_type: str,
+    now: float | None = None,
+    bucket_seconds: int = SEARCH_CACHE_BUCKET_SECONDS,
+) -> str:
+    """Cache key for a search; changes when the time bucket rolls over."""
+    bucket = int((time.time() if now is None else now) // bucket_seconds)
+    raw = '\x1f'.join((search_type.lower(), language.casefold(), normalize_query(query), str(bucket)))
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def search_bucket_ttl(now: float, bucket_seconds: int = SEARCH_CACHE_BUCKET_SECONDS) -> int:
+    """Seconds left in the time bucket of `now`, so an entry expires with its key (at least 1)."""
+    return max(1, int(bucket_seconds - now % bucket_seconds))
+
+
+def canonical_url(url: str) -> str:
+    """Canonical form of a page URL for caching.
+
+    Lower-cases scheme and host, drops default ports, the fragment,
+    tracking parameters (utm_*, fbclid, ...) and a trailing slash, and
+    sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or 'https'
+    host = (parts.hostname or '').lower()
+    if parts.port and (scheme, parts.port) not in (('http', 80), ('https', 443)):
+        host = f'{host}:{parts.port}'
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAMS.match(name)
+    )
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def scrape_cache_key(url: str) -> str:
+    return hashlib.sha256(canonical_url(url).encode()).hexdigest()[:32]
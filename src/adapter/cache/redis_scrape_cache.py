@@ -0,0 +1,208 @@
+"""Redis implementation of ScrapeCachePort.
+
+Layout:
+- opad:cache:scrape:page:{key}  Hash: zlib-compressed text (base64, the
+                                pooled client decodes responses), etag,
+                                last_modified, fetched_ms
+- opad:cache:scrape:lru         Sorted set key -> last access (ms)
+- opad:cache:scrape:sizes       Hash key -> stored bytes
+- opad:cache:scrape:bytes       Total stored bytes
+- opad:cache:scrape:stats       Hash of counters (hits, stale, misses,
+                                revalidated, evictions)
+
+Pages have no TTL; the store is bounded by SCRAPE_CACHE_MAX_BYTES and
+_PUT_LUA evicts least recently used pages until it fits. Reads and
+writes are one Lua call each (freshness uses Redis TIME, so worker
+clocks do not matter). Like the queue scripts, page keys are built from
+an ARGV prefix, so this assumes a single Redis node.
+"""
+
+import base64
+import logging
+import os
+import zlib
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from adapter.queue.connection import get_redis_client
+from adapter.queue.scripts import ScriptRegistry
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_PAGE_PREFIX = 'opad:cache:scrape:page:'
+SCRAPE_LRU_KEY = 'opad:cache:scrape:lru'
+SCRAPE_SIZES_KEY = 'opad:cache:scrape:sizes'
+SCRAPE_BYTES_KEY = 'opad:cache:scrape:bytes'
+SCRAPE_STATS_KEY = 'opad:cache:scrape:stats'
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv('SCRAPE_CACHE_MAX_BYTES', str(100 * 1024 * 1024)))
+
+# KEYS[1] = page hash, KEYS[2] = lru set, KEYS[3] = stats; ARGV[1] = key,
+# ARGV[2] = fresh window (ms). Returns {text, etag, last_modified, fresh}
+# or nil, and counts a hit, stale hit or miss.
+_GET_LUA = """
+local page = redis.call('HMGET', KEYS[1], 'text', 'etag', 'last_modified', 'fetched_ms')
+if not page[1] then
+    redis.call('HINCRBY', KEYS[3], 'misses', 1)
+    return nil
+end
+local t = redis.call('TIME')
+local now_ms = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+redis.call('ZADD', KEYS[2], now_ms, ARGV[1])
+local fresh = now_ms - tonumber(page[4] or '0') <= tonumber(ARGV[2])
+redis.call('HINCRBY', KEYS[3], fresh and 'hits' or 'stale', 1)
+return {page[1], page[2] or '', page[3] or '', fresh and '1' or '0'}
+"""
+
+# KEYS[1] = page hash, KEYS[2] = lru set, KEYS[3] = sizes hash, KEYS[4] =
+# bytes counter, KEYS[5] = stats; ARGV[1] = key, ARGV[2] = compressed text,
+# ARGV[3] = etag, ARGV[4] = last_modified, ARGV[5] = max bytes, ARGV[6] =
+# page prefix. Returns the number of evicted pages.
+_PUT_LUA = """
+local t = redis.call('TIME')
+local now_ms = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local size = string.len(ARGV[2])
+local old = tonumber(redis.call('HGET', KEYS[3], ARGV[1]) or '0')
+redis.call('HSET', KEYS[1], 'text', ARGV[2], 'etag', ARGV[3], 'last_modified', ARGV[4], 'fetched_ms', now_ms)
+redis.call('HSET', KEYS[3], ARGV[1], size)
+redis.call('ZADD', KEYS[2], now_ms, ARGV[1])
+local total = redis.call('INCRBY', KEYS[4], size - old)
+local evicted = 0
+while total > tonumber(ARGV[5]) do
+    local oldest = redis.call('ZPOPMIN', KEYS[2])
+    if #oldest == 0 then
+        break
+    end
+    local freed = tonumber(redis.call('HGET', KEYS[3], oldest[1]) or '0')
+    redis.call('HDEL', KEYS[3], oldest[1])
+    redis.call('DEL', ARGV[6] .. oldest[1])
+    total = redis.call('DECRBY', KEYS[4], freed)
+    evicted = evicted + 1
+end
+if evicted > 0 then
+    redis.call('HINCRBY', KEYS[5], 'evictions', evicted)
+end
+return evicted
+"""
+
+# KEYS[1] = page hash, KEYS[2] = stats. Restarts the page's fresh window
+# after a 304; returns 0 if the page was evicted meanwhile.
+_REVALIDATE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+local t = redis.call('TIME')
+redis.call('HSET', KEYS[1], 'fetched_ms', tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000))
+redis.call('HINCRBY', KEYS[2], 'revalidated', 1)
+return 1
+"""
+
+
+def compress_text(text: str) -> str:
+    return base64.b64encode(zlib.compress(text.encode('utf-8'))).decode('ascii')
+
+
+def decompress_text(blob: str) -> str:
+    return zlib.decompress(base64.b64decode(blob)).decode('utf-8')
+
+
+def scrape_stats(raw: dict) -> dict:
+    """Turn the scrape counter hash into hit-rate stats.
+
+    hit_rate counts pages served without a full download: fresh hits
+    plus stale pages the origin confirmed unchanged (304).
+    """
+    counts = {name: int(raw.get(name, 0)) for name in ('hits', 'stale', 'misses', 'revalidated', 'evictions')}
+    lookups = counts['hits'] + counts['stale'] + counts['misses']
+    served = counts['hits'] + counts['revalidated']
+    return {
+        **counts,
+        'lookups': lookups,
+        'hit_rate': round(served / lookups, 3) if lookups else None,
+    }
+
+
+class RedisScrapeCache:
+    def __init__(self, max_bytes: int = SCRAPE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._scripts = ScriptRegistry()
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        return get_redis_client()
+
+    def get(self, key: str, fresh_seconds: int) -> dict | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            page = self._scripts.get(client, _GET_LUA)(
+                keys=[f'{SCRAPE_PAGE_PREFIX}{key}', SCRAPE_LRU_KEY, SCRAPE_STATS_KEY],
+                args=[key, fresh_seconds * 1000],
+            )
+            if not page:
+                return None
+            blob, etag, last_modified, fresh = page
+            return {
+                'text': decompress_text(blob),
+                'etag': etag,
+                'last_modified': last_modified,
+                'fresh': fresh == '1',
+            }
+        except (RedisError, ValueError, zlib.error) as e:
+            logger.warning("Scrape cache read failed", extra={"error": str(e)})
+            return None
+
+    def put(self, key: str, text: str, etag: str = '', last_modified: str = '') -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            evicted = self._scripts.get(client, _PUT_LUA)(
+                keys=[
+                    f'{SCRAPE_PAGE_PREFIX}{key}', SCRAPE_LRU_KEY, SCRAPE_SIZES_KEY,
+                    SCRAPE_BYTES_KEY, SCRAPE_STATS_KEY,
+                ],
+                args=[key, compress_text(text), etag, last_modified, self.max_bytes, SCRAPE_PAGE_PREFIX],
+            )
+            if evicted:
+                logger.info("Scrape cache evicted pages", extra={"evicted": evicted})
+            return True
+        except RedisError as e:
+            logger.warning("Scrape cache write failed", extra={"error": str(e)})
+            return False
+
+    def revalidated(self, key: str) -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            return bool(self._scripts.get(client, _REVALIDATE_LUA)(
+                keys=[f'{SCRAPE_PAGE_PREFIX}{key}', SCRAPE_STATS_KEY],
+            ))
+        except RedisError:
+            return False
+
+    def get_stats(self) -> dict | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.hgetall(SCRAPE_STATS_KEY)
+            pipe.get(SCRAPE_BYTES_KEY)
+            pipe.zcard(SCRAPE_LRU_KEY)
+            raw, stored_bytes, pages = pipe.execute()
+        except RedisError as e:
+            logger.error("Failed to get scrape cache stats", extra={"error": str(e)})
+            return None
+        return {
+            **scrape_stats(raw),
+            'pages': pages,
+            'stored_bytes': int(stored_bytes or 0),
+            'max_bytes': self.max_bytes,
+        }
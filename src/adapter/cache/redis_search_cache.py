@@ -0,0 +1,91 @@
+"""Redis implementation of SearchCachePort.
+
+Layout:
+- opad:cache:search:{key}   JSON search results (TTL set by the caller)
+- opad:cache:search:stats   Hash of lookup counters (hits, misses)
+
+A lookup and its hit/miss counter update are one Lua call, so reading
+the cache costs a single round trip. Uses the worker's pooled client
+from adapter.queue.connection.
+"""
+
+import json
+import logging
+from typing import Optional
+
+import redis
+from redis.exceptions import RedisError
+
+from adapter.queue.connection import get_redis_client
+from adapter.queue.scripts import ScriptRegistry
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_PREFIX = 'opad:cache:search:'
+SEARCH_STATS_KEY = 'opad:cache:search:stats'
+
+# KEYS[1] = entry, KEYS[2] = stats hash. Returns the cached JSON or nil.
+_GET_COUNTED_LUA = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('HINCRBY', KEYS[2], 'hits', 1)
+else
+    redis.call('HINCRBY', KEYS[2], 'misses', 1)
+end
+return value
+"""
+
+
+def cache_stats(raw: dict) -> dict:
+    """Turn a hits/misses counter hash into hit-rate stats."""
+    hits, misses = int(raw.get('hits', 0)), int(raw.get('misses', 0))
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'lookups': lookups,
+        'hit_rate': round(hits / lookups, 3) if lookups else None,
+    }
+
+
+class RedisSearchCache:
+    def __init__(self):
+        self._scripts = ScriptRegistry()
+
+    def _get_client(self) -> Optional[redis.Redis]:
+        return get_redis_client()
+
+    def get(self, key: str) -> dict | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            raw = self._scripts.get(client, _GET_COUNTED_LUA)(keys=[f'{SEARCH_CACHE_PREFIX}{key}', SEARCH_STATS_KEY])
+            return json.loads(raw) if raw else None
+        except (RedisError, json.JSONDecodeError) as e:
+            logger.warning("Search cache read failed", extra={"error": str(e)})
+            return None
+
+    def put(self, key: str, results: dict, ttl_seconds: int) -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            client.set(f'{SEARCH_CACHE_PREFIX}{key}', json.dumps(results), ex=ttl_seconds)
+            return True
+        except RedisError as e:
+            logger.warning("Search cache write failed", extra={"error": str(e)})
+            return False
+
+    def get_stats(self) -> dict | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            return cache_stats(client.hgetall(SEARCH_STATS_KEY))
+        except RedisError as e:
+            logger.error("Failed to get search cache stats", extra={"error": str(e)})
+            return None
@@ -2,11 +2,14 @@
 
 import logging
 
+from adapter.crew.cached_tools import tool_cache_scope
 from adapter.crew.main import run as run_crew
 from adapter.crew.models import ReviewedArticle
-from adapter.crew.progress_listener import JobProgressListener
+from adapter.crew.progress_listener import track_job_progress
 from domain.model.article import ArticleInputs, GenerationResult, SourceInfo
 from port.job_queue import JobQueuePort
+from port.scrape_cache import ScrapeCachePort
+from port.search_cache import SearchCachePort
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +17,20 @@ logger = logging.getLogger(__name__)
 class CrewAIArticleGenerator:
     """Generates articles using CrewAI pipeline.
 
-    Tracks job progress via JobProgressListener.
+    Tracks job progress via JobProgressListener. Safe to call from several
+    worker threads at once: each call's events go to its own listener.
+    News searches and page scrapes go through the shared caches when given.
     """
 
-    def __init__(self, job_queue: JobQueuePort):
+    def __init__(
+        self,
+        job_queue: JobQueuePort,
+        search_cache: SearchCachePort | None = None,
+        scrape_cache: ScrapeCachePort | None = None,
+    ):
         self.job_queue = job_queue
+        self.search_cache = search_cache
+        self.scrape_cache = scrape_cache
 
     def generate(
         self,
@@ -28,8 +40,6 @@ class CrewAIArticleGenerator:
         article_id: str = "",
     ) -> GenerationResult:
         """Run CrewAI pipeline and return framework-agnostic result."""
-        from crewai.events.event_bus import crewai_event_bus
-
         crew_inputs = {
             'language': inputs.language,
             'level': inputs.level,
@@ -38,14 +48,16 @@ class CrewAIArticleGenerator:
             'vocabulary_list': vocabulary if vocabulary else "",
         }
 
-        with crewai_event_bus.scoped_handlers():
-            listener = JobProgressListener(
-                job_id=job_id,
-                article_id=article_id,
-                job_queue=self.job_queue,
-            )
+        # A retried or recovered job keeps its id, so finished tasks are skipped
+        checkpoints = self.job_queue.load_checkpoints(job_id) if job_id else {}
+        if checkpoints:
+            logger.info("Resuming job from checkpoints", extra={"jobId": job_id, "tasks": sorted(checkpoints)})
 
-            result = run_crew(inputs=crew_inputs)
+        with (
+            track_job_progress(job_id, article_id, self.job_queue) as listener,
+            tool_cache_scope(self.search_cache, self.scrape_cache, inputs.language),
+        ):
+            result = run_crew(inputs=crew_inputs, checkpoints=checkpoints)
 
             if listener.task_failed:
                 raise RuntimeError("CrewAI task failed during execution")
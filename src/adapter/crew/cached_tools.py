@@ -0,0 +1,140 @@
+"""Crew tools backed by caches shared across jobs and workers.
+
+Many users ask for the same topic in the same language within a few
+hours, and jobs often land on the same popular stories, so every job
+would otherwise repeat the same Serper calls and page downloads.
+
+- CachedSerperDevTool looks results up by (normalized query, search
+  type, job language, time bucket). Entries expire when their bucket
+  ends, so results are at most SEARCH_CACHE_BUCKET_SECONDS old and no
+  entry outlives the only key that can read it.
+- BatchScrapeWebsiteTool fetches all candidate pages of the finder in
+  one call, concurrently, through the shared scrape cache (see
+  adapter.external.page_fetcher for the fetch and cache rules).
+
+Tool instances are shared by every job in the process (see
+adapter.crew.factory), so the caches and the job's language are bound
+per job with tool_cache_scope(), like track_job_progress(). Tools run
+on the crew's own thread (no agent max_execution_time is set), so they
+see the scope of the job that called them. Outside a scope the tools
+work the same, just without caching.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from crewai_tools import ScrapeWebsiteTool, SerperDevTool
+from pydantic import BaseModel, Field
+
+from adapter.cache.keys import (
+    normalize_query,
+    search_bucket_ttl,
+    search_cache_key,
+)
+from adapter.external.page_fetcher import fetch_pages, format_pages
+
+if TYPE_CHECKING:
+    from port.scrape_cache import ScrapeCachePort
+    from port.search_cache import SearchCachePort
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on pages per batch call (the finder wants 3-5 articles)
+MAX_BATCH_URLS = 10
+
+
+@dataclass(frozen=True)
+class _CacheScope:
+    search: 'SearchCachePort | None'
+    scrape: 'ScrapeCachePort | None'
+    language: str
+
+
+_scope: contextvars.ContextVar[_CacheScope | None] = contextvars.ContextVar('tool_cache_scope', default=None)
+
+
+@contextmanager
+def tool_cache_scope(
+    search_cache: 'SearchCachePort | None',
+    scrape_cache: 'ScrapeCachePort | None',
+    language: str,
+) -> Iterator[None]:
+    """Let the cached tools' calls in this context use the given caches (None = no caching)."""
+    token = _scope.set(_CacheScope(search_cache, scrape_cache, language))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """SerperDevTool that serves repeated searches from the shared cache."""
+
+    def _run(self, **kwargs: Any) -> Any:
+        scope = _scope.get()
+        search_query = kwargs.get('search_query') or kwargs.get('query')
+        if scope is None or scope.search is None or not search_query:
+            return super()._run(**kwargs)
+
+        cache = scope.search
+        search_type = kwargs.get('search_type', self.search_type)
+        now = time.time()
+        key = search_cache_key(search_query, scope.language, search_type, now=now)
+        extra = {"query": normalize_query(search_query), "language": scope.language, "searchType": search_type}
+
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Search cache hit", extra=extra)
+            return cached
+
+        results = super()._run(**kwargs)
+        # Empty results are not cached so the next job searches again
+        if results.get('news') or results.get('organic'):
+            cache.put(key, results, search_bucket_ttl(now))
+        logger.info("Search cache miss", extra=extra)
+        return results
+
+
+class BatchScrapeWebsiteToolSchema(BaseModel):
+    """Input for BatchScrapeWebsiteTool."""
+
+    website_urls: list[str] = Field(
+        ..., description="All website URLs to read, fetched together in one call"
+    )
+
+
+class BatchScrapeWebsiteTool(ScrapeWebsiteTool):
+    """Scrape several pages concurrently in one tool call.
+
+    Keeps ScrapeWebsiteTool's browser headers and text extraction; pages
+    go through the job's scrape cache (see adapter.external.page_fetcher).
+    """
+
+    name: str = "Read several websites' content"
+    description: str = (
+        "Reads the full text of several web pages at once. Pass every URL "
+        "you need in one call (website_urls); the pages are fetched in parallel."
+    )
+    args_schema: type[BaseModel] = BatchScrapeWebsiteToolSchema
+
+    def _run(self, **kwargs: Any) -> Any:
+        urls = kwargs.get("website_urls") or []
+        if isinstance(urls, str):
+            urls = [urls]
+        if not urls:
+            raise ValueError("website_urls must list at least one URL.")
+
+        scope = _scope.get()
+        pages = asyncio.run(fetch_pages(
+            urls[:MAX_BATCH_URLS],
+            headers=self.headers,
+            cookies=self.cookies,
+            cache=scope.scrape if scope else None,
+        ))
+        return format_pages(pages)
@@ -1,9 +1,10 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool
 
 from adapter.crew.models import NewsArticleList, SelectedArticle, ReviewedArticle
+from adapter.crew.cached_tools import BatchScrapeWebsiteTool, CachedSerperDevTool
 from adapter.crew.guardrails import repair_json_output
+from adapter.crew.progress_listener import after_task
 
 
 @CrewBase
@@ -29,7 +30,7 @@ class ReadingMaterialCreator():
     def article_finder(self) -> Agent:
         return Agent(
             config=self.agents_config['article_finder'],
-            tools=[SerperDevTool(search_type="news"), ScrapeWebsiteTool()]
+            tools=[CachedSerperDevTool(search_type="news"), BatchScrapeWebsiteTool()]
         )
 
     @agent
@@ -82,4 +83,6 @@ class ReadingMaterialCreator():
             tasks=self.tasks,
             process=Process.sequential,
             verbose=True,
+            # Checkpoints each task; aborts between tasks once the job is cancelled
+            task_callback=after_task,
         )
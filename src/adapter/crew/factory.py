@@ -0,0 +1,84 @@
+"""Per-process crew template with cheap per-job copies.
+
+Building ReadingMaterialCreator() parses agents.yaml/tasks.yaml and
+instantiates every agent with its LLM client and tools; .crew() then wires
+them into a Crew. None of that depends on the job, so CrewFactory does it
+once per process and hands each job template.copy(): new Agent and Task
+objects (prompts are interpolated per kickoff, task outputs and executor
+state stay per job, so concurrent jobs never share them) that reuse the
+tool instances and each LLM's HTTP client.
+
+Crew.copy() only shallow-copies an agent's LLM, so the copy would keep
+adding to the template's token counters. create() gives every copy its
+own zeroed counters, so CrewResult.get_agent_usage() reports one job.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _reset_token_usage(llm) -> None:
+    """Give a shallow-copied LLM its own zeroed token counters."""
+    usage = getattr(llm, '_token_usage', None)
+    if isinstance(usage, dict):
+        llm._token_usage = dict.fromkeys(usage, 0)
+
+
+def resumable_prefix(tasks, checkpoints: dict[str, dict]) -> int:
+    """Number of leading tasks that can be restored from checkpoints.
+
+    Stops at the first task without one. The last task always runs, so a
+    resumed crew still produces the final (structured) result.
+    """
+    done = 0
+    for task in tasks[:-1]:
+        if getattr(task, 'name', None) not in checkpoints:
+            break
+        done += 1
+    return done
+
+
+class CrewFactory:
+    """Build the crew definition once, then produce per-job crews."""
+
+    def __init__(self, creator_cls):
+        self._creator_cls = creator_cls
+        self._lock = threading.Lock()
+        self._template = None
+        self._role_keys: dict[str, str] = {}
+
+    def _get_template(self):
+        if self._template is None:
+            with self._lock:
+                if self._template is None:
+                    started = time.perf_counter()
+                    creator = self._creator_cls()
+                    self._role_keys = creator.get_role_to_key_map()
+                    self._template = creator.crew()
+                    logger.info(
+                        "Crew template built",
+                        extra={"buildMs": round((time.perf_counter() - started) * 1000, 1)},
+                    )
+        return self._template
+
+    def role_to_key_map(self) -> dict[str, str]:
+        """Agent role -> agent key (e.g. 'News article finder...' -> 'article_finder')."""
+        self._get_template()
+        return self._role_keys
+
+    def create(self):
+        """Return a fresh crew for one job."""
+        crew = self._get_template().copy()
+        for agent in crew.agents:
+            llm = getattr(agent, 'llm', None)
+            if llm is not None:
+                _reset_token_usage(llm)
+        return crew
+
+    def create_uncached(self):
+        """Build a crew from scratch (parse config, new clients); for benchmarks."""
+        return self._creator_cls().crew()
+
@@ -1,8 +1,17 @@
 #!/usr/bin/env python
 import warnings
 import logging
+import time
+
+from crewai import Crew
+from crewai.tasks.output_format import OutputFormat
+from crewai.tasks.task_output import TaskOutput
+from json_repair import repair_json
 
 from adapter.crew.crew import ReadingMaterialCreator
+from adapter.crew.factory import CrewFactory, resumable_prefix
+from adapter.crew.models import NewsArticleList
+from adapter.crew import readability
 from utils.logging import setup_structured_logging
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -15,8 +24,9 @@ def _format_agent_key(key: str) -> str:
     return key.replace('_', ' ').title()
 
 
-# Load role->key mapping once at module level
-_AGENT_KEYS = ReadingMaterialCreator().get_role_to_key_map()
+# Config, agents, LLM clients and tools are built once per process;
+# each job runs a copy (see adapter.crew.factory)
+_CREW_FACTORY = CrewFactory(ReadingMaterialCreator)
 
 
 class CrewResult:
@@ -46,7 +56,7 @@ class CrewResult:
 
             model = getattr(agent.llm, 'model', 'unknown')
             agent_role = getattr(agent, 'role', 'unknown')
-            agent_key = _AGENT_KEYS.get(agent_role.strip())
+            agent_key = _CREW_FACTORY.role_to_key_map().get(agent_role.strip())
             agent_name = _format_agent_key(agent_key) if agent_key else getattr(agent, 'name', None)
 
             usage = agent.llm.get_token_usage_summary()
@@ -62,11 +72,89 @@ class CrewResult:
         return usage_list
 
 
-def run(inputs):
+PICKER_TASK = 'pick_best_article'
+
+
+def _restore(tasks, checkpoints: dict[str, dict]) -> int:
+    """Set checkpointed outputs on the leading tasks; returns how many were restored.
+
+    Restored tasks are not rerun, and later tasks still get their outputs
+    as context.
+    """
+    done = resumable_prefix(tasks, checkpoints)
+    for task in tasks[:done]:
+        saved = checkpoints[task.name]
+        task.output = TaskOutput(
+            description=task.description,
+            name=task.name,
+            raw=saved.get('raw', ''),
+            agent=saved.get('agent') or task.agent.role,
+        )
+    if done:
+        logger.info("Resuming crew from checkpoint", extra={"skippedTasks": [task.name for task in tasks[:done]]})
+    return done
+
+
+def _crew_for(crew_instance, tasks):
+    """A crew that runs only the given tasks of crew_instance."""
+    agents = []
+    for task in tasks:
+        if task.agent not in agents:
+            agents.append(task.agent)
+    return Crew(
+        agents=agents,
+        tasks=tasks,
+        process=crew_instance.process,
+        verbose=crew_instance.verbose,
+        task_callback=crew_instance.task_callback,
+    )
+
+
+def _candidates(output) -> list:
+    """The finder's articles from its task output (live or restored from a checkpoint)."""
+    if output is None:
+        return []
+    if isinstance(output.pydantic, NewsArticleList):
+        return output.pydantic.articles
+    try:
+        return NewsArticleList.model_validate_json(repair_json(output.raw or '')).articles
+    except ValueError:
+        return []
+
+
+def _pick_locally(crew_instance, finder, picker, inputs) -> bool:
+    """Complete the picker task from the local scorer when one candidate clearly wins.
+
+    The output is checkpointed through the crew's task_callback like an
+    agent's, so a retry does not pick again.
+    """
+    selected = readability.pick_article(_candidates(finder.output), inputs)
+    if selected is None:
+        return False
+    picker.output = TaskOutput(
+        description=picker.description,
+        name=picker.name,
+        raw=selected.model_dump_json(),
+        pydantic=selected,
+        agent=picker.agent.role,
+        output_format=OutputFormat.PYDANTIC,
+    )
+    if crew_instance.task_callback:
+        crew_instance.task_callback(picker.output)
+    return True
+
+
+def run(inputs, checkpoints: dict[str, dict] | None = None):
     """Run the reading material creator crew.
 
+    Tasks up to the finder run first; when the local scorer
+    (adapter.crew.readability) finds a clear winner among its candidates,
+    the picker agent is skipped and the rest of the crew runs on that pick.
+
     Args:
         inputs: Dictionary with language, level, length, topic, vocabulary_list
+        checkpoints: Saved task outputs (task name -> {'raw', 'agent'}) from an
+            earlier attempt of the same job; those tasks are not rerun
 
     Returns:
         CrewResult: Result container with raw output and agent usage metrics
@@ -74,8 +162,22 @@ def run(inputs):
     try:
         logger.info("Starting crew execution...")
 
-        crew_instance = ReadingMaterialCreator().crew()
-        result = crew_instance.kickoff(inputs=inputs)
+        started = time.perf_counter()
+        crew_instance = _CREW_FACTORY.create()
+        tasks = crew_instance.tasks
+        done = _restore(tasks, checkpoints or {})
+        logger.info("Crew ready", extra={"crewBuildMs": round((time.perf_counter() - started) * 1000, 1)})
+
+        picker_at = next((i for i, task in enumerate(tasks) if task.name == PICKER_TASK), 0)
+        if 0 < picker_at and done <= picker_at and readability.PICKER_TIE_MARGIN < 1:
+            if done < picker_at:
+                _crew_for(crew_instance, tasks[done:picker_at]).kickoff(inputs=inputs)
+                done = picker_at
+            if _pick_locally(crew_instance, tasks[picker_at - 1], tasks[picker_at], inputs):
+                done = picker_at + 1
+
+        crew = _crew_for(crew_instance, tasks[done:]) if done else crew_instance
+        result = crew.kickoff(inputs=inputs)
 
         logger.info("=== READING MATERIAL CREATED ===")
 
@@ -2,12 +2,33 @@
 
 This module implements a custom event listener that monitors CrewAI task execution
 and updates job status in real-time via JobQueuePort (no direct Redis dependency).
+
+The CrewAI event bus is process-global, and scoped_handlers() swaps the
+handler table for the whole process, so it cannot isolate jobs that run
+concurrently on worker threads. Instead one _ProgressRouter is registered
+per process and forwards each event to the JobProgressListener bound to
+the current context (track_job_progress()). The bus runs sync handlers
+in a copy of the emitting context, so events from one job's crew reach
+only that job's listener.
+
+Checkpoints and cancellation: bus handlers run on the bus's thread pool,
+so raising there cannot stop a crew. after_task() is installed as the
+crew's task_callback instead, which runs on the crew's own thread after
+every task. It saves the task's output as a checkpoint (so a retried job
+resumes after it, see adapter.crew.main) and, once the job's cancel flag
+is set, raises JobCancelledError so the remaining tasks never start. The listener also stops publishing
+progress for a cancelled job so it cannot overwrite the 'cancelled' status.
 """
 
+import contextvars
 import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from crewai.events.base_event_listener import BaseEventListener
+from domain.model.errors import JobCancelledError
 from crewai.events.types.task_events import (
     TaskStartedEvent,
     TaskCompletedEvent,
@@ -30,11 +51,73 @@ TASK_PROGRESS = {
 }
 
 
-class JobProgressListener(BaseEventListener):
-    """Event listener for tracking CrewAI task progress.
+_current_listener: contextvars.ContextVar['JobProgressListener | None'] = contextvars.ContextVar(
+    'job_progress_listener', default=None,
+)
+_router: 'BaseEventListener | None' = None
+_router_lock = threading.Lock()
+
+
+class _ProgressRouter(BaseEventListener):
+    """Process-wide listener that forwards task events to the current job's listener."""
+
+    def setup_listeners(self, crewai_event_bus: 'CrewAIEventsBus') -> None:
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event: TaskStartedEvent):
+            listener = _current_listener.get()
+            if listener:
+                listener.on_task_started(event)
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event: TaskCompletedEvent):
+            listener = _current_listener.get()
+            if listener:
+                listener.on_task_completed(event)
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event: TaskFailedEvent):
+            listener = _current_listener.get()
+            if listener:
+                listener.on_task_failed(event)
+
+
+def _ensure_router() -> None:
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = _ProgressRouter()
+
+
+def after_task(output=None) -> None:
+    """Crew task_callback: checkpoint the finished task, then abort if the job was cancelled."""
+    listener = _current_listener.get()
+    if not listener:
+        return
+    if output is not None:
+        listener.save_checkpoint(output)
+    if listener.check_cancelled():
+        logger.info("Job cancelled, aborting crew", extra={"jobId": listener.job_id})
+        raise JobCancelledError(listener.job_id)
+
+
+@contextmanager
+def track_job_progress(job_id: str, article_id: str, job_queue: 'JobQueuePort') -> Iterator['JobProgressListener']:
+    """Route CrewAI task events emitted in this context to a new JobProgressListener."""
+    _ensure_router()
+    listener = JobProgressListener(job_id, article_id, job_queue)
+    token = _current_listener.set(listener)
+    try:
+        yield listener
+    finally:
+        _current_listener.reset(token)
+
+
+class JobProgressListener:
+    """Tracks one job's CrewAI task progress.
 
     Uses JobQueuePort for status updates instead of importing Redis directly.
-    Must be used within crewai_event_bus.scoped_handlers() context.
+    Create via track_job_progress() so events are routed to it.
     """
 
     def __init__(self, job_id: str, article_id: str, job_queue: 'JobQueuePort'):
@@ -42,91 +125,110 @@ class JobProgressListener(BaseEventListener):
         self.article_id = article_id
         self.job_queue = job_queue
         self.task_failed = False
+        self.cancelled = False
 
         self.task_progress = TASK_PROGRESS
 
-        super().__init__()
-
         logger.info("JobProgressListener initialized", extra={"jobId": job_id, "articleId": article_id})
 
-    def setup_listeners(self, crewai_event_bus: 'CrewAIEventsBus') -> None:
-        """Setup event listeners on the CrewAI event bus."""
+    def check_cancelled(self) -> bool:
+        """True once the job's cancel flag is set (checked in the queue until then)."""
+        if not self.cancelled and self.job_queue.is_cancelled(self.job_id):
+            self.cancelled = True
+        return self.cancelled
+
+    def save_checkpoint(self, output) -> None:
+        """Persist a finished task's output (a crewai TaskOutput) for resuming."""
+        task_name = getattr(output, 'name', None)
+        if not task_name:
+            return
+        saved = self.job_queue.save_checkpoint(
+            self.job_id,
+            task_name,
+            {'raw': output.raw, 'agent': output.agent},
+        )
+        if saved:
+            logger.debug("Task checkpoint saved", extra={"jobId": self.job_id, "task": task_name})
+
+    def on_task_started(self, event: TaskStartedEvent) -> None:
+        if self.check_cancelled():
+            return
+        task_name = event.task.name if event.task else None
+
+        if task_name and task_name in self.task_progress:
+            info = self.task_progress[task_name]
 
-        @crewai_event_bus.on(TaskStartedEvent)
-        def on_task_started(source, event: TaskStartedEvent):
-            task_name = event.task.name if event.task else None
-
-            if task_name and task_name in self.task_progress:
-                info = self.task_progress[task_name]
-
-                self.job_queue.update_status(
-                    job_id=self.job_id,
-                    status='running',
-                    progress=info['start'],
-                    message=f"Starting: {info['label']}",
-                    article_id=self.article_id,
-                )
-
-                logger.info(
-                    f"[EVENT] Task started: {task_name} "
-                    f"({info['start']}% - {info['label']})"
-                )
-            else:
-                task_desc = event.task.description if event.task else None
-                desc_preview = task_desc[:50] if task_desc else 'None'
-                logger.warning(
-                    f"[EVENT] Unknown task started. Name: '{task_name}', "
-                    f"Description: '{desc_preview}...' (truncated)"
-                )
-
-        @crewai_event_bus.on(TaskCompletedEvent)
-        def on_task_completed(source, event: TaskCompletedEvent):
-            task_name = event.task.name if event.task else None
-
-            if task_name and task_name in self.task_progress:
-                info = self.task_progress[task_name]
-
-                self.job_queue.update_status(
-                    job_id=self.job_id,
-                    status='running',
-                    progress=info['end'],
-                    message=f"Completed: {info['label']}",
-                    article_id=self.article_id,
-                )
-
-                logger.info(
-                    f"[EVENT] Task completed: {task_name} "
-                    f"({info['end']}% - {info['label']})"
-                )
-            else:
-                task_desc = event.task.description if event.task else None
-                desc_preview = task_desc[:50] if task_desc else 'None'
-                logger.warning(
-                    f"[EVENT] Unknown task completed. Name: '{task_name}', "
-                    f"Description: '{desc_preview}...' (truncated)"
-                )
-
-        @crewai_event_bus.on(TaskFailedEvent)
-        def on_task_failed(source, event: TaskFailedEvent):
-            task_name = event.task.name if event.task else None
-            task_label = self.task_progress.get(task_name, {}).get('label', task_name) if task_name else 'Unknown task'
-            error_msg = event.error if hasattr(event, 'error') else 'Unknown error'
-
-            self.task_failed = True
+            self.job_queue.update_status(
+                job_id=self.job_id,
+                status='running',
+                progress=info['start'],
+                message=f"Starting: {info['label']}",
+                article_id=self.article_id,
+            )
 
-            logger.error(
-                f"[EVENT] Task failed: {task_name} ({task_label}) - Error: {error_msg}"
+            logger.info(
+                f"[EVENT] Task started: {task_name} "
+                f"({info['start']}% - {info['label']})"
             )
+        else:
+            task_desc = event.task.description if event.task else None
+            desc_preview = task_desc[:50] if task_desc else 'None'
+            logger.warning(
+                f"[EVENT] Unknown task started. Name: '{task_name}', "
+                f"Description: '{desc_preview}...' (truncated)"
+            )
+
+    def on_task_completed(self, event: TaskCompletedEvent) -> None:
+        if self.check_cancelled():
+            return
+        task_name = event.task.name if event.task else None
 
-            current_progress = 0
-            if task_name and task_name in self.task_progress:
-                current_progress = self.task_progress[task_name]['start']
+        if task_name and task_name in self.task_progress:
+            info = self.task_progress[task_name]
 
             self.job_queue.update_status(
                 job_id=self.job_id,
-                status='failed',
-                progress=current_progress,
-                message=f"Task failed: {task_label}",
-                error=str(error_msg)[:200],
+                status='running',
+                progress=info['end'],
+                message=f"Completed: {info['label']}",
                 article_id=self.article_id,
             )
+
+            logger.info(
+                f"[EVENT] Task completed: {task_name} "
+                f"({info['end']}% - {info['label']})"
+            )
+        else:
+            task_desc = event.task.description if event.task else None
+            desc_preview = task_desc[:50] if task_desc else 'None'
+            logger.warning(
+                f"[EVENT] Unknown task completed. Name: '{task_name}', "
+                f"Description: '{desc_preview}...' (truncated)"
+            )
+
+    def on_task_failed(self, event: TaskFailedEvent) -> None:
+        if self.cancelled:
+            # Raised by after_task(); the worker records the cancellation
+            return
+        task_name = event.task.name if event.task else None
+        task_label = self.task_progress.get(task_name, {}).get('label', task_name) if task_name else 'Unknown task'
+        error_msg = event.error if hasattr(event, 'error') else 'Unknown error'
+
+        self.task_failed = True
+
+        logger.error(
+            f"[EVENT] Task failed: {task_name} ({task_label}) - Error: {error_msg}"
+        )
+
+        current_progress = 0
+        if task_name and task_name in self.task_progress:
+            current_progress = self.task_progress[task_name]['start']
+
+        self.job_queue.update_status(
+            job_id=self.job_id,
+            status='failed',
+            progress=current_progress,
+            message=f"Task failed: {task_label}",
+            error=str(error_msg)[:200],
+            article_id=self.article_id,
+        )
@@ -0,0 +1,183 @@
+"""Deterministic scoring of the finder's candidates (no LLM).
+
+pick_best_article ranks 3-5 candidates by topic, CEFR difficulty and
+length. score_candidates() computes those criteria locally, one feature
+column across all candidates at a time:
+
+- topic: share of the topic's keywords found in the title and the body
+  (matched on a 5-character prefix, so inflected forms still count)
+- difficulty: mean sentence length combined with the share of words
+  outside the language's frequent-word list (config/frequent_words.yaml);
+  languages without a list use mean word length instead. The estimate
+  (0.0 easy - 1.0 hard) is compared with the level's place on A1-C2.
+- length: word count against the requested length, on a log scale
+
+pick_article() returns the top candidate as a SelectedArticle when it
+leads the runner-up by more than ARTICLE_PICKER_TIE_MARGIN, and None when
+the call is close or no candidate matches any topic keyword (e.g. a topic
+written in another language than the articles); adapter.crew.main then
+lets the picker agent decide. A margin of 1 or more always uses the agent.
+"""
+
+import logging
+import math
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+from adapter.crew.models import NewsArticle, SelectedArticle
+from domain.model.cefr import CEFRLevel
+
+logger = logging.getLogger(__name__)
+
+PICKER_TIE_MARGIN = float(os.getenv('ARTICLE_PICKER_TIE_MARGIN', '0.05'))
+
+FREQUENT_WORDS_PATH = Path(__file__).parent / 'config' / 'frequent_words.yaml'
+
+# Priority order of the picker's criteria
+WEIGHTS = {'topic': 0.5, 'difficulty': 0.3, 'length': 0.2}
+
+_WORD_RE = re.compile(r"[^\W\d_]+(?:['’-][^\W\d_]+)*")
+_SENTENCE_RE = re.compile(r'[.!?。！？]+(?:\s|$)')
+_STEM = 5
+
+
+@dataclass(frozen=True)
+class CandidateScore:
+    """One candidate's criteria fits (0.0-1.0) and weighted total."""
+    index: int
+    total: float
+    topic: float
+    difficulty: float
+    length: float
+    words: int
+
+
+@lru_cache(maxsize=1)
+def _frequent_words() -> dict[str, frozenset[str]]:
+    with open(FREQUENT_WORDS_PATH, encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return {language.lower(): frozenset(words.split()) for language, words in config.items()}
+
+
+def _words(text: str) -> list[str]:
+    return [w.lower() for w in _WORD_RE.findall(text or '')]
+
+
+def _stems(words) -> set[str]:
+    return {w[:_STEM] for w in words}
+
+
+def _clip(value: float) -> float:
+    return min(1.0, max(0.0, value))
+
+
+def topic_keywords(topic: str) -> list[str]:
+    """Topic words that carry meaning (no frequent words in any listed language)."""
+    common = frozenset().union(*_frequent_words().values())
+    return [w for w in dict.fromkeys(_words(topic)) if len(w) >= 3 and w not in common]
+
+
+def difficulty(text: str, language: str) -> float:
+    """Estimated reading difficulty, 0.0 (easy) - 1.0 (hard)."""
+    words = _words(text)
+    if not words:
+        return 0.0
+    sentences = max(1, len(_SENTENCE_RE.findall(text.strip() + ' ')))
+    sentence_score = _clip((len(words) / sentences - 8) / 17)
+
+    frequent = _frequent_words().get(language.strip().lower())
+    if frequent:
+        rare = sum(w not in frequent for w in words) / len(words)
+        lexical_score = _clip((rare - 0.35) / 0.3)
+    else:
+        lexical_score = _clip((sum(map(len, words)) / len(words) - 4) / 4)
+    return (sentence_score + lexical_score) / 2
+
+
+def _level_target(level: str) -> float:
+    level = (level or '').strip().upper()
+    if level not in CEFRLevel.ALL:
+        return 0.5
+    return CEFRLevel.ALL.index(level) / (len(CEFRLevel.ALL) - 1)
+
+
+def _length_target(length) -> int | None:
+    try:
+        target = int(str(length).strip())
+    except ValueError:
+        return None
+    return target if target > 0 else None
+
+
+def score_candidates(articles: list[NewsArticle], inputs: dict) -> list[CandidateScore]:
+    """Score every candidate against the job inputs, best first."""
+    if not articles:
+        return []
+    keywords = topic_keywords(inputs.get('topic', ''))
+    bodies = [_words(a.content) for a in articles]
+
+    if keywords:
+        titles = [_stems(_words(a.title)) for a in articles]
+        contents = [_stems(body) for body in bodies]
+        topic = [
+            (0.6 * sum(k[:_STEM] in title for k in keywords) + 0.4 * sum(k[:_STEM] in content for k in keywords))
+            / len(keywords)
+            for title, content in zip(titles, contents)
+        ]
+    else:
+        topic = [0.0] * len(articles)
+
+    target_level = _level_target(inputs.get('level', ''))
+    language = inputs.get('language', '')
+    level_fit = [1 - abs(difficulty(a.content, language) - target_level) for a in articles]
+
+    target_words = _length_target(inputs.get('length'))
+    counts = [len(body) for body in bodies]
+    length_fit = [
+        _clip(1 - abs(math.log(max(count, 1) / target_words)) / math.log(4)) if target_words else 1.0
+        for count in counts
+    ]
+
+    scores = [
+        CandidateScore(
+            index=i,
+            total=WEIGHTS['topic'] * topic[i] + WEIGHTS['difficulty'] * level_fit[i] + WEIGHTS['length'] * length_fit[i],
+            topic=topic[i],
+            difficulty=level_fit[i],
+            length=length_fit[i],
+            words=counts[i],
+        )
+        for i in range(len(articles))
+    ]
+    return sorted(scores, key=lambda s: s.total, reverse=True)
+
+
+def pick_article(articles: list[NewsArticle], inputs: dict) -> SelectedArticle | None:
+    """The clear winner among the candidates, or None to let the picker agent decide."""
+    if PICKER_TIE_MARGIN >= 1 or not articles:
+        return None
+    scores = score_candidates(articles, inputs)
+    best = scores[0]
+    margin = best.total - scores[1].total if len(scores) > 1 else 1.0
+    extra = {"candidates": len(scores), "bestScore": round(best.total, 3), "margin": round(margin, 3)}
+
+    if best.topic <= 0 or margin <= PICKER_TIE_MARGIN:
+        logger.info("Local pick undecided, using picker agent", extra=extra)
+        return None
+
+    logger.info("Article picked locally", extra=extra)
+    # Authors were not checked against the source page, so drop them as the picker would
+    article = articles[best.index].model_copy(update={'author': None})
+    return SelectedArticle(
+        article=article,
+        selection_rationale=(
+            f"Selected locally: best match of {len(scores)} candidates "
+            f"(topic {best.topic:.2f}, level {best.difficulty:.2f}, length {best.length:.2f}; "
+            f"{best.words} words), ahead of the next by {margin:.2f}."
+        ),
+    )
@@ -0,0 +1,170 @@
+"""Concurrent page fetching and text extraction for the article finder.
+
+The finder used to scrape its 3-5 candidate URLs one tool call at a
+time, so the stage took the sum of all page fetch times. fetch_pages()
+downloads them concurrently with httpx (at most SCRAPE_CONCURRENCY at
+once, each bounded by SCRAPE_TIMEOUT_SECONDS), so a batch takes about
+as long as its slowest page.
+
+With a ScrapeCachePort, pages scraped within SCRAPE_CACHE_FRESH_SECONDS
+are served from the cache, older ones are revalidated with
+If-None-Match / If-Modified-Since, and only 200 responses are stored.
+Cache reads happen before and writes after the concurrent fetch, so the
+(sync) cache never blocks the event loop while pages are in flight.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+from bs4 import BeautifulSoup
+
+from adapter.cache.keys import scrape_cache_key
+
+if TYPE_CHECKING:
+    from port.scrape_cache import ScrapeCachePort
+
+logger = logging.getLogger(__name__)
+
+SCRAPE_CONCURRENCY = int(os.getenv('SCRAPE_CONCURRENCY', '5'))
+SCRAPE_TIMEOUT_SECONDS = float(os.getenv('SCRAPE_TIMEOUT_SECONDS', '15'))
+SCRAPE_CACHE_FRESH_SECONDS = int(os.getenv('SCRAPE_CACHE_FRESH_SECONDS', '3600'))
+
+
+@dataclass(frozen=True)
+class FetchedPage:
+    """One URL's outcome. source is 'cache', 'revalidated' (304) or 'network'."""
+    url: str
+    text: str | None
+    status: int | None = None
+    source: str = 'network'
+    error: str | None = None
+
+
+def extract_text(html: str) -> str:
+    """Same extraction as crewai_tools' ScrapeWebsiteTool."""
+    parsed = BeautifulSoup(html, "html.parser")
+
+    text = "The following text is scraped website content:\n\n"
+    text += parsed.get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    return re.sub("\\s+\n\\s+", "\n", text)
+
+
+def _conditional_headers(headers: dict, cached: dict | None) -> dict:
+    headers = dict(headers)
+    if cached:
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+    return headers
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    url: str,
+    headers: dict,
+    cached: dict | None,
+    timeout: float,
+) -> tuple[FetchedPage, httpx.Response | None]:
+    async with semaphore:
+        try:
+            response = await asyncio.wait_for(
+                client.get(url, headers=_conditional_headers(headers, cached)),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            return FetchedPage(url, None, error=f"timed out after {timeout:g}s"), None
+        except httpx.HTTPError as e:
+            return FetchedPage(url, None, error=f"{type(e).__name__}: {e}"), None
+
+    if response.status_code == 304 and cached:
+        return FetchedPage(url, cached['text'], 304, 'revalidated'), response
+    return FetchedPage(url, extract_text(response.text), response.status_code), response
+
+
+async def fetch_pages(
+    urls: list[str],
+    headers: dict | None = None,
+    cookies: dict | None = None,
+    cache: 'ScrapeCachePort | None' = None,
+    concurrency: int = SCRAPE_CONCURRENCY,
+    timeout: float = SCRAPE_TIMEOUT_SECONDS,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> list[FetchedPage]:
+    """Fetch and extract every URL concurrently; results keep the input order.
+
+    Duplicate URLs (same canonical form) are fetched once. A failed page
+    is returned with error set instead of raising.
+    """
+    started = time.perf_counter()
+    keys = {}
+    for url in urls:
+        keys.setdefault(scrape_cache_key(url), url)
+
+    results: dict[str, FetchedPage] = {}
+    cached_pages: dict[str, dict | None] = {}
+    for key, url in keys.items():
+        cached = cache.get(key, SCRAPE_CACHE_FRESH_SECONDS) if cache else None
+        if cached and cached['fresh']:
+            results[key] = FetchedPage(url, cached['text'], source='cache')
+        else:
+            cached_pages[key] = cached
+
+    if cached_pages:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        async with httpx.AsyncClient(
+            cookies=cookies or {},
+            follow_redirects=True,
+            timeout=timeout,
+            transport=transport,
+        ) as client:
+            fetched = await asyncio.gather(*(
+                _fetch(client, semaphore, keys[key], headers or {}, cached, timeout)
+                for key, cached in cached_pages.items()
+            ))
+
+        for key, (page, response) in zip(cached_pages, fetched):
+            results[key] = page
+            if not cache or response is None:
+                continue
+            if page.source == 'revalidated':
+                cache.revalidated(key)
+            # Error pages are returned to the agent but never cached
+            elif page.status == 200:
+                cache.put(
+                    key,
+                    page.text,
+                    etag=response.headers.get('ETag', ''),
+                    last_modified=response.headers.get('Last-Modified', ''),
+                )
+
+    pages = [results[key] for key in keys]
+    logger.info("Pages fetched", extra={
+        "count": len(pages),
+        "fromCache": sum(page.source != 'network' for page in pages),
+        "failed": sum(page.error is not None for page in pages),
+        "elapsedMs": round((time.perf_counter() - started) * 1000, 1),
+    })
+    return pages
+
+
+def format_pages(pages: list[FetchedPage]) -> str:
+    """Render a batch as one tool result, one section per URL."""
+    sections = []
+    for i, page in enumerate(pages, 1):
+        if page.error:
+            body = f"ERROR: could not fetch this page ({page.error})"
+        elif page.status and page.status >= 400:
+            body = f"ERROR: HTTP {page.status}\n{page.text}"
+        else:
+            body = page.text
+        sections.append(f"=== [{i}] {page.url} ===\n{body}")
+    return "\n\n".join(sections)
@@ -1,5 +1,6 @@
 """In-memory implementation of ArticleRepository for testing."""
 
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 
 from domain.model.article import Article, ArticleInputs, ArticleStatus, Articles
@@ -15,6 +16,11 @@ class FakeArticleRepository:
         self.store[article.id] = article
         return True
 
+    def save_many(self, articles: list[Article]) -> set[str]:
+        for article in articles:
+            self.store[article.id] = article
+        return {article.id for article in articles}
+
     def update_status(self, article_id: str, status: ArticleStatus) -> bool:
         article = self.store.get(article_id)
         if not article:
@@ -76,3 +82,60 @@ class FakeArticleRepository:
             if article.inputs == inputs and cutoff <= article.created_at and user_id == article.user_id:
                 return article
         return None
+
+    def find_duplicates(
+        self,
+        inputs: list[ArticleInputs],
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> dict[ArticleInputs, Article]:
+        duplicates = {}
+        for i in inputs:
+            article = self.find_duplicate(i, user_id, hours)
+            if article:
+                duplicates[i] = article
+        return duplicates
+
+    def find_completed(
+        self,
+        inputs: ArticleInputs,
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> list[Article]:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        return sorted(
+            (
+                a for a in self.store.values()
+                if a.inputs == inputs and a.user_id == user_id
+                and a.status == ArticleStatus.COMPLETED and cutoff <= a.created_at
+            ),
+            key=lambda a: a.created_at,
+            reverse=True,
+        )
+
+    def find_reusable(
+        self,
+        inputs: ArticleInputs,
+        hours: int = 24,
+        exclude_user_id: str | None = None,
+    ) -> Article | None:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        matches = [
+            a for a in self.store.values()
+            if a.inputs.fingerprint == inputs.fingerprint and a.status == ArticleStatus.COMPLETED
+            and cutoff <= a.created_at and (exclude_user_id is None or a.user_id != exclude_user_id)
+        ]
+        return max(matches, key=lambda a: a.created_at, default=None)
+
+    def count_by_inputs(
+        self,
+        hours: int = 168,
+        limit: int = 20,
+        exclude_user_id: str | None = None,
+    ) -> list[tuple[ArticleInputs, int]]:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        counts = Counter(
+            a.inputs for a in self.store.values()
+            if cutoff <= a.created_at and (exclude_user_id is None or a.user_id != exclude_user_id)
+        )
+        return counts.most_common(limit)
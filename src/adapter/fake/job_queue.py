@@ -1,31 +1,84 @@
-"""In-memory implementation of JobQueuePort for testing."""
+"""In-memory implementations of JobQueuePort and AsyncJobQueuePort for testing."""
 
+import threading
+import time
 from collections import deque
 from datetime import datetime, timezone
 
-from domain.model.article import Article
-from domain.model.job import JobContext
+from adapter.queue.lanes import LANES, lane_for
+from domain.model.article import Article, ArticleInputs
+from domain.model.job import TERMINAL_JOB_STATUSES, JobContext
+from domain.model.schedule import Schedule
 
 
 class FakeJobQueueAdapter:
-    def __init__(self):
+    def __init__(self, max_attempts: int = 3):
         self.queue: deque[JobContext] = deque()
         self.statuses: dict[str, dict] = {}
+        self.events: dict[str, list[tuple[str, dict]]] = {}
+        self.max_attempts = max_attempts
+        self.processing: dict[str, JobContext] = {}
+        self.stalled: set[str] = set()
+        self.dead_letter: list[JobContext] = []
+        self.heartbeats: dict[str, int] = {}
+        self.lanes: dict[str, str] = {}
+        self.schedules: dict[str, Schedule] = {}
+        self.next_runs: dict[str, datetime] = {}
+        self.worker_heartbeats: list[tuple[int, list[str]]] = []
+        self.processing_times: list[tuple[float, str]] = []
+        self.cancelled: set[str] = set()
+        self.checkpoints: dict[str, dict[str, dict]] = {}
+        self.inflight: dict[str, str] = {}  # inputs fingerprint -> job_id
+        self.followers: dict[str, list[dict]] = {}
+        self.claims: dict[str, float] = {}  # periodic task name -> claim expiry (monotonic)
+        self._claims_lock = threading.Lock()
 
-    def enqueue(self, article: Article) -> bool:
+    def enqueue(self, article: Article, priority: str | None = None) -> bool:
+        self.lanes[article.job_id] = lane_for(priority)
         self.queue.append(JobContext(
             job_id=article.job_id,
             article_id=article.id,
             user_id=article.user_id,
             inputs=article.inputs,
+            created_at=article.created_at,
         ))
         return True
 
-    def dequeue(self, timeout: int = 1) -> JobContext | None:
-        if self.queue:
-            return self.queue.popleft()
+    def dequeue(self, timeout: float = 1) -> JobContext | None:
+        """Pop the oldest job of the highest non-empty lane (no per-user round-robin)."""
+        for lane in LANES:
+            for ctx in self.queue:
+                if self.lanes.get(ctx.job_id, lane) == lane:
+                    self.queue.remove(ctx)
+                    self.processing[ctx.job_id] = ctx
+                    return ctx
         return None
 
+    def heartbeat(self, job_id: str) -> bool:
+        self.heartbeats[job_id] = self.heartbeats.get(job_id, 0) + 1
+        return True
+
+    def ack(self, job_id: str) -> bool:
+        return self.processing.pop(job_id, None) is not None
+
+    def recover_stalled(self) -> list[JobContext]:
+        """Requeue jobs marked in self.stalled (simulated expired heartbeats)."""
+        dead = []
+        for job_id in list(self.stalled):
+            ctx = self.processing.pop(job_id, None)
+            self.stalled.discard(job_id)
+            if ctx is None:
+                continue
+            ctx.attempts += 1
+            if ctx.attempts >= self.max_attempts:
+                self.dead_letter.append(ctx)
+                self.update_status(job_id, 'failed', 0, 'Job failed after repeated worker interruptions')
+                dead.append(ctx)
+            else:
+                self.queue.appendleft(ctx)
+                self.update_status(job_id, 'queued', 0, 'Worker interrupted, job requeued')
+        return dead
+
     def get_status(self, job_id: str) -> dict | None:
         return self.statuses.get(job_id)
 
@@ -38,6 +91,23 @@ class FakeJobQueueAdapter:
         error: str | None = None,
         article_id: str | None = None,
     ) -> bool:
+        self._set_status(job_id, status, progress, message, error, article_id)
+        if status in TERMINAL_JOB_STATUSES:
+            return True
+        for follower in self.followers.get(job_id, []):
+            if self.statuses.get(follower['job_id'], {}).get('status') != 'cancelled':
+                self._set_status(follower['job_id'], status, progress, message, error, follower['article_id'])
+        return True
+
+    def _set_status(
+        self,
+        job_id: str,
+        status: str,
+        progress: int,
+        message: str,
+        error: str | None,
+        article_id: str | None,
+    ) -> None:
         existing = self.statuses.get(job_id, {})
 
         final_article_id = article_id if article_id is not None else existing.get('article_id')
@@ -59,10 +129,56 @@ class FakeJobQueueAdapter:
             'article_id': final_article_id,
             'created_at': final_created_at,
         }
+        events = self.events.setdefault(job_id, [])
+        events.append((f'{len(events) + 1}-0', dict(self.statuses[job_id])))
+
+    def join_inflight(self, article: Article, attach: bool = False) -> str | None:
+        leader = self.inflight.get(article.inputs.fingerprint)
+        if leader and leader != article.job_id and self.statuses.get(leader, {}).get('status') in ('queued', 'running'):
+            if not attach:
+                return None
+            self.followers.setdefault(leader, []).append(
+                {'job_id': article.job_id, 'article_id': article.id, 'user_id': article.user_id},
+            )
+            return leader
+        self.inflight[article.inputs.fingerprint] = article.job_id
+        return None
+
+    def close_inflight(self, job_id: str, inputs: ArticleInputs) -> list[dict]:
+        if self.inflight.get(inputs.fingerprint) == job_id:
+            del self.inflight[inputs.fingerprint]
+        return self.followers.pop(job_id, [])
+
+    def cancel(
+        self,
+        job_id: str,
+        article_id: str | None = None,
+        message: str = 'Job cancelled',
+        user_id: str | None = None,
+    ) -> bool:
+        self.cancelled.add(job_id)
+        # In place: FakeAsyncJobQueueAdapter shares this deque
+        remaining = [ctx for ctx in self.queue if ctx.job_id != job_id]
+        self.queue.clear()
+        self.queue.extend(remaining)
+        return self.update_status(job_id, 'cancelled', 0, message, article_id=article_id)
+
+    def is_cancelled(self, job_id: str) -> bool:
+        return job_id in self.cancelled
+
+    def save_checkpoint(self, job_id: str, task_name: str, output: dict) -> bool:
+        self.checkpoints.setdefault(job_id, {})[task_name] = dict(output)
+        return True
+
+    def load_checkpoints(self, job_id: str) -> dict[str, dict]:
+        return dict(self.checkpoints.get(job_id, {}))
+
+    def clear_checkpoints(self, job_id: str) -> bool:
+        self.checkpoints.pop(job_id, None)
         return True
 
     def get_stats(self) -> dict | None:
-        stats = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'total': 0}
+        stats = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'total': 0}
         for s in self.statuses.values():
             status = s.get('status', 'unknown')
             if status in stats:
@@ -70,5 +186,180 @@ class FakeJobQueueAdapter:
             stats['total'] += 1
         return stats
 
+    def get_lane_stats(self) -> dict | None:
+        stats = {lane: {'depth': 0} for lane in LANES}
+        for ctx in self.queue:
+            stats[self.lanes.get(ctx.job_id, lane_for(None))]['depth'] += 1
+        return stats
+
+    def publish_worker_heartbeat(self, concurrency: int, in_flight: list[str]) -> bool:
+        self.worker_heartbeats.append((concurrency, list(in_flight)))
+        return True
+
+    def record_processing_time(self, seconds: float, status: str) -> bool:
+        self.processing_times.append((seconds, status))
+        return True
+
+    def get_queue_metrics(self) -> dict | None:
+        concurrency, in_flight = self.worker_heartbeats[-1] if self.worker_heartbeats else (0, [])
+        times = [seconds for seconds, _ in self.processing_times]
+        return {
+            'depth': len(self.queue),
+            'oldest_age_seconds': 0.0,
+            'lanes': {lane: {'depth': s['depth'], 'oldest_age_seconds': 0.0} for lane, s in self.get_lane_stats().items()},
+            'workers': 1 if self.worker_heartbeats else 0,
+            'slots': concurrency,
+            'in_flight': len(in_flight),
+            'worker_details': [],
+            'processing_time': {
+                'count': len(times),
+                'avg_seconds': round(sum(times) / len(times), 1) if times else None,
+            },
+        }
+
+    def claim_periodic(self, name: str, seconds: int) -> bool:
+        with self._claims_lock:
+            now = time.monotonic()
+            if self.claims.get(name, 0.0) > now:
+                return False
+            self.claims[name] = now + seconds
+            return True
+
+    def claim_due_schedules(self, limit: int = 100) -> list[Schedule]:
+        now = datetime.now(timezone.utc)
+        claimed = []
+        for schedule_id, run_at in sorted(self.next_runs.items(), key=lambda item: item[1]):
+            if run_at > now or len(claimed) >= limit:
+                break
+            schedule = self.schedules[schedule_id]
+            claimed.append(schedule)
+            if schedule.repeat_daily:
+                self.next_runs[schedule_id] = schedule.next_run(now)
+            else:
+                del self.next_runs[schedule_id]
+                del self.schedules[schedule_id]
+        return claimed
+
+    def release_schedule(self, schedule: Schedule) -> bool:
+        if schedule.repeat_daily and schedule.id not in self.schedules:
+            return True
+        self.schedules[schedule.id] = schedule
+        self.next_runs[schedule.id] = schedule.last_run()
+        return True
+
     def ping(self) -> bool:
         return True
+
+
+class FakeAsyncJobQueueAdapter:
+    """Async view over a FakeJobQueueAdapter (shares its queue and statuses)."""
+
+    def __init__(self, inner: FakeJobQueueAdapter | None = None):
+        self.inner = inner or FakeJobQueueAdapter()
+        self.queue = self.inner.queue
+        self.statuses = self.inner.statuses
+        self.events = self.inner.events
+        self.schedules = self.inner.schedules
+
+    async def enqueue(self, article: Article, priority: str | None = None) -> bool:
+        return self.inner.enqueue(article, priority)
+
+    async def enqueue_many(
+        self,
+        articles: list[Article],
+        message: str = '',
+        priority: str | None = None,
+    ) -> list[bool]:
+        return [
+            self.inner.update_status(a.job_id, 'queued', 0, message, article_id=a.id)
+            and self.inner.enqueue(a, priority)
+            for a in articles
+        ]
+
+    async def join_inflight(self, article: Article, attach: bool = False) -> str | None:
+        return self.inner.join_inflight(article, attach)
+
+    async def close_inflight(self, job_id: str, inputs: ArticleInputs) -> list[dict]:
+        return self.inner.close_inflight(job_id, inputs)
+
+    async def get_status(self, job_id: str) -> dict | None:
+        return self.inner.get_status(job_id)
+
+    async def read_events(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, dict]] | None:
+        events = self.events.get(job_id, [])
+        if last_event_id is None:
+            return list(events)
+        ids = [event_id for event_id, _ in events]
+        start = ids.index(last_event_id) + 1 if last_event_id in ids else len(events)
+        return events[start:]
+
+    async def update_status(
+        self,
+        job_id: str,
+        status: str,
+        progress: int = 0,
+        message: str = '',
+        error: str | None = None,
+        article_id: str | None = None,
+    ) -> bool:
+        return self.inner.update_status(job_id, status, progress, message, error, article_id)
+
+    async def cancel(
+        self,
+        job_id: str,
+        article_id: str | None = None,
+        message: str = 'Job cancelled',
+        user_id: str | None = None,
+    ) -> bool:
+        return self.inner.cancel(job_id, article_id, message, user_id)
+
+    async def retry(
+        self,
+        article: Article,
+        message: str = 'Retrying from last checkpoint',
+        priority: str | None = None,
+    ) -> bool | None:
+        if article.job_id in self.inner.processing or any(ctx.job_id == article.job_id for ctx in self.inner.queue):
+            return False
+        self.inner.cancelled.discard(article.job_id)
+        self.inner.update_status(article.job_id, 'queued', 0, message, article_id=article.id)
+        return self.inner.enqueue(article, priority)
+
+    async def get_stats(self) -> dict | None:
+        return self.inner.get_stats()
+
+    async def get_lane_stats(self) -> dict | None:
+        return self.inner.get_lane_stats()
+
+    async def get_queue_metrics(self) -> dict | None:
+        return self.inner.get_queue_metrics()
+
+    async def save_schedule(self, schedule: Schedule, limit: int = 0) -> bool | None:
+        owned = sum(s.user_id == schedule.user_id for s in self.schedules.values())
+        if limit and schedule.id not in self.schedules and owned >= limit:
+            return False
+        self.schedules[schedule.id] = schedule
+        self.inner.next_runs[schedule.id] = schedule.next_run()
+        return True
+
+    async def list_schedules(self, user_id: str) -> list[Schedule] | None:
+        return sorted(
+            (s for s in self.schedules.values() if s.user_id == user_id),
+            key=lambda s: s.time_utc,
+        )
+
+    async def delete_schedule(self, user_id: str, schedule_id: str) -> bool:
+        schedule = self.schedules.get(schedule_id)
+        if not schedule or schedule.user_id != user_id:
+            return False
+        del self.schedules[schedule_id]
+        self.inner.next_runs.pop(schedule_id, None)
+        return True
+
+    async def ping(self) -> bool:
+        return self.inner.ping()
@@ -6,10 +6,28 @@ from typing import Any
 class FakeNLPAdapter:
     """Fake NLP adapter that returns preconfigured extraction results."""
 
-    def __init__(self, result: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        result: dict[str, Any] | None = None,
+        languages: set[str] | None = None,
+        ready: bool = True,
+    ):
         self.result = result
+        self.languages = languages
+        self.ready = ready
         self.calls: list[tuple[str, str]] = []
 
-    async def extract(self, word: str, sentence: str) -> dict[str, Any] | None:
+    def supports(self, language: str) -> bool:
+        return self.languages is None or language in self.languages
+
+    def is_ready(self, language: str) -> bool:
+        return self.ready and self.supports(language)
+
+    def load_state(self) -> dict[str, str]:
+        return {lang: "ready" if self.ready else "loading" for lang in self.languages or ()}
+
+    async def extract(
+        self, word: str, sentence: str, language: str = "German",
+    ) -> dict[str, Any] | None:
         self.calls.append((word, sentence))
         return self.result
@@ -0,0 +1,39 @@
+"""In-memory implementation of ScrapeCachePort for testing."""
+
+from adapter.cache.redis_scrape_cache import scrape_stats
+
+
+class FakeScrapeCache:
+    """Dict-backed scrape cache. Freshness is set by the test, not by time."""
+
+    def __init__(self):
+        self.pages: dict[str, dict] = {}
+        self.stale: set[str] = set()
+        self.counts: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def get(self, key: str, fresh_seconds: int) -> dict | None:
+        page = self.pages.get(key)
+        if page is None:
+            self._count('misses')
+            return None
+        fresh = key not in self.stale
+        self._count('hits' if fresh else 'stale')
+        return {**page, 'fresh': fresh}
+
+    def put(self, key: str, text: str, etag: str = '', last_modified: str = '') -> bool:
+        self.pages[key] = {'text': text, 'etag': etag, 'last_modified': last_modified}
+        self.stale.discard(key)
+        return True
+
+    def revalidated(self, key: str) -> bool:
+        if key not in self.pages:
+            return False
+        self.stale.discard(key)
+        self._count('revalidated')
+        return True
+
+    def get_stats(self) -> dict | None:
+        return {**scrape_stats(self.counts), 'pages': len(self.pages)}
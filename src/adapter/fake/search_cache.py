@@ -0,0 +1,28 @@
+"""In-memory implementation of SearchCachePort for testing."""
+
+from adapter.cache.redis_search_cache import cache_stats
+
+
+class FakeSearchCache:
+    """Dict-backed search cache; TTLs are recorded but never expire."""
+
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+        self.ttls: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> dict | None:
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, results: dict, ttl_seconds: int) -> bool:
+        self.entries[key] = results
+        self.ttls[key] = ttl_seconds
+        return True
+
+    def get_stats(self) -> dict | None:
+        return cache_stats({'hits': self.hits, 'misses': self.misses})
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 from logging import getLogger
 
 from pymongo.database import Database
-from pymongo.errors import PyMongoError
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from adapter.mongodb import COLLECTION_NAME
 from domain.model.article import (
@@ -37,6 +37,11 @@ class MongoArticleRepository:
                 ('inputs.topic', 1),
                 ('created_at', -1),
             ], 'idx_duplicate_detection')
+            create_index_safe(self.collection, [
+                ('inputs_hash', 1),
+                ('status', 1),
+                ('created_at', -1),
+            ], 'idx_inputs_hash_reuse', sparse=True)
             return True
         except Exception as e:
             logger.error("Failed to create articles indexes", extra={"error": str(e)})
@@ -75,6 +80,7 @@ class MongoArticleRepository:
         try:
             doc = {
                 'inputs': asdict(article.inputs),
+                'inputs_hash': article.inputs.fingerprint,
                 'status': article.status.value,
                 'updated_at': article.updated_at,
                 'user_id': article.user_id,
@@ -100,6 +106,46 @@ class MongoArticleRepository:
             logger.error("Failed to save article", extra={"articleId": article.id, "error": str(e)})
             return False
 
+    def save_many(self, articles: list[Article]) -> set[str]:
+        """Insert new Articles in one insert_many round trip.
+
+        Unordered, so one failing document does not stop the rest.
+        Returns the ids that were inserted.
+        """
+        if not articles:
+            return set()
+
+        docs = [
+            {
+                '_id': article.id,
+                'inputs': asdict(article.inputs),
+                'inputs_hash': article.inputs.fingerprint,
+                'status': article.status.value,
+                'created_at': article.created_at,
+                'updated_at': article.updated_at,
+                'user_id': article.user_id,
+                'job_id': article.job_id,
+                'content': article.content,
+                'started_at': article.started_at,
+                'source': asdict(article.source) if article.source else None,
+                'edit_history': [asdict(r) for r in article.edit_history],
+            }
+            for article in articles
+        ]
+        ids = [article.id for article in articles]
+
+        try:
+            self.collection.insert_many(docs, ordered=False)
+            logger.info("Articles saved", extra={"count": len(ids)})
+            return set(ids)
+        except BulkWriteError as e:
+            failed = {ids[err['index']] for err in e.details.get('writeErrors', [])}
+            logger.error("Failed to save some articles", extra={"failed": len(failed), "error": str(e)})
+            return set(ids) - failed
+        except PyMongoError as e:
+            logger.error("Failed to save articles", extra={"count": len(ids), "error": str(e)})
+            return set()
+
     def update_status(self, article_id: str, status: ArticleStatus) -> bool:
         """Update article status."""
         try:
@@ -212,3 +258,113 @@ class MongoArticleRepository:
         except PyMongoError as e:
             logger.error("Failed to find duplicate article", extra={"error": str(e)})
             return None
+
+    def find_duplicates(
+        self,
+        inputs: list[ArticleInputs],
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> dict[ArticleInputs, Article]:
+        """Find the newest duplicate for each of several inputs in one query."""
+        if not inputs:
+            return {}
+
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            query = {
+                'inputs': {'$in': [asdict(i) for i in inputs]},
+                'created_at': {'$gte': cutoff},
+                'user_id': user_id,
+            }
+
+            duplicates: dict[ArticleInputs, Article] = {}
+            for doc in self.collection.find(query, sort=[('created_at', -1)]):
+                article = self._to_domain(doc)
+                duplicates.setdefault(article.inputs, article)
+            return duplicates
+        except PyMongoError as e:
+            logger.error("Failed to find duplicate articles", extra={"error": str(e)})
+            return {}
+
+    def find_completed(
+        self,
+        inputs: ArticleInputs,
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> list[Article]:
+        """Completed articles with these inputs created within hours, newest first."""
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            query = {
+                'inputs': asdict(inputs),
+                'created_at': {'$gte': cutoff},
+                'user_id': user_id,
+                'status': ArticleStatus.COMPLETED.value,
+            }
+
+            return [self._to_domain(doc) for doc in self.collection.find(query, sort=[('created_at', -1)])]
+        except PyMongoError as e:
+            logger.error("Failed to find completed articles", extra={"error": str(e)})
+            return []
+
+    def find_reusable(
+        self,
+        inputs: ArticleInputs,
+        hours: int = 24,
+        exclude_user_id: str | None = None,
+    ) -> Article | None:
+        """Newest completed article from any user with the same inputs hash.
+
+        Matches on ArticleInputs.fingerprint, so inputs that differ only in
+        case or whitespace match too.
+        """
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            query: dict = {
+                'inputs_hash': inputs.fingerprint,
+                'status': ArticleStatus.COMPLETED.value,
+                'created_at': {'$gte': cutoff},
+            }
+            if exclude_user_id is not None:
+                query['user_id'] = {'$ne': exclude_user_id}
+
+            doc = self.collection.find_one(query, sort=[('created_at', -1)])
+            return self._to_domain(doc) if doc else None
+        except PyMongoError as e:
+            logger.error("Failed to find reusable article", extra={"error": str(e)})
+            return None
+
+    def count_by_inputs(
+        self,
+        hours: int = 168,
+        limit: int = 20,
+        exclude_user_id: str | None = None,
+    ) -> list[tuple[ArticleInputs, int]]:
+        """Most requested inputs within hours, with their article counts.
+
+        Counts every article (any status), so requests that failed or were
+        deleted still count as demand.
+        """
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+            match: dict = {'created_at': {'$gte': cutoff}}
+            if exclude_user_id is not None:
+                match['user_id'] = {'$ne': exclude_user_id}
+
+            pipeline = [
+                {'$match': match},
+                {'$group': {'_id': '$inputs', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1}},
+                {'$limit': limit},
+            ]
+            return [
+                (ArticleInputs(**doc['_id']), doc['count'])
+                for doc in self.collection.aggregate(pipeline)
+            ]
+        except PyMongoError as e:
+            logger.error("Failed to count articles by inputs", extra={"error": str(e)})
+            return []
@@ -1,83 +1,337 @@
-"""Stanza NLP adapter — extracts linguistic information from German text.
+"""Stanza NLP adapter — extracts linguistic information from text.
 
 Implements NLPPort by wrapping the Stanza library. All Stanza-specific
 types (Document, Sentence, Word) are confined within this adapter;
 only primitive dicts cross the boundary.
+
+Pipelines are kept in a per-language registry: each language loads
+lazily on first use, and the registry is capped by a total memory
+budget with least-recently-used eviction. Loading can run in a
+background thread so callers never wait on a cold model (is_ready()).
 """
 
 import asyncio
 import logging
+import os
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
+from utils.language_metadata import GENDER_MAP
+
 logger = logging.getLogger(__name__)
 
-# Stanza feats Gender value → German article
-_GENDER_ARTICLE_MAP = {
-    "Masc": "der",
-    "Fem": "die",
-    "Neut": "das",
+# Total memory budget for loaded pipelines (MB). Least recently used
+# languages are evicted before loading one that would exceed it.
+MEMORY_BUDGET_MB = int(os.getenv('STANZA_MEMORY_BUDGET_MB', '1500'))
+
+# Stanza feats Gender value → GENDER_MAP keyword
+_FEATS_GENDER = {
+    "Masc": "masculine",
+    "Fem": "feminine",
+    "Neut": "neuter",
+}
+
+# Processor split for two-stage parsing: depparse is the most expensive
+# processor and is only read for verbs (separable prefix, reflexive).
+_TAGGER_PROCESSORS = "tokenize,mwt,pos,lemma"
+_FULL_PROCESSORS = f"{_TAGGER_PROCESSORS},depparse"
+
+
+@dataclass(frozen=True)
+class _LanguageSpec:
+    """Per-language Stanza settings and dependency rules."""
+    code: str
+    # Approximate resident size of the default package incl. depparse
+    memory_mb: int
+    # Dependency relation of a verb particle / separable prefix
+    particle_relation: str | None = None
+    # xpos tags of a clicked particle that still needs depparse
+    particle_xpos: frozenset[str] = frozenset()
+    # xpos tags of reflexive pronouns (language-specific tagsets)
+    reflexive_xpos: frozenset[str] = frozenset()
+    # Whether UD feats Reflex=Yes marks a reflexive clitic
+    reflexive_feats: bool = False
+
+
+_LANGUAGE_SPECS: dict[str, _LanguageSpec] = {
+    # "hängt ... ab" (compound:prt, PTKVZ), "sich" (PRF)
+    "German": _LanguageSpec(
+        code="de", memory_mb=349,
+        particle_relation="compound:prt",
+        particle_xpos=frozenset({"PTKVZ"}),
+        reflexive_xpos=frozenset({"PRF"}),
+    ),
+    # "gave ... up" (compound:prt, RP)
+    "English": _LanguageSpec(
+        code="en", memory_mb=400,
+        particle_relation="compound:prt",
+        particle_xpos=frozenset({"RP"}),
+    ),
+    # "se lève", "s'appelle" (Reflex=Yes)
+    "French": _LanguageSpec(code="fr", memory_mb=380, reflexive_feats=True),
+    # "se levanta", "me lavo" (Reflex=Yes)
+    "Spanish": _LanguageSpec(code="es", memory_mb=360, reflexive_feats=True),
 }
 
 
+@dataclass
+class _LanguagePipelines:
+    """Loaded pipelines for one language (tagger + optional depparse stage)."""
+    spec: _LanguageSpec
+    tagger: Any
+    parser: Any = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class StanzaAdapter:
-    """Adapter that extracts linguistic info using Stanza NLP pipeline.
+    """Adapter that extracts linguistic info using Stanza NLP pipelines.
 
-    Thread-safe singleton pipeline: loaded once, reused across requests.
+    Thread-safe pipeline registry: each language is loaded once, reused
+    across requests, and evicted (LRU) when the memory budget is exceeded.
     The pipeline runs synchronously (~50ms), so extract() offloads it
     to a thread to avoid blocking the event loop.
+
+    In two-stage mode (default) the sentence is first tagged without
+    dependency parsing; depparse only runs on the tagged document when
+    the matched token is a verb or a verb particle. Nouns and
+    adjectives — most clicks — skip the parser entirely.
     """
 
-    def __init__(self):
-        self._pipeline = None
+    def __init__(self, two_stage: bool = True, memory_budget_mb: int = MEMORY_BUDGET_MB):
+        self.two_stage = two_stage
+        self.memory_budget_mb = memory_budget_mb
+        self._pipelines: OrderedDict[str, _LanguagePipelines] = OrderedDict()
+        self._load_lock = threading.Lock()
+        self._loading: set[str] = set()
+        self._failed: dict[str, str] = {}
         self._lock = threading.Lock()
 
-    def preload(self) -> None:
-        """Eagerly load the Stanza pipeline (call at service startup)."""
-        self._ensure_pipeline()
+    def preload(self, languages: tuple[str, ...] = ("German",)) -> None:
+        """Eagerly load pipelines, blocking until done."""
+        for language in languages:
+            entry = self._ensure_pipelines(language)
+            if self.two_stage:
+                self._ensure_parser(entry)
+
+    def start_preload(self, languages: tuple[str, ...] = ("German",)) -> threading.Thread | None:
+        """Load pipelines in a background thread (call at service startup).
+
+        Returns immediately; until a language is ready, is_ready() reports
+        False and callers take their non-NLP path instead of waiting.
+        Languages already loading are skipped (None if nothing to load).
+        """
+        with self._lock:
+            pending = tuple(lang for lang in languages if lang not in self._loading)
+            self._loading.update(pending)
+        if not pending:
+            return None
+
+        thread = threading.Thread(
+            target=self._preload_in_background,
+            args=(pending,),
+            name="stanza-preload",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _preload_in_background(self, languages: tuple[str, ...]) -> None:
+        for language in languages:
+            try:
+                self.preload((language,))
+                with self._lock:
+                    self._failed.pop(language, None)
+            except Exception as e:
+                logger.warning("Failed to preload Stanza pipeline",
+                               extra={"language": language, "error": str(e)})
+                with self._lock:
+                    self._failed[language] = str(e)[:200]
+            finally:
+                with self._lock:
+                    self._loading.discard(language)
 
     # ------------------------------------------------------------------
     # Public interface (implements NLPPort)
     # ------------------------------------------------------------------
 
-    async def extract(self, word: str, sentence: str) -> dict[str, Any] | None:
-        """Extract linguistic info for a word in a German sentence.
+    def supports(self, language: str) -> bool:
+        """Whether a Stanza pipeline is configured for this language."""
+        return language in _LANGUAGE_SPECS
+
+    def is_ready(self, language: str) -> bool:
+        """Whether pipelines for the language are loaded and usable now.
+
+        A supported language that is neither loaded, loading nor failed
+        (never requested, or evicted) starts loading in the background.
+        """
+        if not self.supports(language):
+            return False
+        with self._lock:
+            if self._is_loaded(language):
+                return True
+            if language in self._loading or language in self._failed:
+                return False
+        self.start_preload((language,))
+        return False
+
+    def load_state(self) -> dict[str, str]:
+        """Load state per supported language: ready, loading, failed or idle."""
+        with self._lock:
+            state = {}
+            for language in _LANGUAGE_SPECS:
+                if self._is_loaded(language):
+                    state[language] = "ready"
+                elif language in self._loading:
+                    state[language] = "loading"
+                elif language in self._failed:
+                    state[language] = "failed"
+                else:
+                    state[language] = "idle"
+            return state
+
+    @property
+    def loaded_languages(self) -> list[str]:
+        """Currently loaded languages, least recently used first."""
+        with self._lock:
+            return list(self._pipelines)
+
+    async def extract(
+        self, word: str, sentence: str, language: str = "German",
+    ) -> dict[str, Any] | None:
+        """Extract linguistic info for a word in a sentence.
 
         Returns:
             Dict with keys: text, lemma, pos, xpos, gender,
             prefix, reflexive, parts.  Or None on failure.
         """
+        if not self.supports(language):
+            return None
+
         try:
-            pipeline = self._ensure_pipeline()
-            parsed = await asyncio.to_thread(pipeline, sentence)
+            entry = await asyncio.to_thread(self._ensure_pipelines, language)
+            parsed = await asyncio.to_thread(entry.tagger, sentence)
         except Exception as e:
-            logger.warning("Stanza pipeline error", extra={"error": str(e)})
+            logger.warning("Stanza pipeline error", extra={"error": str(e), "language": language})
             return None
 
         word_token, matched_sentence = self._match_word(parsed, word)
         if word_token is None:
             return None
 
-        return self._read_word_info(matched_sentence, word_token)
+        if not self.two_stage:
+            return self._read_word_info(entry.spec, matched_sentence, word_token)
+
+        if not self._needs_depparse(entry.spec, word_token):
+            return self._read_word_info(entry.spec, matched_sentence, word_token, parsed=False)
+
+        try:
+            parser = await asyncio.to_thread(self._ensure_parser, entry)
+            parsed = await asyncio.to_thread(parser, parsed)
+        except Exception as e:
+            logger.warning("Stanza depparse error", extra={"error": str(e), "language": language})
+            return None
+
+        word_token, matched_sentence = self._match_word(parsed, word)
+        return self._read_word_info(entry.spec, matched_sentence, word_token)
 
     # ------------------------------------------------------------------
-    # Pipeline management
+    # Pipeline registry
     # ------------------------------------------------------------------
 
-    def _ensure_pipeline(self):
-        """Lazy-load Stanza German pipeline (singleton, thread-safe)."""
-        if self._pipeline is None:
+    def _ensure_pipelines(self, language: str) -> _LanguagePipelines:
+        """Get (or lazily load) the pipelines for a language.
+
+        Loading happens outside the registry lock so lookups in already
+        loaded languages are never blocked by a model load. Eviction and
+        load run together under one load lock, so concurrent loads of
+        different languages cannot each make room only for themselves and
+        together exceed the memory budget (nor load the same model twice).
+        """
+        with self._lock:
+            entry = self._touch(language)
+            if entry is not None:
+                return entry
+
+        with self._load_lock:
+            with self._lock:
+                entry = self._touch(language)
+                if entry is not None:
+                    return entry
+                spec = _LANGUAGE_SPECS[language]
+                self._evict_for(spec.memory_mb)
+
+            entry = _LanguagePipelines(spec=spec, tagger=self._load_tagger(spec))
+
             with self._lock:
-                if self._pipeline is None:
+                self._pipelines[language] = entry
+            return entry
+
+    def _is_loaded(self, language: str) -> bool:
+        """Whether every stage needed by extract() is loaded (lock held)."""
+        entry = self._pipelines.get(language)
+        return entry is not None and (entry.parser is not None or not self.two_stage)
+
+    def _touch(self, language: str) -> _LanguagePipelines | None:
+        """Return a loaded entry and mark it most recently used (lock held)."""
+        entry = self._pipelines.get(language)
+        if entry is not None:
+            self._pipelines.move_to_end(language)
+        return entry
+
+    def _evict_for(self, needed_mb: int) -> None:
+        """Evict least recently used pipelines until needed_mb fits (lock held)."""
+        while self._pipelines and self._used_mb() + needed_mb > self.memory_budget_mb:
+            language, _ = self._pipelines.popitem(last=False)
+            logger.info("Stanza pipeline evicted", extra={
+                "language": language, "usedMb": self._used_mb(),
+                "budgetMb": self.memory_budget_mb,
+            })
+
+    def _used_mb(self) -> int:
+        return sum(entry.spec.memory_mb for entry in self._pipelines.values())
+
+    def _load_tagger(self, spec: _LanguageSpec):
+        """Load the tagger (or full pipeline in single-stage mode)."""
+        import stanza
+
+        processors = _TAGGER_PROCESSORS if self.two_stage else _FULL_PROCESSORS
+        pipeline = stanza.Pipeline(
+            spec.code,
+            processors=processors,
+            logging_level="WARN",
+        )
+        logger.info("Stanza pipeline loaded",
+                    extra={"language": spec.code, "processors": processors})
+        return pipeline
+
+    def _ensure_parser(self, entry: _LanguagePipelines):
+        """Lazy-load the depparse-only stage run on pre-tagged documents."""
+        if entry.parser is None:
+            with entry.lock:
+                if entry.parser is None:
                     import stanza
 
-                    self._pipeline = stanza.Pipeline(
-                        "de",
-                        processors="tokenize,mwt,pos,lemma,depparse",
+                    entry.parser = stanza.Pipeline(
+                        entry.spec.code,
+                        processors="depparse",
+                        depparse_pretagged=True,
                         logging_level="WARN",
                     )
-                    logger.info("Stanza German pipeline loaded")
-        return self._pipeline
+                    logger.info("Stanza depparse stage loaded",
+                                extra={"language": entry.spec.code})
+        return entry.parser
+
+    @staticmethod
+    def _needs_depparse(spec: _LanguageSpec, word_token) -> bool:
+        """Whether dependency relations are needed for this token.
+
+        Only verbs consume depparse output (particle/prefix, reflexive);
+        a clicked particle is parsed too so its head verb relation stays
+        available.
+        """
+        return word_token.upos == "VERB" or word_token.xpos in spec.particle_xpos
 
     # ------------------------------------------------------------------
     # Word matching
@@ -106,24 +360,37 @@ class StanzaAdapter:
     # Info extraction (reads from Stanza objects → primitives)
     # ------------------------------------------------------------------
 
-    def _read_word_info(self, sentence, word_token) -> dict[str, Any]:
-        """Read all linguistic attributes from a matched word token."""
-        return {
+    def _read_word_info(
+        self, spec: _LanguageSpec, sentence, word_token, *, parsed: bool = True,
+    ) -> dict[str, Any]:
+        """Read all linguistic attributes from a matched word token.
+
+        When ``parsed`` is False (depparse skipped), dependency-derived
+        fields are left empty: prefix/reflexive None, parts = [text].
+        """
+        info = {
             "text": word_token.text,
             "lemma": word_token.lemma,
             "pos": word_token.upos.lower() if word_token.upos else None,
             "xpos": word_token.xpos,
-            "gender": self._read_gender(word_token),
-            "prefix": self._child_text(
-                sentence, word_token.id, relation="compound:prt",
-            ),
-            "reflexive": self._child_text(
-                sentence, word_token.id, xpos="PRF",
-            ),
-            "parts": self._collect_parts(sentence, word_token),
+            "gender": self._read_gender(spec, word_token),
+            "prefix": None,
+            "reflexive": None,
+            "parts": [word_token.text],
         }
+        if parsed:
+            info["prefix"] = self._child_text(
+                sentence, word_token.id,
+                match=lambda w: self._is_particle(spec, w),
+            )
+            info["reflexive"] = self._child_text(
+                sentence, word_token.id,
+                match=lambda w: self._is_reflexive(spec, w),
+            )
+            info["parts"] = self._collect_parts(spec, sentence, word_token)
+        return info
 
-    def _read_gender(self, word_token) -> str | None:
+    def _read_gender(self, spec: _LanguageSpec, word_token) -> str | None:
         """Extract grammatical gender from morphological features.
 
         Parses feats string like 'Case=Nom|Gender=Masc|Number=Sing'.
@@ -134,37 +401,39 @@ class StanzaAdapter:
         for feat in feats.split("|"):
             if feat.startswith("Gender="):
                 gender_value = feat.split("=", 1)[1]
-                return _GENDER_ARTICLE_MAP.get(gender_value)
+                keyword = _FEATS_GENDER.get(gender_value)
+                return GENDER_MAP.get(spec.code, {}).get(keyword)
         return None
 
-    def _child_text(
-        self,
-        sentence,
-        head_id: int,
-        *,
-        relation: str | None = None,
-        xpos: str | None = None,
-    ) -> str | None:
-        """Find the text of a dependent matching relation or xpos."""
+    @staticmethod
+    def _is_particle(spec: _LanguageSpec, w) -> bool:
+        return spec.particle_relation is not None and w.deprel == spec.particle_relation
+
+    @staticmethod
+    def _is_reflexive(spec: _LanguageSpec, w) -> bool:
+        if w.xpos in spec.reflexive_xpos:
+            return True
+        feats = getattr(w, "feats", None) or ""
+        return spec.reflexive_feats and "Reflex=Yes" in feats.split("|")
+
+    def _child_text(self, sentence, head_id: int, *, match) -> str | None:
+        """Find the text of the first dependent accepted by match."""
         for w in sentence.words:
-            if w.head == head_id:
-                if relation and w.deprel == relation:
-                    return w.text
-                if xpos and w.xpos == xpos:
-                    return w.text
+            if w.head == head_id and match(w):
+                return w.text
         return None
 
-    def _collect_parts(self, sentence, word_token) -> list[str]:
+    def _collect_parts(self, spec: _LanguageSpec, sentence, word_token) -> list[str]:
         """Collect the word and its verb-related dependents, sorted by position.
 
-        Includes: the word itself, separable prefix (compound:prt),
-        reflexive pronoun (PRF).
+        Includes: the word itself, particle / separable prefix,
+        reflexive pronoun.
         """
         parts: list[tuple[int, str]] = []
         for w in sentence.words:
             is_self = w.id == word_token.id
             is_dependent = w.head == word_token.id and (
-                w.deprel == "compound:prt" or w.xpos == "PRF"
+                self._is_particle(spec, w) or self._is_reflexive(spec, w)
             )
             if is_self or is_dependent:
                 parts.append((w.id, w.text))
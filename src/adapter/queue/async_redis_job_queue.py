@@ -0,0 +1,415 @@
+"""redis.asyncio implementation of AsyncJobQueuePort for the API process.
+
+FastAPI routes are async, so the blocking RedisJobQueueAdapter would stall
+the event loop for every round trip. This adapter covers the API-side
+subset of the queue (enqueue, in-flight fan-in, status, events, cancel,
+retry, stats, schedules, ping) on the process-wide async connection pool
+from adapter.queue.connection. Key layout, the Lua scripts
+(adapter.queue.scripts) and the stats sets are the same as the sync
+adapter, which the worker keeps using.
+"""
+
+import json
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from adapter.queue.connection import get_async_redis_client, get_async_stream_redis_client
+from adapter.queue.inflight import parse_followers
+from adapter.queue.lanes import lane_stats_from_results, queue_lane_stats_commands
+from adapter.queue.redis_job_queue import (
+    CANCEL_PREFIX,
+    CHECKPOINT_PREFIX,
+    HEARTBEAT_PREFIX,
+    parse_events,
+    queue_stats_commands,
+    stats_from_results,
+)
+from adapter.queue.schedules import (
+    SCHEDULES_KEY,
+    parse_schedules,
+    queue_delete_commands,
+    user_schedules_key,
+)
+from adapter.queue.scripts import (
+    CLOSE_LUA,
+    ENQUEUE_LUA,
+    EVENTS_PREFIX,
+    JOIN_LUA,
+    REMOVE_LUA,
+    RETRY_LUA,
+    SAVE_SCHEDULE_LUA,
+    STATUS_PREFIX,
+    STATUS_TTL,
+    UPDATE_STATUS_LUA,
+    ScriptRegistry,
+    close_call,
+    enqueue_call,
+    job_data,
+    join_call,
+    remove_call,
+    retry_call,
+    save_schedule_call,
+    status_call,
+)
+from adapter.queue.telemetry import metrics_from_results, queue_metrics_commands, worker_info_keys
+from domain.model.article import Article, ArticleInputs
+from domain.model.schedule import Schedule
+
+logger = logging.getLogger(__name__)
+
+EVENT_BATCH = 50
+
+
+class AsyncRedisJobQueueAdapter:
+    def __init__(self, client: Optional[aioredis.Redis] = None):
+        self._client = client
+        self._scripts = ScriptRegistry()
+
+    def _get_client(self) -> Optional[aioredis.Redis]:
+        return self._client or get_async_redis_client()
+
+    def _get_stream_client(self) -> Optional[aioredis.Redis]:
+        return self._client or get_async_stream_redis_client()
+
+    # ── AsyncJobQueuePort implementation ─────────────────────
+
+    async def enqueue(self, article: Article, priority: str | None = None) -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            await self._scripts.get(client, ENQUEUE_LUA)(**enqueue_call(job_data(article, priority)))
+            logger.info("Job enqueued successfully", extra={"jobId": article.job_id, "articleId": article.id})
+            return True
+        except (RedisError, OSError) as e:
+            logger.error("Failed to enqueue job", extra={"jobId": article.job_id, "articleId": article.id, "error": str(e)})
+            return False
+
+    async def enqueue_many(
+        self,
+        articles: list[Article],
+        message: str = '',
+        priority: str | None = None,
+    ) -> list[bool]:
+        """Set each job's 'queued' status and enqueue it, all in one pipeline.
+
+        Returns one flag per article, True when both commands succeeded.
+        """
+        client = self._get_client()
+        if not client or not articles:
+            return [False] * len(articles)
+
+        status_script = self._scripts.get(client, UPDATE_STATUS_LUA)
+        enqueue_script = self._scripts.get(client, ENQUEUE_LUA)
+        try:
+            pipe = client.pipeline(transaction=False)
+            for article in articles:
+                await status_script(
+                    **status_call(article.job_id, 'queued', 0, message, None, article.id),
+                    client=pipe,
+                )
+                await enqueue_script(**enqueue_call(job_data(article, priority)), client=pipe)
+            results = await pipe.execute(raise_on_error=False)
+        except (RedisError, OSError) as e:
+            logger.error("Failed to enqueue jobs", extra={"count": len(articles), "error": str(e)})
+            return [False] * len(articles)
+
+        enqueued = [
+            not isinstance(status, Exception) and not isinstance(pushed, Exception)
+            for status, pushed in zip(results[0::2], results[1::2])
+        ]
+        logger.info("Jobs enqueued", extra={"count": sum(enqueued), "failed": enqueued.count(False)})
+        return enqueued
+
+    async def join_inflight(self, article: Article, attach: bool = False) -> str | None:
+        """Register the article's job as in flight for its inputs, or attach to a live one.
+
+        With attach, returns the id of the queued or running job for the
+        same inputs that the article's job now follows (its status updates
+        are repeated for it; do not enqueue the article). Returns None when
+        the caller should enqueue the job as usual, including when Redis
+        is unavailable.
+        """
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            leader = await self._scripts.get(client, JOIN_LUA)(**join_call(article, attach))
+        except (RedisError, OSError) as e:
+            logger.warning("Failed to join in-flight job", extra={"jobId": article.job_id, "error": str(e)})
+            return None
+        if leader:
+            logger.info("Job attached to in-flight job", extra={"jobId": article.job_id, "leaderJobId": leader})
+        return leader
+
+    async def close_inflight(self, job_id: str, inputs: ArticleInputs) -> list[dict]:
+        """Stop jobs attaching to this one and detach the ones attached.
+
+        Returns each follower as {job_id, article_id, user_id}; [] when
+        Redis is unavailable.
+        """
+        client = self._get_client()
+        if not client:
+            return []
+
+        try:
+            return parse_followers(await self._scripts.get(client, CLOSE_LUA)(**close_call(job_id, inputs)))
+        except (RedisError, OSError) as e:
+            logger.warning("Failed to close in-flight job", extra={"jobId": job_id, "error": str(e)})
+            return []
+
+    async def get_status(self, job_id: str) -> dict | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            status_data = await client.get(f'{STATUS_PREFIX}{job_id}')
+            if status_data:
+                return json.loads(status_data)
+            return None
+        except (RedisError, OSError, json.JSONDecodeError):
+            return None
+
+    async def read_events(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, dict]] | None:
+        """Read status events after last_event_id from the job's stream.
+
+        Starts from the oldest retained event when last_event_id is None.
+        Waits up to block_ms for new events (no wait when None); returns
+        [] on timeout and None if Redis is unavailable. Blocking reads use
+        the separate stream pool.
+        """
+        client = self._get_stream_client() if block_ms else self._get_client()
+        if not client:
+            return None
+
+        try:
+            response = await client.xread(
+                {f'{EVENTS_PREFIX}{job_id}': last_event_id or '0'},
+                count=EVENT_BATCH,
+                block=block_ms,
+            )
+            return parse_events(response)
+        except (RedisError, OSError) as e:
+            logger.warning("Failed to read job events", extra={"jobId": job_id, "error": str(e)})
+            return None
+
+    async def update_status(
+        self,
+        job_id: str,
+        status: str,
+        progress: int = 0,
+        message: str = '',
+        error: str | None = None,
+        article_id: str | None = None,
+    ) -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            final_progress = await self._scripts.get(client, UPDATE_STATUS_LUA)(
+                **status_call(job_id, status, progress, message, error, article_id),
+            )
+            logger.debug("Updated job status", extra={"jobId": job_id, "status": status, "progress": final_progress})
+            return True
+        except (RedisError, OSError):
+            return False
+
+    async def cancel(
+        self,
+        job_id: str,
+        article_id: str | None = None,
+        message: str = 'Job cancelled',
+        user_id: str | None = None,
+    ) -> bool:
+        """Flag the job cancelled and set its 'cancelled' status in one round trip.
+
+        A queued job is also taken out of its lane (found through the
+        owner's sub-queue, so pass user_id), so a later retry cannot leave
+        it to run twice. The worker aborts a running one at its next task
+        boundary.
+        """
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            pipe = client.pipeline()
+            pipe.set(f'{CANCEL_PREFIX}{job_id}', 1, ex=STATUS_TTL)
+            await self._scripts.get(client, REMOVE_LUA)(**remove_call(job_id, user_id), client=pipe)
+            await self._scripts.get(client, UPDATE_STATUS_LUA)(
+                **status_call(job_id, 'cancelled', 0, message, None, article_id),
+                client=pipe,
+            )
+            await pipe.execute()
+            logger.info("Job cancelled", extra={"jobId": job_id, "articleId": article_id})
+            return True
+        except (RedisError, OSError) as e:
+            logger.error("Failed to cancel job", extra={"jobId": job_id, "error": str(e)})
+            return False
+
+    async def retry(
+        self,
+        article: Article,
+        message: str = 'Retrying from last checkpoint',
+        priority: str | None = None,
+    ) -> bool | None:
+        """Requeue a failed or cancelled job under the same job id.
+
+        The job's checkpoints are kept, so the worker resumes after the
+        last task that finished. Queueing, clearing the cancel flag and the
+        'queued' status are one script (RETRY_LUA). Returns False, changing
+        nothing, while the job is still pending or running (cancelled, but
+        not yet at a task boundary), and None if Redis is unavailable.
+        """
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            await self._scripts.get(client, RETRY_LUA)(
+                **retry_call(
+                    article, priority, message,
+                    f'{CANCEL_PREFIX}{article.job_id}', f'{HEARTBEAT_PREFIX}{article.job_id}',
+                ),
+                client=pipe,
+            )
+            pipe.exists(f'{CHECKPOINT_PREFIX}{article.job_id}')
+            requeued, has_checkpoint = await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.error("Failed to retry job", extra={"jobId": article.job_id, "error": str(e)})
+            return None
+
+        if not requeued:
+            logger.info("Retry refused, job still active", extra={"jobId": article.job_id, "articleId": article.id})
+            return False
+        logger.info("Job requeued for retry", extra={
+            "jobId": article.job_id, "articleId": article.id, "hasCheckpoint": bool(has_checkpoint),
+        })
+        return True
+
+    async def get_stats(self) -> dict | None:
+        """Count jobs per status over the status TTL window (last 24h)."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            pipe = client.pipeline()
+            queue_stats_commands(pipe)
+            stats = stats_from_results(await pipe.execute())
+            logger.info("Job statistics retrieved", extra={"totalJobs": stats['total']})
+            return stats
+        except (RedisError, OSError) as e:
+            logger.error("Failed to get job stats", extra={"error": str(e)})
+            return None
+
+    async def get_lane_stats(self) -> dict | None:
+        """Per-lane queue depth and queue-wait metrics."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            pipe = client.pipeline()
+            queue_lane_stats_commands(pipe)
+            return lane_stats_from_results(await pipe.execute())
+        except (RedisError, OSError) as e:
+            logger.error("Failed to get lane stats", extra={"error": str(e)})
+            return None
+
+    async def get_queue_metrics(self) -> dict | None:
+        """Queue depth, oldest-job age, live workers and processing-time histogram."""
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            queue_metrics_commands(pipe)
+            results = await pipe.execute()
+            keys = worker_info_keys(results)
+            return metrics_from_results(results, await client.mget(keys) if keys else [])
+        except (RedisError, OSError) as e:
+            logger.error("Failed to get queue metrics", extra={"error": str(e)})
+            return None
+
+    async def save_schedule(self, schedule: Schedule, limit: int = 0) -> bool | None:
+        """Store a schedule and set its first run.
+
+        With limit, the user's schedule count is checked in the same
+        script, so concurrent saves cannot go past it.
+
+        Returns:
+            True if saved, False if the user already has `limit` schedules,
+            None if Redis is unavailable or the write failed.
+        """
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            saved = await self._scripts.get(client, SAVE_SCHEDULE_LUA)(**save_schedule_call(schedule, limit))
+        except (RedisError, OSError) as e:
+            logger.error("Failed to save schedule", extra={"scheduleId": schedule.id, "error": str(e)})
+            return None
+        if not saved:
+            logger.info("Schedule limit reached", extra={"userId": schedule.user_id, "limit": limit})
+            return False
+        logger.info("Schedule saved", extra={"scheduleId": schedule.id, "userId": schedule.user_id})
+        return True
+
+    async def list_schedules(self, user_id: str) -> list[Schedule] | None:
+        client = self._get_client()
+        if not client:
+            return None
+
+        try:
+            ids = await client.smembers(user_schedules_key(user_id))
+            if not ids:
+                return []
+            schedules = parse_schedules(await client.hmget(SCHEDULES_KEY, sorted(ids)))
+            return sorted(schedules, key=lambda s: s.time_utc)
+        except (RedisError, OSError) as e:
+            logger.error("Failed to list schedules", extra={"userId": user_id, "error": str(e)})
+            return None
+
+    async def delete_schedule(self, user_id: str, schedule_id: str) -> bool:
+        """Delete one of the user's schedules. False if it is not theirs or missing."""
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            if not await client.sismember(user_schedules_key(user_id), schedule_id):
+                return False
+            pipe = client.pipeline()
+            queue_delete_commands(pipe, user_id, schedule_id)
+            await pipe.execute()
+            logger.info("Schedule deleted", extra={"scheduleId": schedule_id, "userId": user_id})
+            return True
+        except (RedisError, OSError) as e:
+            logger.error("Failed to delete schedule", extra={"scheduleId": schedule_id, "error": str(e)})
+            return False
+
+    async def ping(self) -> bool:
+        client = self._get_client()
+        if not client:
+            return False
+        try:
+            await client.ping()
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,50 @@
+"""In-flight registry for fanning identical generation requests into one job.
+
+Layout:
+- opad:jobs:inflight:{fingerprint}   String job_id of the queued or running
+                                     job for those inputs (status TTL)
+- opad:jobs:followers:{job_id}       List of attached jobs' JSON
+                                     {job_id, article_id, user_id}
+
+Every job submitted through submit_generation() registers itself under its
+inputs' fingerprint (ArticleInputs.fingerprint) unless a live job already
+holds the entry. A request that opts in to reuse attaches to that job
+instead of being enqueued: JOIN_LUA appends it to the job's followers.
+The status script repeats every non-terminal status update of a job for
+its followers, so each requester's job id reports progress. Closing the
+entry (CLOSE_LUA) stops new attachments and detaches the followers: the
+worker does it when the job ends and completes or fails their articles
+from the result, and cancelling the job does it so the followers get
+jobs of their own (services.article_submission_service.cancel_generation).
+
+The scripts live in adapter.queue.scripts. Like the lanes, they build
+keys from prefixes, so they assume a single Redis node.
+"""
+
+import json
+
+from domain.model.article import ArticleInputs
+
+INFLIGHT_PREFIX = 'opad:jobs:inflight:'
+FOLLOWERS_PREFIX = 'opad:jobs:followers:'
+
+
+def inflight_key(inputs: ArticleInputs) -> str:
+    return f'{INFLIGHT_PREFIX}{inputs.fingerprint}'
+
+
+def followers_key(job_id: str) -> str:
+    return f'{FOLLOWERS_PREFIX}{job_id}'
+
+
+def parse_followers(raws) -> list[dict]:
+    """Decode followers' JSON, skipping invalid entries."""
+    followers = []
+    for raw in raws or []:
+        try:
+            follower = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(follower, dict) and follower.get('job_id'):
+            followers.append(follower)
+    return followers
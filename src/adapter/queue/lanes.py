@@ -0,0 +1,91 @@
+"""Priority lanes with per-user round-robin for the Redis job queue.
+
+Layout per lane (e.g. 'high', 'normal', 'low'):
+- opad:jobs:lane:{lane}:user:{user_id}  List of that user's pending jobs
+- opad:jobs:lane:{lane}:ready           List of user ids with pending jobs,
+                                        in round-robin order (each once)
+- opad:jobs:lane:{lane}:depth           Pending job count
+- opad:jobs:lane:{lane}:pending         Sorted set job_id -> enqueue time (ms),
+                                        for the oldest pending job's age
+- opad:jobs:wait:{lane}                 Hash of queue-wait metrics
+
+Dequeue serves lanes in priority order and, within a lane, takes one job
+from the user at the head of the ready list and rotates that user to the
+back if they still have jobs. One user submitting many topics therefore
+delays each other user by at most one job per turn. Enqueue also pushes a
+token to opad:jobs:wake so idle workers can block on it (BLPOP) instead of
+polling. The legacy single list opad:jobs is drained after all lanes so
+jobs queued before lanes existed are not lost.
+
+The enqueue, remove and dequeue scripts live in adapter.queue.scripts.
+They build the per-user keys from ARGV prefixes, so they assume a single
+Redis node (no cluster key slots), like the rest of the queue.
+"""
+
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+LANE_PREFIX = 'opad:jobs:lane:'
+WAIT_PREFIX = 'opad:jobs:wait:'
+WAKE_KEY = 'opad:jobs:wake'
+
+DEFAULT_LANES = ('high', 'normal', 'low')
+
+
+def parse_lanes(spec: str) -> tuple[str, ...]:
+    """Lane names from a comma-separated spec; DEFAULT_LANES if it names none."""
+    lanes = tuple(dict.fromkeys(lane.strip() for lane in spec.split(',') if lane.strip()))
+    if not lanes:
+        logger.error("JOB_PRIORITY_LANES names no lanes, using defaults", extra={"lanes": list(DEFAULT_LANES)})
+        return DEFAULT_LANES
+    return lanes
+
+
+# Highest priority first
+LANES = parse_lanes(os.getenv('JOB_PRIORITY_LANES', ','.join(DEFAULT_LANES)))
+DEFAULT_LANE = os.getenv('JOB_DEFAULT_LANE', 'normal')
+if DEFAULT_LANE not in LANES:
+    DEFAULT_LANE = LANES[len(LANES) // 2]
+
+ANONYMOUS_USER = 'anonymous'
+# Upper bounds (seconds) of the queue-wait histogram buckets
+WAIT_BUCKETS = (1, 10, 60, 300, 900)
+
+
+def lane_for(priority: str | None) -> str:
+    """Map a requested priority to a configured lane (default if unknown)."""
+    return priority if priority in LANES else DEFAULT_LANE
+
+
+def queue_lane_stats_commands(pipe) -> None:
+    """Queue per-lane depth + wait-metric reads on a pipeline."""
+    for lane in LANES:
+        pipe.get(f'{LANE_PREFIX}{lane}:depth')
+        pipe.hgetall(f'{WAIT_PREFIX}{lane}')
+
+
+def lane_stats_from_results(results: list) -> dict:
+    """Turn queue_lane_stats_commands() results into per-lane metrics.
+
+    Wait buckets are cumulative counts of jobs that waited at most N
+    seconds (Prometheus-style 'le'), plus '+Inf'.
+    """
+    stats = {}
+    for lane, depth, wait in zip(LANES, results[0::2], results[1::2]):
+        wait = wait or {}
+        count = int(wait.get('count', 0))
+        buckets, running = {}, 0
+        for bound in WAIT_BUCKETS:
+            running += int(wait.get(f'le_{bound}', 0))
+            buckets[str(bound)] = running
+        buckets['+Inf'] = count
+        stats[lane] = {
+            'depth': max(0, int(depth or 0)),
+            'dequeued': count,
+            'avg_wait_seconds': round(int(wait.get('sum_ms', 0)) / count / 1000, 2) if count else 0.0,
+            'max_wait_seconds': round(int(wait.get('max_ms', 0)) / 1000, 2),
+            'wait_buckets': buckets,
+        }
+    return stats
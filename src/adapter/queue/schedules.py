@@ -0,0 +1,49 @@
+"""Scheduled article generation for the Redis job queue.
+
+Layout:
+- opad:schedules                Hash schedule_id -> Schedule JSON
+- opad:schedules:user:{user_id} Set of that user's schedule ids
+- opad:schedules:due            Sorted set schedule_id -> next run (epoch ms)
+
+Schedules are stored with SAVE_SCHEDULE_LUA (adapter.queue.scripts), which
+checks the per-user limit in the same call, so concurrent requests cannot
+go past it. The worker claims due schedules with CLAIM_DUE_LUA, which in
+the same call moves daily schedules to their next run (or removes one-off
+ones), so concurrent workers never claim the same run twice. A worker that
+was down for several days fires a schedule once, not once per missed day.
+A claimed run the worker could not start is put back (release_schedule())
+and claimed again on a later pass.
+"""
+
+import json
+
+from domain.model.schedule import Schedule
+
+SCHEDULES_KEY = 'opad:schedules'
+USER_SCHEDULES_PREFIX = 'opad:schedules:user:'
+DUE_KEY = 'opad:schedules:due'
+
+
+def user_schedules_key(user_id: str) -> str:
+    return f'{USER_SCHEDULES_PREFIX}{user_id}'
+
+
+def queue_delete_commands(pipe, user_id: str, schedule_id: str) -> None:
+    pipe.hdel(SCHEDULES_KEY, schedule_id)
+    pipe.srem(user_schedules_key(user_id), schedule_id)
+    pipe.zrem(DUE_KEY, schedule_id)
+
+
+def parse_schedules(raws) -> list[Schedule]:
+    """Decode stored schedule JSON, skipping missing or invalid entries."""
+    schedules = []
+    for raw in raws:
+        if not raw:
+            continue
+        try:
+            schedule = Schedule.from_dict(json.loads(raw))
+        except json.JSONDecodeError:
+            continue
+        if schedule:
+            schedules.append(schedule)
+    return schedules
@@ -0,0 +1,583 @@
+"""Lua scripts of the Redis job queue and the helper that loads them.
+
+Every queue transition that touches more than one key runs as one script,
+so workers, the reaper and the API never see it half done:
+- UPDATE_STATUS_LUA: merge a status update, append it to the job's event
+  stream, move the job between stats sets and repeat it for followers
+- ENQUEUE_LUA, REMOVE_LUA, DEQUEUE_LUA: priority lanes with per-user
+  round-robin (key layout in adapter.queue.lanes)
+- RETRY_LUA: requeue a finished job unless it is still pending or running
+- RECOVER_LUA: requeue or dead-letter a stalled job unless its worker is
+  still running it
+- JOIN_LUA, CLOSE_LUA: in-flight fan-in (adapter.queue.inflight)
+- SAVE_SCHEDULE_LUA, CLAIM_DUE_LUA: schedules (adapter.queue.schedules)
+
+Each script has a *_call() helper that builds its keys/args; the sync and
+async adapters run the same scripts. ScriptRegistry loads scripts per
+client for the queue adapters and the Redis caches.
+"""
+
+import json
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from adapter.queue.inflight import FOLLOWERS_PREFIX, followers_key, inflight_key
+from adapter.queue.lanes import ANONYMOUS_USER, LANE_PREFIX, LANES, WAIT_BUCKETS, WAIT_PREFIX, WAKE_KEY, lane_for
+from adapter.queue.schedules import DUE_KEY, SCHEDULES_KEY, USER_SCHEDULES_PREFIX, user_schedules_key
+from domain.model.article import Article, ArticleInputs
+from domain.model.schedule import Schedule
+
+STATUS_TTL = 86400
+STATUS_PREFIX = 'opad:job:'
+STATS_PREFIX = 'opad:jobs:status:'
+STATS_STATUSES = ('queued', 'running', 'completed', 'failed', 'cancelled')
+EVENTS_PREFIX = 'opad:jobs:events:'
+EVENTS_MAXLEN = 100
+
+
+class ScriptRegistry:
+    """Lua scripts registered per client (EVALSHA, loaded on demand)."""
+
+    def __init__(self):
+        self._scripts: dict[str, object] = {}
+
+    def get(self, client, source: str):
+        script = self._scripts.get(source)
+        if script is None or script.registered_client is not client:
+            script = self._scripts[source] = client.register_script(source)
+        return script
+
+
+# ── Job status ───────────────────────────────────────────────
+
+# Merges a status update into the stored JSON server-side so concurrent
+# writers (worker, progress listener, reaper) cannot lose each other's fields.
+# KEYS[1] = status key, KEYS[2] = job event stream, KEYS[3..] = per-status
+# stats sets; ARGV[1] = update JSON, ARGV[2] = TTL seconds, ARGV[3] = now
+# (epoch seconds), ARGV[4] = stream max length, ARGV[5..] = status names
+# matching KEYS[3..], then the job's followers list, the status key prefix
+# and the event stream prefix.
+# Preserves article_id when the update omits it, keeps created_at (set on
+# the first 'queued' update), and never resets progress to 0. The merged
+# status is appended to the job's event stream. On a status change the
+# job moves from its old stats set to the new one. A non-terminal update
+# is applied to every follower (adapter.queue.inflight) that was not
+# cancelled. Terminal statuses are not: the worker sets each follower's
+# own outcome, and a cancel by the job's owner must not end other users'
+# jobs.
+UPDATE_STATUS_LUA = """
+local ttl, now, maxlen = tonumber(ARGV[2]), tonumber(ARGV[3]), tonumber(ARGV[4])
+local stats_sets = {}
+for i = 3, #KEYS do
+    stats_sets[ARGV[i + 2]] = KEYS[i]
+end
+local extra = #KEYS + 3
+
+local function read(key)
+    local raw = redis.call('GET', key)
+    if raw then
+        local ok, decoded = pcall(cjson.decode, raw)
+        if ok and type(decoded) == 'table' then
+            return decoded
+        end
+    end
+    return {}
+end
+
+local function apply(status_key, events_key, update, existing)
+    if update['article_id'] == nil and type(existing['article_id']) == 'string' then
+        update['article_id'] = existing['article_id']
+    end
+    if type(existing['created_at']) == 'string' then
+        update['created_at'] = existing['created_at']
+    elseif update['status'] == 'queued' then
+        update['created_at'] = update['updated_at']
+    end
+    if update['progress'] == 0 and type(existing['progress']) == 'number' and existing['progress'] > 0 then
+        update['progress'] = existing['progress']
+    end
+
+    local encoded = cjson.encode(update)
+    redis.call('SET', status_key, encoded, 'EX', ttl)
+    redis.call('XADD', events_key, 'MAXLEN', '~', maxlen, '*', 'data', encoded)
+    redis.call('EXPIRE', events_key, ttl)
+
+    local old_set = stats_sets[existing['status']]
+    local new_set = stats_sets[update['status']]
+    if old_set and old_set ~= new_set then
+        redis.call('ZREM', old_set, update['id'])
+    end
+    if new_set then
+        redis.call('ZADD', new_set, now, update['id'])
+    end
+    return update['progress']
+end
+
+local update = cjson.decode(ARGV[1])
+local progress = apply(KEYS[1], KEYS[2], update, read(KEYS[1]))
+
+local followers_key = ARGV[extra]
+local status = update['status']
+local terminal = status == 'completed' or status == 'failed' or status == 'cancelled'
+if followers_key and not terminal then
+    for _, raw in ipairs(redis.call('LRANGE', followers_key, 0, -1)) do
+        local ok, follower = pcall(cjson.decode, raw)
+        if ok and type(follower) == 'table' and type(follower['job_id']) == 'string' then
+            local status_key = ARGV[extra + 1] .. follower['job_id']
+            local existing = read(status_key)
+            if existing['status'] ~= 'cancelled' then
+                local copy = cjson.decode(ARGV[1])
+                copy['id'] = follower['job_id']
+                copy['article_id'] = follower['article_id']
+                apply(status_key, ARGV[extra + 2] .. follower['job_id'], copy, existing)
+            end
+        end
+    end
+end
+
+return progress
+"""
+
+
+def job_data(article: Article, priority: str | None = None) -> dict:
+    """Build the queue entry for an article's job."""
+    return {
+        'job_id': article.job_id,
+        'article_id': article.id,
+        'user_id': article.user_id,
+        'inputs': asdict(article.inputs),
+        'priority': priority,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def status_call(
+    job_id: str,
+    status: str,
+    progress: int,
+    message: str,
+    error: str | None,
+    article_id: str | None,
+) -> dict:
+    """Build keys/args for UPDATE_STATUS_LUA."""
+    status_data = {
+        'id': job_id,
+        'status': status,
+        'progress': progress,
+        'message': message or '',
+        'error': error,
+        'updated_at': datetime.now(timezone.utc).isoformat(),
+    }
+    if article_id:
+        status_data['article_id'] = article_id
+    return {
+        'keys': [
+            f'{STATUS_PREFIX}{job_id}',
+            f'{EVENTS_PREFIX}{job_id}',
+            *(f'{STATS_PREFIX}{name}' for name in STATS_STATUSES),
+        ],
+        'args': [
+            json.dumps(status_data), STATUS_TTL, time.time(), EVENTS_MAXLEN, *STATS_STATUSES,
+            followers_key(job_id), STATUS_PREFIX, EVENTS_PREFIX,
+        ],
+    }
+
+
+# ── Lanes ────────────────────────────────────────────────────
+
+# KEYS[1] = user queue, KEYS[2] = lane ready list, KEYS[3] = lane depth,
+# KEYS[4] = wake list, KEYS[5] = lane pending set, optional KEYS[6] = the
+# job's heartbeat key; ARGV[1] = payload, ARGV[2] = user id, ARGV[3] =
+# 'front' to requeue at the head (recovered jobs) or 'back', ARGV[4] = job
+# id, ARGV[5] = enqueue time (ms).
+# A job is never queued twice: returns 0 without queueing while the job id
+# is pending in the lane or, when KEYS[6] is given, still running.
+ENQUEUE_LUA = """
+if redis.call('ZSCORE', KEYS[5], ARGV[4]) or (KEYS[6] and redis.call('EXISTS', KEYS[6]) == 1) then
+    return 0
+end
+local front = ARGV[3] == 'front'
+if front then
+    redis.call('LPUSH', KEYS[1], ARGV[1])
+else
+    redis.call('RPUSH', KEYS[1], ARGV[1])
+end
+if redis.call('LLEN', KEYS[1]) == 1 then
+    if front then
+        redis.call('LPUSH', KEYS[2], ARGV[2])
+    else
+        redis.call('RPUSH', KEYS[2], ARGV[2])
+    end
+end
+redis.call('INCR', KEYS[3])
+redis.call('RPUSH', KEYS[4], 1)
+redis.call('ZADD', KEYS[5], tonumber(ARGV[5]), ARGV[4])
+return 1
+"""
+
+# ARGV[1] = lane prefix, ARGV[2] = job id, ARGV[3] = user id, ARGV[4..] =
+# lanes. Removes the job from whichever lane it is pending in (a cancelled
+# job must not be dequeued later, e.g. after a retry cleared its cancel
+# flag), and the user from the ready list if that was their last job, so
+# their next enqueue does not list them twice. Returns 1 if it was removed.
+REMOVE_LUA = """
+for i = 4, #ARGV do
+    local base = ARGV[1] .. ARGV[i]
+    if redis.call('ZSCORE', base .. ':pending', ARGV[2]) then
+        local user_key = base .. ':user:' .. ARGV[3]
+        for _, raw in ipairs(redis.call('LRANGE', user_key, 0, -1)) do
+            local ok, job = pcall(cjson.decode, raw)
+            if ok and type(job) == 'table' and job['job_id'] == ARGV[2] then
+                redis.call('LREM', user_key, 1, raw)
+                if redis.call('LLEN', user_key) == 0 then
+                    redis.call('LREM', base .. ':ready', 0, ARGV[3])
+                end
+                redis.call('DECR', base .. ':depth')
+                redis.call('ZREM', base .. ':pending', ARGV[2])
+                return 1
+            end
+        end
+    end
+end
+return 0
+"""
+
+# KEYS[1] = wake list, KEYS[2] = legacy queue, KEYS[3] = processing list,
+# KEYS[4] = workers set; ARGV[1] = lane prefix, ARGV[2] = wait prefix,
+# ARGV[3] = '1' if reliable, ARGV[4] = heartbeat prefix, ARGV[5] =
+# visibility timeout, ARGV[6] = worker id, ARGV[7] = comma-separated wait
+# bucket bounds (seconds), ARGV[8..] = lanes, highest priority first.
+# Returns the raw payload and its lane, or nil when every lane is empty.
+DEQUEUE_LUA = """
+local t = redis.call('TIME')
+local now_ms = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local function record_wait(lane, job)
+    local enqueued_ms = tonumber(job['enqueued_ms'])
+    if not enqueued_ms then
+        return
+    end
+    local wait_ms = math.max(0, now_ms - enqueued_ms)
+    local key = ARGV[2] .. lane
+    redis.call('HINCRBY', key, 'count', 1)
+    redis.call('HINCRBY', key, 'sum_ms', wait_ms)
+    local bucket = 'inf'
+    for bound in string.gmatch(ARGV[7], '[^,]+') do
+        if wait_ms <= tonumber(bound) * 1000 then
+            bucket = bound
+            break
+        end
+    end
+    redis.call('HINCRBY', key, 'le_' .. bucket, 1)
+    local max_ms = tonumber(redis.call('HGET', key, 'max_ms') or '0')
+    if wait_ms > max_ms then
+        redis.call('HSET', key, 'max_ms', wait_ms)
+    end
+end
+
+local function take(raw, lane)
+    local ok, job = pcall(cjson.decode, raw)
+    if not ok or type(job) ~= 'table' then
+        job = {}
+    end
+    record_wait(lane, job)
+    if lane ~= 'legacy' and type(job['job_id']) == 'string' then
+        redis.call('ZREM', ARGV[1] .. lane .. ':pending', job['job_id'])
+    end
+    if ARGV[3] == '1' then
+        redis.call('RPUSH', KEYS[3], raw)
+        redis.call('SADD', KEYS[4], ARGV[6])
+        if type(job['job_id']) == 'string' then
+            redis.call('SET', ARGV[4] .. job['job_id'], ARGV[6], 'EX', tonumber(ARGV[5]))
+        end
+    end
+    return {raw, lane}
+end
+
+for i = 8, #ARGV do
+    local lane = ARGV[i]
+    local base = ARGV[1] .. lane
+    local user = redis.call('LPOP', base .. ':ready')
+    while user do
+        local user_key = base .. ':user:' .. user
+        local raw = redis.call('LPOP', user_key)
+        if raw then
+            if redis.call('LLEN', user_key) > 0 then
+                redis.call('RPUSH', base .. ':ready', user)
+            end
+            redis.call('DECR', base .. ':depth')
+            return take(raw, lane)
+        end
+        user = redis.call('LPOP', base .. ':ready')
+    end
+end
+
+local raw = redis.call('LPOP', KEYS[2])
+if raw then
+    return take(raw, 'legacy')
+end
+
+-- Nothing pending anywhere: leftover wake tokens are meaningless
+redis.call('DEL', KEYS[1])
+return nil
+"""
+
+
+def enqueue_call(payload: dict, front: bool = False, running_key: str | None = None) -> dict:
+    """Build keys/args for ENQUEUE_LUA; stamps the payload's lane and enqueue time.
+
+    With running_key (the job's heartbeat key) the job is not queued while
+    it is still running.
+    """
+    lane = lane_for(payload.get('priority'))
+    user = payload.get('user_id') or ANONYMOUS_USER
+    payload['priority'] = lane
+    payload['enqueued_ms'] = int(time.time() * 1000)
+    raw = json.dumps(payload)
+    base = f'{LANE_PREFIX}{lane}'
+    keys = [f'{base}:user:{user}', f'{base}:ready', f'{base}:depth', WAKE_KEY, f'{base}:pending']
+    return {
+        'keys': keys + [running_key] if running_key else keys,
+        'args': [raw, user, 'front' if front else 'back', payload.get('job_id', ''), payload['enqueued_ms']],
+    }
+
+
+def remove_call(job_id: str, user_id: str | None) -> dict:
+    """Build keys/args for REMOVE_LUA."""
+    return {'keys': [], 'args': [LANE_PREFIX, job_id, user_id or ANONYMOUS_USER, *LANES]}
+
+
+def dequeue_call(
+    legacy_queue: str,
+    processing_key: str,
+    workers_key: str,
+    heartbeat_prefix: str,
+    reliable: bool,
+    visibility_timeout: int,
+    worker_id: str,
+) -> dict:
+    """Build keys/args for DEQUEUE_LUA."""
+    return {
+        'keys': [WAKE_KEY, legacy_queue, processing_key, workers_key],
+        'args': [
+            LANE_PREFIX, WAIT_PREFIX, '1' if reliable else '0',
+            heartbeat_prefix, visibility_timeout, worker_id,
+            ','.join(str(bound) for bound in WAIT_BUCKETS),
+            *LANES,
+        ],
+    }
+
+
+def _as_function(name: str, source: str) -> str:
+    """Wrap a script as a local Lua function of (KEYS, ARGV) so others can run it."""
+    return f"local function {name}(KEYS, ARGV)\n{source}\nend\n"
+
+
+_SLICE_LUA = """
+local function slice(t, first, last)
+    local out = {}
+    for i = first, last do
+        out[#out + 1] = t[i]
+    end
+    return out
+end
+"""
+
+# KEYS[1] = cancel flag, then ENQUEUE_LUA's keys (with the job's heartbeat
+# key), then UPDATE_STATUS_LUA's keys; ARGV[1] = number of enqueue keys,
+# ARGV[2] = number of enqueue args, then the enqueue args, then the status
+# args.
+# Requeues a finished job: queues it, clears its cancel flag and sets its
+# 'queued' status, or returns 0 and changes nothing while the job is
+# still pending or running. Returns 1 when requeued.
+RETRY_LUA = _as_function('enqueue', ENQUEUE_LUA) + _as_function('update_status', UPDATE_STATUS_LUA) + _SLICE_LUA + """
+local nkeys, nargs = tonumber(ARGV[1]), tonumber(ARGV[2])
+if enqueue(slice(KEYS, 2, nkeys + 1), slice(ARGV, 3, nargs + 2)) == 0 then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+update_status(slice(KEYS, nkeys + 2, #KEYS), slice(ARGV, nargs + 3, #ARGV))
+return 1
+"""
+
+
+def retry_call(
+    article: Article,
+    priority: str | None,
+    message: str,
+    cancel_key: str,
+    running_key: str,
+) -> dict:
+    """Build keys/args for RETRY_LUA."""
+    enqueue = enqueue_call(job_data(article, priority), running_key=running_key)
+    status = status_call(article.job_id, 'queued', 0, message, None, article.id)
+    return {
+        'keys': [cancel_key, *enqueue['keys'], *status['keys']],
+        'args': [len(enqueue['keys']), len(enqueue['args']), *enqueue['args'], *status['args']],
+    }
+
+
+# KEYS[1] = processing list, KEYS[2] = the job's heartbeat key, KEYS[3] =
+# dead-letter list, then ENQUEUE_LUA's keys (none when dead-lettering),
+# then UPDATE_STATUS_LUA's keys; ARGV[1] = the job's entry in the
+# processing list, ARGV[2] = its payload with the new attempt count,
+# ARGV[3] = number of enqueue keys, ARGV[4] = number of enqueue args, then
+# the enqueue args, then the status args.
+# Takes a stalled job off the processing list and requeues it at the front
+# of its lane (or moves it to the dead-letter list), then sets its status.
+# Returns 0 and changes nothing while its heartbeat is live (the worker is
+# still running it) or when another reaper already took it; 1 otherwise.
+RECOVER_LUA = _as_function('enqueue', ENQUEUE_LUA) + _as_function('update_status', UPDATE_STATUS_LUA) + _SLICE_LUA + """
+if redis.call('EXISTS', KEYS[2]) == 1 or redis.call('LREM', KEYS[1], 1, ARGV[1]) == 0 then
+    return 0
+end
+local nkeys, nargs = tonumber(ARGV[3]), tonumber(ARGV[4])
+if nkeys == 0 then
+    redis.call('RPUSH', KEYS[3], ARGV[2])
+else
+    enqueue(slice(KEYS, 4, nkeys + 3), slice(ARGV, 5, nargs + 4))
+end
+update_status(slice(KEYS, nkeys + 4, #KEYS), slice(ARGV, nargs + 5, #ARGV))
+return 1
+"""
+
+
+def recover_call(
+    raw: str,
+    payload: dict,
+    dead: bool,
+    processing_key: str,
+    heartbeat_key: str,
+    dead_letter_key: str,
+    status: dict,
+) -> dict:
+    """Build keys/args for RECOVER_LUA; status is a status_call() result."""
+    enqueue = {'keys': [], 'args': []} if dead else enqueue_call(payload, front=True)
+    return {
+        'keys': [processing_key, heartbeat_key, dead_letter_key, *enqueue['keys'], *status['keys']],
+        'args': [raw, json.dumps(payload), len(enqueue['keys']), len(enqueue['args']), *enqueue['args'], *status['args']],
+    }
+
+
+# ── In-flight fan-in ─────────────────────────────────────────
+
+# KEYS[1] = registry key; ARGV[1] = joining job's JSON, ARGV[2] = its job
+# id, ARGV[3] = status key prefix, ARGV[4] = followers prefix, ARGV[5] =
+# TTL seconds, ARGV[6] = '1' to attach to a live job.
+# Returns the live job's id when attached, otherwise registers the joining
+# job (unless another live job holds the entry) and returns nil.
+JOIN_LUA = """
+local leader = redis.call('GET', KEYS[1])
+if leader and leader ~= ARGV[2] then
+    local raw = redis.call('GET', ARGV[3] .. leader)
+    local ok, status = false, nil
+    if raw then
+        ok, status = pcall(cjson.decode, raw)
+    end
+    if ok and type(status) == 'table' and (status['status'] == 'queued' or status['status'] == 'running') then
+        if ARGV[6] ~= '1' then
+            return nil
+        end
+        local followers = ARGV[4] .. leader
+        redis.call('RPUSH', followers, ARGV[1])
+        redis.call('EXPIRE', followers, tonumber(ARGV[5]))
+        return leader
+    end
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', tonumber(ARGV[5]))
+return nil
+"""
+
+# KEYS[1] = registry key, KEYS[2] = job's followers list; ARGV[1] = job id.
+# Removes the entry if this job holds it, then removes and returns the
+# followers' JSON, so each follower is settled exactly once.
+CLOSE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+end
+local followers = redis.call('LRANGE', KEYS[2], 0, -1)
+redis.call('DEL', KEYS[2])
+return followers
+"""
+
+
+def join_call(article: Article, attach: bool) -> dict:
+    """Build keys/args for JOIN_LUA."""
+    follower = {'job_id': article.job_id, 'article_id': article.id, 'user_id': article.user_id}
+    return {
+        'keys': [inflight_key(article.inputs)],
+        'args': [json.dumps(follower), article.job_id, STATUS_PREFIX, FOLLOWERS_PREFIX, STATUS_TTL, '1' if attach else '0'],
+    }
+
+
+def close_call(job_id: str, inputs: ArticleInputs) -> dict:
+    """Build keys/args for CLOSE_LUA."""
+    return {'keys': [inflight_key(inputs), followers_key(job_id)], 'args': [job_id]}
+
+
+# ── Schedules ────────────────────────────────────────────────
+
+# KEYS[1] = schedules hash, KEYS[2] = the user's schedule set, KEYS[3] =
+# due set; ARGV[1] = schedule id, ARGV[2] = schedule JSON, ARGV[3] = run
+# time (epoch ms), ARGV[4] = max schedules per user (0 = no limit).
+# Stores the schedule and its run, unless that would take a new schedule
+# past the user's limit (returns 0). Returns 1 when stored.
+SAVE_SCHEDULE_LUA = """
+local limit = tonumber(ARGV[4])
+if limit > 0 and redis.call('SISMEMBER', KEYS[2], ARGV[1]) == 0 and redis.call('SCARD', KEYS[2]) >= limit then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('SADD', KEYS[2], ARGV[1])
+redis.call('ZADD', KEYS[3], tonumber(ARGV[3]), ARGV[1])
+return 1
+"""
+
+# KEYS[1] = due set, KEYS[2] = schedules hash; ARGV[1] = now (epoch ms),
+# ARGV[2] = max schedules to claim, ARGV[3] = user set prefix.
+# Returns the claimed schedules' JSON.
+CLAIM_DUE_LUA = """
+local now = tonumber(ARGV[1])
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', now, 'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[2]))
+local claimed = {}
+for i = 1, #due, 2 do
+    local id = due[i]
+    local raw = redis.call('HGET', KEYS[2], id)
+    local ok, schedule = false, nil
+    if raw then
+        ok, schedule = pcall(cjson.decode, raw)
+    end
+    if ok and type(schedule) == 'table' then
+        table.insert(claimed, raw)
+        if schedule['repeat_daily'] == false then
+            redis.call('ZREM', KEYS[1], id)
+            redis.call('HDEL', KEYS[2], id)
+            redis.call('SREM', ARGV[3] .. tostring(schedule['user_id']), id)
+        else
+            local next_run = tonumber(due[i + 1]) + 86400000
+            if next_run <= now then
+                next_run = next_run + math.ceil((now - next_run + 1) / 86400000) * 86400000
+            end
+            redis.call('ZADD', KEYS[1], next_run, id)
+        end
+    else
+        redis.call('ZREM', KEYS[1], id)
+    end
+end
+return claimed
+"""
+
+
+def save_schedule_call(schedule: Schedule, limit: int = 0, run_at: datetime | None = None) -> dict:
+    """Build keys/args for SAVE_SCHEDULE_LUA; the run defaults to the schedule's next one."""
+    run_at = run_at or schedule.next_run()
+    return {
+        'keys': [SCHEDULES_KEY, user_schedules_key(schedule.user_id), DUE_KEY],
+        'args': [schedule.id, json.dumps(schedule.to_dict()), int(run_at.timestamp() * 1000), limit],
+    }
+
+
+def claim_due_call(now_ms: int, limit: int) -> dict:
+    """Build keys/args for CLAIM_DUE_LUA."""
+    return {'keys': [DUE_KEY, SCHEDULES_KEY], 'args': [now_ms, limit, USER_SCHEDULES_PREFIX]}
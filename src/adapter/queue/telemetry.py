@@ -0,0 +1,117 @@
+"""Worker heartbeats and queue telemetry for the Redis job queue.
+
+Layout:
+- opad:workers:info:{worker_id}  JSON heartbeat (concurrency, in-flight job
+                                 ids), expires after WORKER_INFO_TTL
+- opad:workers:seen              Sorted set worker_id -> last heartbeat (ms)
+- opad:jobs:runtime              Hash histogram of job processing time
+                                 (count, sum_ms, le_{bucket}, status counts)
+
+Queue depth and oldest pending job per lane come from the lane keys in
+adapter.queue.lanes. Metrics are read in two pipelined round trips (the
+second fetches the heartbeats of the workers seen in the first).
+"""
+
+import json
+import time
+
+from adapter.queue.lanes import LANE_PREFIX, LANES
+
+WORKER_INFO_PREFIX = 'opad:workers:info:'
+WORKERS_SEEN_KEY = 'opad:workers:seen'
+RUNTIME_KEY = 'opad:jobs:runtime'
+# A worker missing this many seconds of heartbeats is considered gone
+WORKER_INFO_TTL = 60
+# Upper bounds (seconds) of the processing-time histogram buckets
+RUNTIME_BUCKETS = (30, 60, 120, 300, 600, 1200)
+
+
+def queue_heartbeat_commands(pipe, worker_id: str, concurrency: int, in_flight: list[str]) -> None:
+    """Queue a worker heartbeat on a pipeline."""
+    now_ms = int(time.time() * 1000)
+    info = {
+        'worker_id': worker_id,
+        'concurrency': concurrency,
+        'in_flight': in_flight,
+        'updated_ms': now_ms,
+    }
+    pipe.set(f'{WORKER_INFO_PREFIX}{worker_id}', json.dumps(info), ex=WORKER_INFO_TTL)
+    pipe.zadd(WORKERS_SEEN_KEY, {worker_id: now_ms})
+
+
+def queue_runtime_commands(pipe, seconds: float, status: str) -> None:
+    """Queue a processing-time observation on a pipeline."""
+    bucket = next((str(b) for b in RUNTIME_BUCKETS if seconds <= b), 'inf')
+    pipe.hincrby(RUNTIME_KEY, 'count', 1)
+    pipe.hincrby(RUNTIME_KEY, 'sum_ms', int(seconds * 1000))
+    pipe.hincrby(RUNTIME_KEY, f'le_{bucket}', 1)
+    pipe.hincrby(RUNTIME_KEY, f'status_{status}', 1)
+
+
+def queue_metrics_commands(pipe) -> None:
+    """Queue the first metrics round trip: lanes, live workers, runtime histogram."""
+    now_ms = int(time.time() * 1000)
+    for lane in LANES:
+        pipe.get(f'{LANE_PREFIX}{lane}:depth')
+        pipe.zrange(f'{LANE_PREFIX}{lane}:pending', 0, 0, withscores=True)
+    pipe.zremrangebyscore(WORKERS_SEEN_KEY, '-inf', now_ms - WORKER_INFO_TTL * 1000)
+    pipe.zrange(WORKERS_SEEN_KEY, 0, -1)
+    pipe.hgetall(RUNTIME_KEY)
+
+
+def worker_info_keys(results: list) -> list[str]:
+    """Heartbeat keys of the live workers listed in queue_metrics_commands() results."""
+    return [f'{WORKER_INFO_PREFIX}{worker_id}' for worker_id in results[-2] or []]
+
+
+def _histogram(raw: dict) -> dict:
+    count = int(raw.get('count', 0))
+    buckets, running = {}, 0
+    for bound in RUNTIME_BUCKETS:
+        running += int(raw.get(f'le_{bound}', 0))
+        buckets[str(bound)] = running
+    buckets['+Inf'] = count
+    return {
+        'count': count,
+        'avg_seconds': round(int(raw.get('sum_ms', 0)) / count / 1000, 1) if count else None,
+        'buckets': buckets,
+        'completed': int(raw.get('status_completed', 0)),
+        'failed': int(raw.get('status_failed', 0)),
+        'cancelled': int(raw.get('status_cancelled', 0)),
+    }
+
+
+def metrics_from_results(results: list, worker_infos: list) -> dict:
+    """Turn both metrics round trips into a queue metrics dict.
+
+    Wait ages are in seconds; processing-time buckets are cumulative
+    counts (Prometheus-style 'le'), plus '+Inf'.
+    """
+    now_ms = int(time.time() * 1000)
+    lanes = {}
+    for i, lane in enumerate(LANES):
+        depth, oldest = results[2 * i], results[2 * i + 1]
+        lanes[lane] = {
+            'depth': max(0, int(depth or 0)),
+            'oldest_age_seconds': round(max(0, now_ms - oldest[0][1]) / 1000, 1) if oldest else 0.0,
+        }
+
+    workers = []
+    for raw in worker_infos:
+        try:
+            info = json.loads(raw) if raw else None
+        except json.JSONDecodeError:
+            info = None
+        if isinstance(info, dict):
+            workers.append(info)
+
+    return {
+        'depth': sum(lane['depth'] for lane in lanes.values()),
+        'oldest_age_seconds': max((lane['oldest_age_seconds'] for lane in lanes.values()), default=0.0),
+        'lanes': lanes,
+        'workers': len(workers),
+        'slots': sum(int(w.get('concurrency', 1)) for w in workers),
+        'in_flight': sum(len(w.get('in_flight', [])) for w in workers),
+        'worker_details': workers,
+        'processing_time': _histogram(results[-1] or {}),
+    }
@@ -10,10 +10,10 @@ from adapter.mongodb.article_repository import MongoArticleRepository
 from adapter.mongodb.token_usage_repository import MongoTokenUsageRepository
 from adapter.mongodb.user_repository import MongoUserRepository
 from adapter.mongodb.vocabulary_repository import MongoVocabularyRepository
-from adapter.queue.redis_job_queue import RedisJobQueueAdapter
+from adapter.queue.async_redis_job_queue import AsyncRedisJobQueueAdapter
 from port.article_repository import ArticleRepository
 from port.dictionary import DictionaryPort
-from port.job_queue import JobQueuePort
+from port.job_queue import AsyncJobQueuePort
 from port.llm import LLMPort
 from port.nlp import NLPPort
 from port.token_usage_repository import TokenUsageRepository
@@ -53,11 +53,13 @@ def get_llm_port() -> LLMPort:
     return LiteLLMAdapter()
 
 
-def get_job_queue() -> JobQueuePort:
-    return RedisJobQueueAdapter()
+@lru_cache(maxsize=1)
+def get_job_queue() -> AsyncJobQueuePort:
+    """Get async job queue (singleton on the process-wide Redis pool)."""
+    return AsyncRedisJobQueueAdapter()
 
 
 @lru_cache(maxsize=1)
 def get_nlp_port() -> NLPPort:
-    """Get NLP port (Stanza adapter singleton for German lemma extraction)."""
+    """Get NLP port (Stanza adapter singleton, per-language pipeline registry)."""
     return StanzaAdapter()
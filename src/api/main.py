@@ -20,7 +20,7 @@ load_dotenv()
 _src_path = Path(__file__).parent.parent
 sys.path.insert(0, str(_src_path))
 
-from api.routes import articles, jobs, health, stats, dictionary, vocabulary, auth, usage
+from api.routes import articles, jobs, health, stats, dictionary, vocabulary, auth, usage, schedules
 from utils.logging import setup_structured_logging
 from adapter.mongodb.connection import get_mongodb_client, DATABASE_NAME
 from adapter.mongodb.indexes import ensure_all_indexes
@@ -52,17 +52,22 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("MongoDB unavailable, skipping index creation")
 
-    # Startup: preload Stanza German pipeline (~349MB)
+    # Startup: preload Stanza German pipeline (~349MB) in the background.
+    # Serving starts immediately; lookups use the LLM path until it is ready.
     try:
         from api.dependencies import get_nlp_port
         adapter = get_nlp_port()
-        if hasattr(adapter, 'preload'):
-            adapter.preload()
+        if hasattr(adapter, 'start_preload'):
+            adapter.start_preload()
     except Exception as e:
-        logger.warning("Failed to preload Stanza pipeline: %s", e)
+        logger.warning("Failed to start Stanza preload: %s", e)
 
     yield  # App runs here
 
+    # Shutdown: close the shared async Redis pool
+    from adapter.queue.connection import close_async_redis_client
+    await close_async_redis_client()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -111,6 +116,7 @@ app.include_router(dictionary.router)
 app.include_router(vocabulary.router)
 app.include_router(auth.router)
 app.include_router(usage.router)
+app.include_router(schedules.router)
 
 
 @app.get("/")
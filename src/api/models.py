@@ -50,6 +50,30 @@ class GenerateRequest(BaseModel):
     topic: str
 
 
+class GenerateBatchRequest(BaseModel):
+    """Request model for generating several articles at once."""
+    items: list[GenerateRequest] = Field(..., min_length=1, max_length=50, description="Articles to generate")
+
+
+class ScheduleRequest(GenerateRequest):
+    """Request model for scheduling article generation."""
+    time_utc: str = Field(..., pattern=r"^([01]\d|2[0-3]):[0-5]\d$", description="Run time of day in UTC (HH:MM)")
+    repeat_daily: bool = Field(True, description="Run every day; false runs once at the next time_utc")
+
+
+class ScheduleResponse(BaseModel):
+    """Response model for a generation schedule."""
+    id: str = Field(..., description="Schedule ID")
+    language: str
+    level: str
+    length: str
+    topic: str
+    time_utc: str
+    repeat_daily: bool
+    created_at: datetime
+    next_run_at: datetime = Field(..., description="Next time an article will be generated")
+
+
 class JobResponse(BaseModel):
     """Response model for job status."""
     id: str = Field(..., description="Job ID")
@@ -70,6 +94,21 @@ class GenerateResponse(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+class GenerateBatchItemResponse(BaseModel):
+    """Outcome of one item in a batch generate request."""
+    index: int = Field(..., description="Position of the item in the request")
+    status: Literal["queued", "duplicate", "failed"] = Field(..., description="Item outcome")
+    job_id: Optional[str] = Field(None, description="Job ID for tracking (queued items)")
+    article_id: Optional[str] = Field(None, description="New article ID, or the existing one for duplicates")
+    error: Optional[str] = Field(None, description="Error message if failed")
+
+
+class GenerateBatchResponse(BaseModel):
+    """Response model for batch generate endpoint."""
+    results: list[GenerateBatchItemResponse]
+    queued: int = Field(..., description="Number of jobs started")
+
+
 class ArticleListResponse(BaseModel):
     """Response model for article list with pagination."""
     articles: list[ArticleResponse]
@@ -4,15 +4,18 @@ import logging
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
 
-from api.models import ArticleResponse, GenerateRequest, GenerateResponse, JobResponse, ArticleListResponse, UserResponse, VocabularyResponse
+from api.models import (
+    ArticleResponse, GenerateRequest, GenerateResponse, GenerateBatchRequest, GenerateBatchResponse,
+    GenerateBatchItemResponse, JobResponse, ArticleListResponse, UserResponse, VocabularyResponse,
+)
 from api.security import get_current_user_required
 from api.dependencies import get_article_repo, get_job_queue, get_vocab_repo
 from port.article_repository import ArticleRepository
-from port.job_queue import JobQueuePort
+from port.job_queue import AsyncJobQueuePort
 from domain.model.article import ArticleInputs, ArticleStatus, Article
 from domain.model.errors import DomainError, DuplicateArticleError, EnqueueError
 from port.vocabulary_repository import VocabularyRepository
-from services.article_submission_service import submit_generation
+from services.article_submission_service import cancel_generation, submit_generation, submit_generation_batch
 
 logger = logging.getLogger(__name__)
 
@@ -131,11 +134,17 @@ async def list_articles(
 async def generate_article(
     request: GenerateRequest,
     force: bool = False,
+    reuse: bool = False,
     current_user: UserResponse = Depends(get_current_user_required),
     repo: ArticleRepository = Depends(get_article_repo),
-    job_queue: JobQueuePort = Depends(get_job_queue),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
 ):
-    """Create article and start generation (unified endpoint)."""
+    """Create article and start generation (unified endpoint).
+
+    With reuse=true a recent completed article another user generated from
+    the same inputs is copied instead (not personalized to this user's
+    vocabulary).
+    """
     inputs = ArticleInputs(
         language=request.language,
         level=request.level,
@@ -144,7 +153,7 @@ async def generate_article(
     )
 
     try:
-        article = submit_generation(inputs, current_user.id, repo, job_queue, force)
+        article = await submit_generation(inputs, current_user.id, repo, job_queue, force, reuse)
     except DuplicateArticleError as e:
         existing_job = None
         if e.job_data:
@@ -163,10 +172,48 @@ async def generate_article(
     except DomainError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
-    return GenerateResponse(
-        job_id=article.job_id,
-        article_id=article.id,
-        message="Article generation started. Use job_id to track progress.",
+    if article.status == ArticleStatus.COMPLETED:
+        message = "Article is ready (copied from an existing article)."
+    else:
+        message = "Article generation started. Use job_id to track progress."
+    return GenerateResponse(job_id=article.job_id, article_id=article.id, message=message)
+
+
+@router.post("/generate/batch", response_model=GenerateBatchResponse)
+async def generate_articles_batch(
+    request: GenerateBatchRequest,
+    force: bool = False,
+    current_user: UserResponse = Depends(get_current_user_required),
+    repo: ArticleRepository = Depends(get_article_repo),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Create several articles and start their generation in one request.
+
+    Each item succeeds or fails on its own; see the per-item status.
+    """
+    inputs_list = [
+        ArticleInputs(language=item.language, level=item.level, length=item.length, topic=item.topic)
+        for item in request.items
+    ]
+
+    results = await submit_generation_batch(inputs_list, current_user.id, repo, job_queue, force)
+
+    items = []
+    for index, result in enumerate(results):
+        if isinstance(result, Article):
+            items.append(GenerateBatchItemResponse(
+                index=index, status="queued", job_id=result.job_id, article_id=result.id,
+            ))
+        elif isinstance(result, DuplicateArticleError):
+            items.append(GenerateBatchItemResponse(
+                index=index, status="duplicate", article_id=result.article_id, error=str(result),
+            ))
+        else:
+            items.append(GenerateBatchItemResponse(index=index, status="failed", error=str(result)))
+
+    return GenerateBatchResponse(
+        results=items,
+        queued=sum(item.status == "queued" for item in items),
     )
 
 
@@ -250,11 +297,15 @@ async def delete_article(
     article_id: str,
     current_user: UserResponse = Depends(get_current_user_required),
     repo: ArticleRepository = Depends(get_article_repo),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
 ):
-    """Soft delete article."""
+    """Soft delete article, cancelling its generation job if still in progress."""
     article = _get_article_or_404(repo, article_id, check_deleted=False)
     _check_ownership(article, current_user, article_id, "delete")
 
+    if article.status == ArticleStatus.RUNNING:
+        await cancel_generation(repo, job_queue, article)
+
     success = repo.delete(article_id)
     if not success:
         raise HTTPException(status_code=503, detail="Failed to delete article")
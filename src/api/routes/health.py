@@ -1,27 +1,49 @@
-"""Health check endpoint."""
+"""Health check endpoints.
+
+- GET /health/live: liveness — process is up and serving (no dependency checks)
+- GET /health/ready: readiness — Redis/MongoDB status plus NLP model load state
+- GET /health: alias of readiness (kept for existing monitors)
+"""
 
 import logging
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
 
-from api.dependencies import get_job_queue
+from api.dependencies import get_job_queue, get_nlp_port
 from adapter.mongodb.connection import get_mongodb_client
-from port.job_queue import JobQueuePort
+from port.job_queue import AsyncJobQueuePort
+from port.nlp import NLPPort
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+@router.get("/live")
+async def liveness():
+    """Liveness probe: answers as soon as the app serves requests."""
+    return {"status": "alive", "timestamp": _timestamp()}
+
+
+@router.get("/ready")
 @router.get("")
 async def health(
-    job_queue: JobQueuePort = Depends(get_job_queue),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+    nlp: NLPPort = Depends(get_nlp_port),
 ):
-    """Health check endpoint with dependency status."""
+    """Readiness probe with dependency status.
+
+    Redis and MongoDB failures mark the service degraded (503). NLP load
+    state is reported only: lookups use the LLM path until models are ready.
+    """
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "timestamp": _timestamp(),
         "services": {}
     }
 
@@ -29,7 +51,7 @@ async def health(
 
     # Check Redis connection via port
     try:
-        if job_queue.ping():
+        if await job_queue.ping():
             health_status["services"]["redis"] = {
                 "status": "healthy",
                 "message": "Connection successful"
@@ -69,6 +91,20 @@ async def health(
         }
         overall_healthy = False
 
+    # Report NLP model load state (informational, never fails readiness)
+    try:
+        languages = nlp.load_state()
+        states = set(languages.values())
+        health_status["services"]["nlp"] = {
+            "status": next((s for s in ("ready", "loading", "failed") if s in states), "idle"),
+            "languages": languages,
+        }
+    except Exception as e:
+        health_status["services"]["nlp"] = {
+            "status": "unknown",
+            "message": f"State error: {str(e)[:200]}"
+        }
+
     # Update overall status
     if not overall_healthy:
         health_status["status"] = "degraded"
@@ -1,28 +1,41 @@
 """Job-related API routes."""
 
 import logging
-from fastapi import APIRouter, HTTPException, Depends
+import os
+from collections.abc import AsyncIterator
 
-from api.models import JobResponse
-from api.dependencies import get_job_queue
-from port.job_queue import JobQueuePort
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import Response, StreamingResponse
+
+from api.models import JobResponse, UserResponse
+from api.dependencies import get_article_repo, get_job_queue
+from api.security import get_current_user_required
+from domain.model.errors import JobActiveError
+from domain.model.job import TERMINAL_JOB_STATUSES
+from port.article_repository import ArticleRepository
+from port.job_queue import AsyncJobQueuePort
+from services.article_submission_service import (
+    RETRYABLE_JOB_STATUSES,
+    cancel_generation,
+    retry_generation,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+TERMINAL_STATUSES = TERMINAL_JOB_STATUSES
+# How long one Redis read waits for new events before a keep-alive is sent
+EVENTS_BLOCK_MS = int(os.getenv('JOB_EVENTS_BLOCK_MS', '15000'))
+# Open event streams per API process; keep within REDIS_STREAM_MAX_CONNECTIONS
+MAX_EVENT_STREAMS = int(os.getenv('JOB_EVENTS_MAX_STREAMS', '100'))
+# Seconds a client turned away should poll GET /jobs/{job_id} before reconnecting
+EVENTS_RETRY_AFTER = 30
 
-@router.get("/{job_id}", response_model=JobResponse)
-async def get_job_status(
-    job_id: str,
-    job_queue: JobQueuePort = Depends(get_job_queue),
-):
-    """Get job status by ID."""
-    status_data = job_queue.get_status(job_id)
+_open_streams = 0
 
-    if not status_data:
-        raise HTTPException(status_code=404, detail="Job not found")
 
+def _to_job_response(status_data: dict, job_id: str) -> JobResponse:
     return JobResponse(
         id=status_data.get('id', job_id),
         article_id=status_data.get('article_id'),
@@ -33,3 +46,187 @@ async def get_job_status(
         updated_at=status_data.get('updated_at'),
         error=status_data.get('error')
     )
+
+
+def _sse(status_data: dict, job_id: str, event_id: str | None = None) -> str:
+    """Format one job status as a Server-Sent Events message."""
+    data = _to_job_response(status_data, job_id).model_dump_json()
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: status\ndata: {data}\n\n"
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job_status(
+    job_id: str,
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Get job status by ID."""
+    status_data = await job_queue.get_status(job_id)
+
+    if not status_data:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return _to_job_response(status_data, job_id)
+
+
+@router.delete("/{job_id}")
+async def cancel_job(
+    job_id: str,
+    current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+    repo: ArticleRepository = Depends(get_article_repo),
+):
+    """Cancel a queued or running job.
+
+    A queued job is skipped by the worker; a running one stops after its
+    current CrewAI task. The article is marked failed.
+    """
+    status_data = await job_queue.get_status(job_id)
+    article_id = status_data.get('article_id') if status_data else None
+    article = repo.get_by_id(article_id) if article_id else None
+    if not article:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not article.is_owned_by(current_user.id):
+        logger.warning("Unauthorized cancel attempt", extra={"jobId": job_id, "requestUserId": current_user.id})
+        raise HTTPException(status_code=403, detail="You don't have permission to cancel this job")
+    if status_data.get('status') in TERMINAL_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job already {status_data['status']}")
+
+    if not await cancel_generation(repo, job_queue, article, status_data):
+        raise HTTPException(status_code=503, detail="Failed to cancel job")
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "article_id": article.id,
+        "message": "Job cancelled",
+    }
+
+
+@router.post("/{job_id}/retry")
+async def retry_job(
+    job_id: str,
+    current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+    repo: ArticleRepository = Depends(get_article_repo),
+):
+    """Retry a failed or cancelled job from its last checkpoint.
+
+    The job is requeued under the same id; CrewAI tasks that already
+    finished are not run again.
+    """
+    status_data = await job_queue.get_status(job_id)
+    article_id = status_data.get('article_id') if status_data else None
+    article = repo.get_by_id(article_id) if article_id else None
+    if not article:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not article.is_owned_by(current_user.id):
+        logger.warning("Unauthorized retry attempt", extra={"jobId": job_id, "requestUserId": current_user.id})
+        raise HTTPException(status_code=403, detail="You don't have permission to retry this job")
+    if status_data.get('status') not in RETRYABLE_JOB_STATUSES:
+        raise HTTPException(status_code=409, detail=f"Job is {status_data.get('status')}, only failed or cancelled jobs can be retried")
+
+    try:
+        retried = await retry_generation(repo, job_queue, article, status_data)
+    except JobActiveError:
+        raise HTTPException(status_code=409, detail="Job is still running, retry once it has stopped")
+    if not retried:
+        raise HTTPException(status_code=503, detail="Failed to retry job")
+
+    return {
+        "success": True,
+        "job_id": job_id,
+        "article_id": article.id,
+        "message": "Job requeued",
+    }
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    last_event_id: str | None = Header(None),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Push job status updates as Server-Sent Events until the job finishes.
+
+    Replays retained events on first connect; browsers reconnecting with
+    Last-Event-ID resume after the last event they received, or get 204
+    (stop reconnecting) once the job has finished and nothing is left to
+    send. Returns 503 once MAX_EVENT_STREAMS streams are open; clients then
+    poll the status.
+    """
+    global _open_streams
+    snapshot = await job_queue.get_status(job_id)
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Job not found")
+    events = await job_queue.read_events(job_id, last_event_id)
+    if last_event_id is not None and not events and snapshot.get('status') in TERMINAL_STATUSES:
+        return Response(status_code=204)
+    if _open_streams >= MAX_EVENT_STREAMS:
+        logger.warning("Too many open job event streams", extra={"jobId": job_id, "openStreams": _open_streams})
+        raise HTTPException(
+            status_code=503,
+            detail="Too many open event streams, poll the job status instead",
+            headers={"Retry-After": str(EVENTS_RETRY_AFTER)},
+        )
+
+    # Taken here, with no await since the check, so a burst cannot overshoot
+    # the cap; _EventStreamResponse frees it when the response ends
+    _open_streams += 1
+    return _EventStreamResponse(
+        _job_events(job_id, request, job_queue, snapshot, events, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+class _EventStreamResponse(StreamingResponse):
+    """Event stream that frees its MAX_EVENT_STREAMS slot when it ends.
+
+    Released here rather than in the generator, whose finally never runs
+    if the client disconnects before the body starts.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        global _open_streams
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            _open_streams -= 1
+
+
+async def _job_events(
+    job_id: str,
+    request: Request,
+    job_queue: AsyncJobQueuePort,
+    snapshot: dict,
+    events: list[tuple[str, dict]] | None,
+    last_event_id: str | None,
+) -> AsyncIterator[str]:
+    if events is None:
+        return
+
+    if not events:
+        if last_event_id is None:
+            # No retained events (e.g. job older than the stream): send current state
+            yield _sse(snapshot, job_id)
+        if snapshot.get('status') in TERMINAL_STATUSES:
+            return
+
+    cursor = last_event_id
+    while True:
+        for event_id, status_data in events:
+            cursor = event_id
+            yield _sse(status_data, job_id, event_id)
+            if status_data.get('status') in TERMINAL_STATUSES:
+                return
+
+        if await request.is_disconnected():
+            return
+
+        events = await job_queue.read_events(job_id, cursor, block_ms=EVENTS_BLOCK_MS)
+        if events is None:
+            return
+        if not events:
+            yield ": keep-alive\n\n"
@@ -0,0 +1,98 @@
+"""Scheduled article generation API routes.
+
+- POST /schedules: generate an article daily (or once) at a time of day
+- GET /schedules: list the current user's schedules
+- DELETE /schedules/{schedule_id}: remove a schedule
+
+The worker turns due schedules into jobs in the low-priority lane, so
+daily articles are generated off-peak and ready when the user opens the app.
+"""
+
+import logging
+from fastapi import APIRouter, Depends, HTTPException
+
+from api.dependencies import get_job_queue
+from api.models import ScheduleRequest, ScheduleResponse, UserResponse
+from api.security import get_current_user_required
+from domain.model.article import ArticleInputs
+from domain.model.schedule import Schedule
+from port.job_queue import AsyncJobQueuePort
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/schedules", tags=["schedules"])
+
+MAX_SCHEDULES_PER_USER = 10
+
+
+def _to_schedule_response(schedule: Schedule) -> ScheduleResponse:
+    return ScheduleResponse(
+        id=schedule.id,
+        language=schedule.inputs.language,
+        level=schedule.inputs.level,
+        length=schedule.inputs.length,
+        topic=schedule.inputs.topic,
+        time_utc=schedule.time_utc,
+        repeat_daily=schedule.repeat_daily,
+        created_at=schedule.created_at,
+        next_run_at=schedule.next_run(),
+    )
+
+
+async def _list_or_503(job_queue: AsyncJobQueuePort, user_id: str) -> list[Schedule]:
+    schedules = await job_queue.list_schedules(user_id)
+    if schedules is None:
+        raise HTTPException(status_code=503, detail="Schedule service unavailable")
+    return schedules
+
+
+@router.post("", response_model=ScheduleResponse, status_code=201)
+async def create_schedule(
+    request: ScheduleRequest,
+    current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Schedule article generation at a fixed UTC time of day."""
+    inputs = ArticleInputs(
+        language=request.language,
+        level=request.level,
+        length=request.length,
+        topic=request.topic,
+    )
+    schedule = Schedule.create(inputs, current_user.id, request.time_utc, request.repeat_daily)
+
+    saved = await job_queue.save_schedule(schedule, limit=MAX_SCHEDULES_PER_USER)
+    if saved is None:
+        raise HTTPException(status_code=503, detail="Failed to save schedule")
+    if not saved:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Schedule limit reached ({MAX_SCHEDULES_PER_USER} per user)",
+        )
+
+    logger.info("Schedule created", extra={
+        "scheduleId": schedule.id,
+        "userId": current_user.id,
+        "timeUtc": schedule.time_utc,
+    })
+    return _to_schedule_response(schedule)
+
+
+@router.get("", response_model=list[ScheduleResponse])
+async def list_schedules(
+    current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """List the current user's schedules, earliest time of day first."""
+    return [_to_schedule_response(s) for s in await _list_or_503(job_queue, current_user.id)]
+
+
+@router.delete("/{schedule_id}", status_code=204)
+async def delete_schedule(
+    schedule_id: str,
+    current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Delete one of the current user's schedules."""
+    if not await job_queue.delete_schedule(current_user.id, schedule_id):
+        raise HTTPException(status_code=404, detail="Schedule not found")
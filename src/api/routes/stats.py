@@ -9,7 +9,8 @@ from adapter.mongodb.stats import get_database_stats, get_vocabulary_stats
 from api.dependencies import get_job_queue
 from api.models import UserResponse
 from api.security import get_current_user_required
-from port.job_queue import JobQueuePort
+from port.job_queue import AsyncJobQueuePort
+from services.worker_scaling import recommend_worker_count
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,7 @@ router = APIRouter(prefix="/stats", tags=["stats"])
 @router.get("")
 async def get_database_stats(
     _current_user: UserResponse = Depends(get_current_user_required),
-    job_queue: JobQueuePort = Depends(get_job_queue),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
 ):
     """Get MongoDB database and Redis statistics."""
     client = get_mongodb_client()
@@ -32,9 +33,10 @@ async def get_database_stats(
         raise HTTPException(status_code=503, detail="Failed to retrieve database statistics")
 
     # Get job statistics via port
-    job_stats = job_queue.get_stats()
+    job_stats = await job_queue.get_stats()
     if job_stats:
         stats.update({f'job_{k}': v for k, v in job_stats.items()})
+    stats['job_lanes'] = await job_queue.get_lane_stats() or {}
 
     # Get vocabulary statistics
     vocab_stats = get_vocabulary_stats(db)
@@ -44,6 +46,21 @@ async def get_database_stats(
     return _render_stats_html(stats)
 
 
+@router.get("/queue")
+async def get_queue_metrics(
+    _current_user: UserResponse = Depends(get_current_user_required),
+    job_queue: AsyncJobQueuePort = Depends(get_job_queue),
+):
+    """Queue depth, oldest-job age, live workers, processing time and a worker-count recommendation.
+
+    Meant for autoscalers (e.g. a KEDA metrics-api trigger) and dashboards.
+    """
+    metrics = await job_queue.get_queue_metrics()
+    if metrics is None:
+        raise HTTPException(status_code=503, detail="Job queue unavailable")
+    return {**metrics, 'scaling': recommend_worker_count(metrics)}
+
+
 def _format_bytes(bytes_val: int) -> str:
     """Format bytes to human-readable string."""
     if bytes_val < 1024:
@@ -58,6 +75,22 @@ def _format_number(num: int) -> str:
     return f"{num:,}"
 
 
+def _render_lane_rows(lanes: dict) -> str:
+    """Render one table row per priority lane."""
+    if not lanes:
+        return '<tr><td colspan="4" class="py-2 text-gray-500">No lane data</td></tr>'
+    return "".join(
+        f"""
+                                <tr class="border-t border-gray-200">
+                                    <td class="py-2 font-medium text-gray-900">{lane}</td>
+                                    <td class="py-2">{_format_number(lane_stats.get('depth', 0))}</td>
+                                    <td class="py-2">{lane_stats.get('avg_wait_seconds', 0.0):.2f}s</td>
+                                    <td class="py-2">{lane_stats.get('max_wait_seconds', 0.0):.2f}s</td>
+                                </tr>"""
+        for lane, lane_stats in lanes.items()
+    )
+
+
 def _render_stats_html(stats: dict) -> HTMLResponse:
     """Render database statistics as HTML page."""
     html = f"""
@@ -211,6 +244,22 @@ def _render_stats_html(stats: dict) -> HTMLResponse:
                             </div>
                         </div>
                     </div>
+
+                    <div class="mb-8">
+                        <h3 class="text-xl font-semibold text-gray-900 mb-4">Priority Lanes</h3>
+                        <table class="w-full text-sm text-left text-gray-700">
+                            <thead>
+                                <tr class="text-gray-600">
+                                    <th class="py-2">Lane</th>
+                                    <th class="py-2">Pending</th>
+                                    <th class="py-2">Avg Wait</th>
+                                    <th class="py-2">Max Wait</th>
+                                </tr>
+                            </thead>
+                            <tbody>{_render_lane_rows(stats.get('job_lanes', {}))}
+                            </tbody>
+                        </table>
+                    </div>
                 </div>
             </div>
 
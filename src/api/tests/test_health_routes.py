@@ -0,0 +1,67 @@
+"""Tests for health check routes (liveness / readiness)."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.dependencies import get_job_queue, get_nlp_port
+from adapter.fake.job_queue import FakeAsyncJobQueueAdapter
+from adapter.fake.nlp import FakeNLPAdapter
+
+
+class TestHealthRoutes(unittest.TestCase):
+    """Tests for GET /health/live, /health/ready and /health."""
+
+    def setUp(self):
+        self.client = TestClient(app)
+        app.dependency_overrides[get_job_queue] = lambda: FakeAsyncJobQueueAdapter()
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_liveness_has_no_dependency_checks(self):
+        with patch('api.routes.health.get_mongodb_client') as mock_mongo:
+            response = self.client.get("/health/live")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "alive")
+        mock_mongo.assert_not_called()
+
+    @patch('api.routes.health.get_mongodb_client')
+    def test_readiness_reports_nlp_loading(self, mock_mongo):
+        mock_mongo.return_value = MagicMock()
+        app.dependency_overrides[get_nlp_port] = lambda: FakeNLPAdapter(
+            languages={"German"}, ready=False,
+        )
+
+        response = self.client.get("/health/ready")
+
+        self.assertEqual(response.status_code, 200)
+        nlp = response.json()["services"]["nlp"]
+        self.assertEqual(nlp["status"], "loading")
+        self.assertEqual(nlp["languages"], {"German": "loading"})
+
+    @patch('api.routes.health.get_mongodb_client')
+    def test_readiness_degraded_without_mongodb(self, mock_mongo):
+        mock_mongo.return_value = None
+        app.dependency_overrides[get_nlp_port] = lambda: FakeNLPAdapter(languages={"German"})
+
+        response = self.client.get("/health/ready")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["services"]["nlp"]["status"], "ready")
+
+    @patch('api.routes.health.get_mongodb_client')
+    def test_health_alias_matches_readiness(self, mock_mongo):
+        mock_mongo.return_value = MagicMock()
+        app.dependency_overrides[get_nlp_port] = lambda: FakeNLPAdapter(languages={"German"})
+
+        response = self.client.get("/health")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("nlp", response.json()["services"])
+
+
+if __name__ == '__main__':
+    unittest.main()
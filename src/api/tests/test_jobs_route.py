@@ -0,0 +1,239 @@
+"""Tests for job routes (status and SSE event stream)."""
+
+import asyncio
+import json
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+import api.routes.jobs as jobs_routes
+from api.main import app
+from api.models import UserResponse
+from api.security import get_current_user_required
+from api.dependencies import get_article_repo, get_job_queue
+from adapter.fake.article_repository import FakeArticleRepository
+from adapter.fake.job_queue import FakeAsyncJobQueueAdapter
+from domain.model.article import Article, ArticleInputs, ArticleStatus
+
+TEST_INPUTS = ArticleInputs(language='German', level='B2', length='500', topic='AI')
+
+
+def _events(body: str) -> list[dict]:
+    """Parse an SSE body into [{'id': ..., 'data': {...}}]."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event = {}
+        for line in block.splitlines():
+            if line.startswith("id: "):
+                event["id"] = line[4:]
+            elif line.startswith("data: "):
+                event["data"] = json.loads(line[6:])
+        if "data" in event:
+            events.append(event)
+    return events
+
+
+class TestJobRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        app.dependency_overrides[get_job_queue] = lambda: self.job_queue
+
+        inner = self.job_queue.inner
+        inner.update_status("job-1", "queued", 0, "Queued", article_id="art-1")
+        inner.update_status("job-1", "running", 40, "Writing")
+        inner.update_status("job-1", "completed", 100, "Done")
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_get_status(self):
+        response = self.client.get("/jobs/job-1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "completed")
+
+    def test_unknown_job_returns_404(self):
+        self.assertEqual(self.client.get("/jobs/missing").status_code, 404)
+        self.assertEqual(self.client.get("/jobs/missing/events").status_code, 404)
+
+    def test_events_replay_until_terminal_status(self):
+        response = self.client.get("/jobs/job-1/events")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/event-stream"))
+        events = _events(response.text)
+        self.assertEqual([e["data"]["status"] for e in events], ["queued", "running", "completed"])
+        self.assertEqual([e["id"] for e in events], ["1-0", "2-0", "3-0"])
+
+    def test_events_turn_clients_away_at_stream_cap(self):
+        with patch.object(jobs_routes, 'MAX_EVENT_STREAMS', 0):
+            response = self.client.get("/jobs/job-1/events")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["retry-after"], str(jobs_routes.EVENTS_RETRY_AFTER))
+
+    def test_finished_stream_frees_its_slot(self):
+        self.client.get("/jobs/job-1/events")
+
+        self.assertEqual(jobs_routes._open_streams, 0)
+
+    def test_events_resume_after_last_event_id(self):
+        response = self.client.get("/jobs/job-1/events", headers={"Last-Event-ID": "1-0"})
+
+        events = _events(response.text)
+        self.assertEqual([e["data"]["progress"] for e in events], [40, 100])
+
+    def test_reconnect_after_final_event_returns_204(self):
+        response = self.client.get("/jobs/job-1/events", headers={"Last-Event-ID": "3-0"})
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.text, "")
+        self.assertEqual(jobs_routes._open_streams, 0)
+
+    def test_stream_slot_taken_before_the_response_starts(self):
+        # A burst of requests must not all pass the cap before any stream runs
+        self.job_queue.inner.update_status("job-2", "running", 10, "Writing")
+
+        async def open_streams(count):
+            for _ in range(count):
+                await jobs_routes.stream_job_events("job-2", None, None, self.job_queue)
+
+        with patch.object(jobs_routes, 'MAX_EVENT_STREAMS', 2), patch.object(jobs_routes, '_open_streams', 0):
+            asyncio.run(open_streams(2))
+            self.assertEqual(jobs_routes._open_streams, 2)
+            with self.assertRaises(HTTPException) as raised:
+                asyncio.run(open_streams(1))
+
+        self.assertEqual(raised.exception.status_code, 503)
+
+    def test_job_without_events_sends_snapshot(self):
+        self.job_queue.events.clear()
+
+        response = self.client.get("/jobs/job-1/events")
+
+        events = _events(response.text)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["data"]["status"], "completed")
+        self.assertNotIn("id", events[0])
+
+
+
+def _user(user_id: str) -> UserResponse:
+    now = datetime.now(timezone.utc)
+    return UserResponse(
+        id=user_id, email=f"{user_id}@example.com", name="Test User",
+        created_at=now, updated_at=now, provider="email",
+    )
+
+
+class TestCancelJob(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        self.repo = FakeArticleRepository()
+        self.user = _user("user-1")
+        app.dependency_overrides[get_job_queue] = lambda: self.job_queue
+        app.dependency_overrides[get_article_repo] = lambda: self.repo
+        app.dependency_overrides[get_current_user_required] = lambda: self.user
+
+        self.article = Article.create(TEST_INPUTS, "user-1")
+        self.repo.save(self.article)
+        self.job_queue.inner.update_status(self.article.job_id, "queued", 0, "Queued", article_id=self.article.id)
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_cancel_queued_job(self):
+        response = self.client.delete(f"/jobs/{self.article.job_id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.job_queue.inner.is_cancelled(self.article.job_id))
+        self.assertEqual(self.job_queue.inner.get_status(self.article.job_id)["status"], "cancelled")
+        self.assertEqual(self.repo.get_by_id(self.article.id).status, ArticleStatus.FAILED)
+
+    def test_cannot_cancel_other_users_job(self):
+        self.user = _user("user-2")
+
+        self.assertEqual(self.client.delete(f"/jobs/{self.article.job_id}").status_code, 403)
+        self.assertFalse(self.job_queue.inner.is_cancelled(self.article.job_id))
+
+    def test_finished_job_conflicts(self):
+        self.job_queue.inner.update_status(self.article.job_id, "completed", 100, "Done")
+
+        self.assertEqual(self.client.delete(f"/jobs/{self.article.job_id}").status_code, 409)
+        self.assertEqual(self.client.delete("/jobs/missing").status_code, 404)
+
+    def test_deleting_article_cancels_its_job(self):
+        response = self.client.delete(f"/articles/{self.article.id}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(self.job_queue.inner.is_cancelled(self.article.job_id))
+        self.assertEqual(self.repo.get_by_id(self.article.id).status, ArticleStatus.DELETED)
+
+
+class TestRetryJob(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        self.repo = FakeArticleRepository()
+        self.user = _user("user-1")
+        app.dependency_overrides[get_job_queue] = lambda: self.job_queue
+        app.dependency_overrides[get_article_repo] = lambda: self.repo
+        app.dependency_overrides[get_current_user_required] = lambda: self.user
+
+        self.article = Article.create(TEST_INPUTS, "user-1")
+        self.repo.save(self.article)
+        self.repo.update_status(self.article.id, ArticleStatus.FAILED)
+        self.job_queue.inner.update_status(self.article.job_id, "failed", 50, "Task failed", article_id=self.article.id)
+        self.job_queue.inner.save_checkpoint(self.article.job_id, "find_news_articles", {"raw": "[]", "agent": "finder"})
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_retry_requeues_same_job_and_keeps_checkpoints(self):
+        response = self.client.post(f"/jobs/{self.article.job_id}/retry")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.job_queue.inner.get_status(self.article.job_id)["status"], "queued")
+        self.assertEqual(self.job_queue.inner.queue[-1].job_id, self.article.job_id)
+        self.assertIn("find_news_articles", self.job_queue.inner.load_checkpoints(self.article.job_id))
+        self.assertEqual(self.repo.get_by_id(self.article.id).status, ArticleStatus.RUNNING)
+
+    def test_retry_clears_cancel_flag(self):
+        self.client.delete(f"/jobs/{self.article.job_id}")
+        self.job_queue.inner.update_status(self.article.job_id, "cancelled", 0, "Job cancelled")
+
+        self.assertEqual(self.client.post(f"/jobs/{self.article.job_id}/retry").status_code, 200)
+        self.assertFalse(self.job_queue.inner.is_cancelled(self.article.job_id))
+
+    def test_only_failed_or_cancelled_jobs_retry(self):
+        self.job_queue.inner.update_status(self.article.job_id, "running", 50, "Working")
+
+        self.assertEqual(self.client.post(f"/jobs/{self.article.job_id}/retry").status_code, 409)
+        self.assertEqual(self.client.post("/jobs/missing/retry").status_code, 404)
+
+    def test_retry_of_a_job_not_yet_acked_conflicts(self):
+        self.job_queue.inner.enqueue(self.article)
+        self.job_queue.inner.dequeue()
+
+        response = self.client.post(f"/jobs/{self.article.job_id}/retry")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.job_queue.inner.get_status(self.article.job_id)["status"], "failed")
+        self.assertEqual(self.repo.get_by_id(self.article.id).status, ArticleStatus.FAILED)
+
+    def test_cannot_retry_other_users_job(self):
+        self.user = _user("user-2")
+
+        self.assertEqual(self.client.post(f"/jobs/{self.article.job_id}/retry").status_code, 403)
+        self.assertEqual(self.job_queue.inner.get_status(self.article.job_id)["status"], "failed")
+
+
+if __name__ == '__main__':
+    unittest.main()
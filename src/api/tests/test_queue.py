@@ -1,24 +1,34 @@
 """Comprehensive tests for Redis queue operations via RedisJobQueueAdapter."""
 
+import asyncio
+import importlib.util
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 import sys
 from pathlib import Path
 import json
+import time
 from datetime import datetime, timezone
+from redis.exceptions import RedisError
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from adapter.queue.redis_job_queue import RedisJobQueueAdapter
+from adapter.queue.async_redis_job_queue import AsyncRedisJobQueueAdapter
+from adapter.queue import connection, lanes, schedules, scripts, telemetry
+from adapter.queue.scripts import DEQUEUE_LUA, ENQUEUE_LUA, RECOVER_LUA, UPDATE_STATUS_LUA
 from adapter.fake.job_queue import FakeJobQueueAdapter
 from adapter.fake.article_repository import FakeArticleRepository
 from worker.processor import process_job
 from domain.model.article import Article, ArticleInputs, ArticleStatus
 from domain.model.job import JobContext
+from domain.model.schedule import Schedule
 
 TEST_INPUTS = ArticleInputs(language='German', level='B2', length='500', topic='AI')
 
+_HAS_FAKEREDIS_LUA = all(importlib.util.find_spec(m) for m in ("fakeredis", "lupa"))
+
 
 class TestQueueBasics(unittest.TestCase):
     """Basic queue operation tests using FakeJobQueueAdapter."""
@@ -114,61 +124,77 @@ class TestRedisAdapter(unittest.TestCase):
         result = self.adapter.enqueue(article)
 
         self.assertTrue(result)
-        mock_redis.rpush.assert_called_once()
+        mock_redis.register_script.return_value.assert_called_once()
 
     @patch.object(RedisJobQueueAdapter, '_get_client')
-    def test_update_and_get_status(self, mock_get_client):
+    def test_update_status_single_script_call(self, mock_get_client):
         mock_redis = MagicMock()
         mock_get_client.return_value = mock_redis
-        mock_redis.get.return_value = None
+        script = mock_redis.register_script.return_value
 
         result = self.adapter.update_status("job-1", "queued", 0, "Queued", article_id="art-1")
 
         self.assertTrue(result)
-        mock_redis.setex.assert_called_once()
+        script.assert_called_once()
+        mock_redis.get.assert_not_called()
+        mock_redis.setex.assert_not_called()
 
-        call_args = mock_redis.setex.call_args[0]
-        stored_data = json.loads(call_args[2])
-        self.assertEqual(stored_data['article_id'], 'art-1')
-        self.assertEqual(stored_data['id'], 'job-1')
+        kwargs = script.call_args.kwargs
+        self.assertEqual(kwargs['keys'][0], 'opad:job:job-1')
+        update = json.loads(kwargs['args'][0])
+        self.assertEqual(update['article_id'], 'art-1')
+        self.assertEqual(update['id'], 'job-1')
 
     @patch.object(RedisJobQueueAdapter, '_get_client')
-    def test_article_id_preservation(self, mock_get_client):
+    def test_update_script_registered_once(self, mock_get_client):
         mock_redis = MagicMock()
         mock_get_client.return_value = mock_redis
+        mock_redis.register_script.return_value.registered_client = mock_redis
 
-        existing_status = {
-            'id': 'job-1',
-            'article_id': 'existing-article',
-            'status': 'queued',
-            'progress': 0,
-        }
-        mock_redis.get.return_value = json.dumps(existing_status)
+        self.adapter.update_status("job-1", "running", 10, "a")
+        self.adapter.update_status("job-1", "running", 20, "b")
+
+        mock_redis.register_script.assert_called_once()
 
-        self.adapter.update_status("job-1", "running", 50, "Processing...")
+    @patch.object(RedisJobQueueAdapter, '_get_client')
+    def test_update_status_redis_error(self, mock_get_client):
+        from redis.exceptions import RedisError
+        mock_redis = MagicMock()
+        mock_get_client.return_value = mock_redis
+        mock_redis.register_script.return_value.side_effect = RedisError("down")
 
-        call_args = mock_redis.setex.call_args[0]
-        stored_data = json.loads(call_args[2])
-        self.assertEqual(stored_data['article_id'], 'existing-article')
+        self.assertFalse(self.adapter.update_status("job-1", "running", 10, "a"))
 
     @patch.object(RedisJobQueueAdapter, '_get_client')
-    def test_progress_preservation(self, mock_get_client):
-        """Test that progress is not reset when new progress is 0."""
+    def test_update_status_moves_job_between_stats_sets(self, mock_get_client):
         mock_redis = MagicMock()
         mock_get_client.return_value = mock_redis
+        script = mock_redis.register_script.return_value
 
-        existing_status = {
-            'id': 'job-1',
-            'status': 'running',
-            'progress': 75,
-        }
-        mock_redis.get.return_value = json.dumps(existing_status)
+        self.adapter.update_status("job-1", "running", 10, "a")
+
+        kwargs = script.call_args.kwargs
+        self.assertEqual(kwargs['keys'][2:], [
+            'opad:jobs:status:queued', 'opad:jobs:status:running',
+            'opad:jobs:status:completed', 'opad:jobs:status:failed',
+            'opad:jobs:status:cancelled',
+        ])
+        self.assertEqual(kwargs['args'][4:9], ['queued', 'running', 'completed', 'failed', 'cancelled'])
+        self.assertEqual(kwargs['args'][9:], ['opad:jobs:followers:job-1', 'opad:job:', 'opad:jobs:events:'])
 
-        self.adapter.update_status("job-1", "failed", 0, "Error")
+    @patch.object(RedisJobQueueAdapter, '_get_client')
+    def test_get_stats_reads_counters_without_scan(self, mock_get_client):
+        mock_redis = MagicMock()
+        mock_get_client.return_value = mock_redis
+        pipe = mock_redis.pipeline.return_value
+        # (trimmed, count) per status: queued, running, completed, failed, cancelled
+        pipe.execute.return_value = [0, 2, 0, 1, 3, 5, 0, 1, 0, 1]
 
-        call_args = mock_redis.setex.call_args[0]
-        stored_data = json.loads(call_args[2])
-        self.assertEqual(stored_data['progress'], 75)
+        stats = self.adapter.get_stats()
+
+        self.assertEqual(stats, {'queued': 2, 'running': 1, 'completed': 5, 'failed': 1, 'cancelled': 1, 'total': 10})
+        mock_redis.scan_iter.assert_not_called()
+        self.assertEqual(pipe.zcard.call_count, 5)
 
     @patch.object(RedisJobQueueAdapter, '_get_client')
     def test_ping_success(self, mock_get_client):
@@ -185,6 +211,693 @@ class TestRedisAdapter(unittest.TestCase):
         self.assertFalse(self.adapter.ping())
 
 
+class TestAsyncRedisAdapter(unittest.TestCase):
+    """Test AsyncRedisJobQueueAdapter with a mocked redis.asyncio client."""
+
+    def setUp(self):
+        self.redis = MagicMock()
+        self.redis.get = AsyncMock(return_value=None)
+        self.redis.ping = AsyncMock()
+        self.script = AsyncMock(return_value=0)
+        self.redis.register_script.return_value = self.script
+        self.adapter = AsyncRedisJobQueueAdapter(client=self.redis)
+
+    def test_enqueue(self):
+        article = Article.create(TEST_INPUTS, "user-1")
+
+        self.assertTrue(asyncio.run(self.adapter.enqueue(article)))
+        kwargs = self.script.call_args.kwargs
+        self.assertEqual(kwargs['keys'][0], "opad:jobs:lane:normal:user:user-1")
+        self.assertEqual(json.loads(kwargs['args'][0])["job_id"], article.job_id)
+
+    def test_enqueue_many_uses_one_pipeline(self):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1, 1, RedisError("boom")])
+        self.redis.pipeline.return_value = pipe
+        articles = [Article.create(TEST_INPUTS, "user-1"), Article.create(TEST_INPUTS, "user-2")]
+
+        result = asyncio.run(self.adapter.enqueue_many(articles, "Queued"))
+
+        self.assertEqual(result, [True, False])
+        self.redis.pipeline.assert_called_once_with(transaction=False)
+        self.assertEqual(self.script.await_count, 4)
+        self.assertTrue(all(call.kwargs['client'] is pipe for call in self.script.await_args_list))
+        pipe.execute.assert_awaited_once_with(raise_on_error=False)
+
+    def test_get_status(self):
+        self.redis.get.return_value = json.dumps({"id": "job-1", "status": "running"})
+
+        status = asyncio.run(self.adapter.get_status("job-1"))
+
+        self.assertEqual(status["status"], "running")
+        self.redis.get.assert_awaited_once_with("opad:job:job-1")
+
+    def test_update_status_uses_shared_script(self):
+        result = asyncio.run(self.adapter.update_status("job-1", "queued", 0, "Queued", article_id="art-1"))
+
+        self.assertTrue(result)
+        self.script.assert_awaited_once()
+        kwargs = self.script.call_args.kwargs
+        self.assertEqual(kwargs["keys"][0], "opad:job:job-1")
+        self.assertEqual(json.loads(kwargs["args"][0])["article_id"], "art-1")
+
+    def test_get_stats(self):
+        pipe = self.redis.pipeline.return_value
+        pipe.execute = AsyncMock(return_value=[0, 1, 0, 2, 0, 3, 0, 4])
+
+        stats = asyncio.run(self.adapter.get_stats())
+
+        self.assertEqual(stats, {"queued": 1, "running": 2, "completed": 3, "failed": 4, "total": 10})
+
+    def test_redis_errors_are_swallowed(self):
+        from redis.exceptions import ConnectionError
+        self.redis.get.side_effect = ConnectionError("down")
+        self.redis.ping.side_effect = ConnectionError("down")
+
+        self.assertIsNone(asyncio.run(self.adapter.get_status("job-1")))
+        self.assertFalse(asyncio.run(self.adapter.ping()))
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test the process-wide Redis clients in adapter.queue.connection."""
+
+    def setUp(self):
+        patcher = patch.multiple(connection, _client=None, REDIS_URL="redis://localhost:6379/0")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('adapter.queue.connection.redis.from_url')
+    def test_client_is_shared_and_health_checked(self, mock_from_url):
+        first = connection.get_redis_client()
+        second = connection.get_redis_client()
+
+        self.assertIs(first, second)
+        mock_from_url.assert_called_once()
+        options = mock_from_url.call_args.kwargs
+        self.assertEqual(options['health_check_interval'], connection.HEALTH_CHECK_INTERVAL)
+        first.ping.assert_not_called()
+
+    @patch('adapter.queue.connection.redis.from_url')
+    def test_adapters_do_not_ping_per_operation(self, mock_from_url):
+        client = mock_from_url.return_value
+        client.get.return_value = None
+        adapter = RedisJobQueueAdapter()
+
+        adapter.get_status("job-1")
+        adapter.get_status("job-2")
+
+        client.ping.assert_not_called()
+        self.assertEqual(client.get.call_count, 2)
+
+    def test_missing_url_returns_none(self):
+        with patch.object(connection, 'REDIS_URL', ''):
+            self.assertIsNone(connection.get_redis_client())
+
+
+class TestReliableQueue(unittest.TestCase):
+    """Test processing-list, heartbeat and stalled-job recovery with mocked Redis."""
+
+    def setUp(self):
+        self.adapter = RedisJobQueueAdapter(worker_id="w1", reliable=True, max_attempts=2)
+        self.redis = MagicMock()
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis.get.return_value = None
+        self.scripts = {
+            ENQUEUE_LUA: MagicMock(), DEQUEUE_LUA: MagicMock(), UPDATE_STATUS_LUA: MagicMock(),
+            RECOVER_LUA: MagicMock(),
+        }
+        self.redis.register_script.side_effect = lambda source: self.scripts[source]
+
+    @staticmethod
+    def _payload(job_id="job-1", attempts=0):
+        return json.dumps({
+            "job_id": job_id, "article_id": "art-1", "user_id": None,
+            "inputs": {"language": "German", "level": "B2", "length": "500", "topic": "AI"},
+            "attempts": attempts,
+        })
+
+    def test_dequeue_takes_job_via_script(self):
+        self.scripts[DEQUEUE_LUA].return_value = [self._payload(), "normal"]
+
+        ctx = self.adapter.dequeue()
+
+        self.assertEqual(ctx.job_id, "job-1")
+        kwargs = self.scripts[DEQUEUE_LUA].call_args.kwargs
+        self.assertIn("opad:jobs:processing:w1", kwargs['keys'])
+        self.assertEqual(kwargs['args'][2], '1')  # reliable
+        self.redis.blpop.assert_not_called()
+
+    def test_empty_queue_blocks_on_wake_list(self):
+        self.scripts[DEQUEUE_LUA].side_effect = [None, [self._payload(), "normal"]]
+        self.redis.blpop.return_value = ("opad:jobs:wake", "1")
+
+        ctx = self.adapter.dequeue(timeout=5)
+
+        self.assertEqual(ctx.job_id, "job-1")
+        self.redis.blpop.assert_called_once()
+        self.assertEqual(self.redis.blpop.call_args.args, ("opad:jobs:wake",))
+        self.assertLessEqual(self.redis.blpop.call_args.kwargs['timeout'], 5)
+
+    def test_lost_wakeup_keeps_waiting(self):
+        # Another worker took the job this wake token was for
+        self.scripts[DEQUEUE_LUA].side_effect = [None, None, [self._payload(), "normal"]]
+        self.redis.blpop.return_value = ("opad:jobs:wake", "1")
+
+        ctx = self.adapter.dequeue(timeout=5)
+
+        self.assertEqual(ctx.job_id, "job-1")
+        self.assertEqual(self.redis.blpop.call_count, 2)
+
+    def test_wait_timeout_returns_none(self):
+        self.scripts[DEQUEUE_LUA].return_value = None
+        self.redis.blpop.return_value = None
+
+        self.assertIsNone(self.adapter.dequeue(timeout=5))
+        self.redis.blpop.assert_called_once()
+
+    def test_ack_removes_job_from_processing_list(self):
+        raw = self._payload()
+        self.scripts[DEQUEUE_LUA].return_value = [raw, "normal"]
+        self.adapter.dequeue()
+        pipe = self.redis.pipeline.return_value
+
+        self.assertTrue(self.adapter.ack("job-1"))
+        pipe.lrem.assert_called_with("opad:jobs:processing:w1", 1, raw)
+        pipe.delete.assert_called_with("opad:heartbeat:job-1")
+
+    def test_unreliable_mode_skips_processing_list(self):
+        adapter = RedisJobQueueAdapter(worker_id="w1", reliable=False)
+        self.scripts[DEQUEUE_LUA].return_value = [self._payload(), "normal"]
+
+        self.assertEqual(adapter.dequeue().job_id, "job-1")
+        self.assertEqual(self.scripts[DEQUEUE_LUA].call_args.kwargs['args'][2], '0')
+
+    def test_recover_requeues_job_with_expired_heartbeat(self):
+        self.redis.smembers.return_value = {"w2"}
+        self.redis.lrange.return_value = [self._payload()]
+        self.scripts[RECOVER_LUA].return_value = 1
+
+        dead = self.adapter.recover_stalled()
+
+        self.assertEqual(dead, [])
+        kwargs = self.scripts[RECOVER_LUA].call_args.kwargs
+        self.assertEqual(kwargs['keys'][:3], ["opad:jobs:processing:w2", "opad:heartbeat:job-1", "opad:jobs:dead"])
+        self.assertEqual(kwargs['args'][0], self._payload())
+        requeued = json.loads(kwargs['args'][4])
+        self.assertEqual(requeued["attempts"], 1)
+        self.assertEqual(kwargs['args'][6], "front")
+        self.assertEqual(json.loads(kwargs['args'][-12])["status"], "queued")
+
+    def test_recover_skips_job_run_by_this_worker(self):
+        self.adapter._in_flight["job-1"] = self._payload()
+        self.redis.smembers.return_value = {"w1"}
+        self.redis.lrange.return_value = [self._payload()]
+
+        self.assertEqual(self.adapter.recover_stalled(), [])
+        self.scripts[RECOVER_LUA].assert_not_called()
+
+    def test_recover_dead_letters_after_max_attempts(self):
+        self.redis.smembers.return_value = {"w2"}
+        self.redis.lrange.return_value = [self._payload(attempts=1)]
+        self.scripts[RECOVER_LUA].return_value = 1
+
+        dead = self.adapter.recover_stalled()
+
+        self.assertEqual([ctx.article_id for ctx in dead], ["art-1"])
+        kwargs = self.scripts[RECOVER_LUA].call_args.kwargs
+        self.assertEqual(kwargs['args'][2:4], [0, 0])  # no enqueue
+        self.assertEqual(json.loads(kwargs['args'][1])["attempts"], 2)
+        self.assertEqual(json.loads(kwargs['args'][4])["status"], "failed")
+
+    def test_recover_skips_job_the_script_refused(self):
+        # Heartbeat still live, or another reaper took the job
+        self.redis.smembers.return_value = {"w2"}
+        self.redis.lrange.return_value = [self._payload(attempts=1)]
+        self.scripts[RECOVER_LUA].return_value = 0
+
+        self.assertEqual(self.adapter.recover_stalled(), [])
+        self.scripts[ENQUEUE_LUA].assert_not_called()
+
+
+class TestPriorityLanes(unittest.TestCase):
+    """Test lane selection, enqueue keys and lane metrics."""
+
+    def test_unknown_priority_uses_default_lane(self):
+        self.assertEqual(lanes.lane_for("high"), "high")
+        self.assertEqual(lanes.lane_for("urgent"), lanes.DEFAULT_LANE)
+        self.assertEqual(lanes.lane_for(None), lanes.DEFAULT_LANE)
+
+    def test_empty_lane_config_falls_back_to_defaults(self):
+        self.assertEqual(lanes.parse_lanes(" , "), lanes.DEFAULT_LANES)
+        self.assertEqual(lanes.parse_lanes("fast, slow,fast"), ("fast", "slow"))
+
+    def test_enqueue_call_targets_user_sub_queue(self):
+        call = scripts.enqueue_call({"job_id": "job-1", "user_id": "u1", "priority": "low"})
+
+        self.assertEqual(call['keys'][:2], ["opad:jobs:lane:low:user:u1", "opad:jobs:lane:low:ready"])
+        payload = json.loads(call['args'][0])
+        self.assertEqual(payload["priority"], "low")
+        self.assertIn("enqueued_ms", payload)
+
+    def test_anonymous_jobs_share_one_sub_queue(self):
+        call = scripts.enqueue_call({"job_id": "job-1", "user_id": None})
+
+        self.assertEqual(call['args'][1], lanes.ANONYMOUS_USER)
+
+    def test_lane_stats_cumulative_buckets(self):
+        results = []
+        for lane in lanes.LANES:
+            if lane == "normal":
+                results += ["3", {"count": "4", "sum_ms": "8000", "max_ms": "5000", "le_1": "2", "le_10": "2"}]
+            else:
+                results += [None, {}]
+
+        stats = lanes.lane_stats_from_results(results)["normal"]
+
+        self.assertEqual(stats["depth"], 3)
+        self.assertEqual(stats["avg_wait_seconds"], 2.0)
+        self.assertEqual(stats["max_wait_seconds"], 5.0)
+        self.assertEqual(stats["wait_buckets"]["1"], 2)
+        self.assertEqual(stats["wait_buckets"]["10"], 4)
+        self.assertEqual(stats["wait_buckets"]["+Inf"], 4)
+
+    @patch.object(RedisJobQueueAdapter, '_get_client')
+    def test_enqueue_passes_priority(self, mock_get_client):
+        mock_redis = MagicMock()
+        mock_get_client.return_value = mock_redis
+        script = mock_redis.register_script.return_value
+
+        RedisJobQueueAdapter().enqueue(Article.create(TEST_INPUTS, "u1"), priority="high")
+
+        self.assertEqual(script.call_args.kwargs['keys'][0], "opad:jobs:lane:high:user:u1")
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestLaneScheduling(unittest.TestCase):
+    """Run the lane Lua scripts against fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+
+    def _drain(self):
+        users = []
+        while (ctx := self.adapter.dequeue(timeout=0)) is not None:
+            users.append(ctx.user_id)
+            self.adapter.ack(ctx.job_id)
+        return users
+
+    def test_round_robin_across_users(self):
+        for user in ["alice"] * 3 + ["bob", "carol"]:
+            self.adapter.enqueue(Article.create(TEST_INPUTS, user))
+
+        self.assertEqual(self._drain(), ["alice", "bob", "carol", "alice", "alice"])
+
+    def test_higher_lane_served_first(self):
+        self.adapter.enqueue(Article.create(TEST_INPUTS, "alice"), priority="low")
+        self.adapter.enqueue(Article.create(TEST_INPUTS, "bob"))
+        self.adapter.enqueue(Article.create(TEST_INPUTS, "carol"), priority="high")
+
+        self.assertEqual(self._drain(), ["carol", "bob", "alice"])
+        self.assertEqual(self.adapter.get_lane_stats()["high"]["dequeued"], 1)
+        self.assertEqual(self.redis.llen("opad:jobs:processing:w1"), 0)
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestCancelAndRetry(unittest.TestCase):
+    """A cancelled then retried job runs once (fakeredis)."""
+
+    def setUp(self):
+        import fakeredis
+        server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+        self.async_adapter = AsyncRedisJobQueueAdapter(
+            client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True),
+        )
+        self.article = Article.create(TEST_INPUTS, "alice")
+
+    def _job_ids(self):
+        job_ids = []
+        while (ctx := self.adapter.dequeue(timeout=0)) is not None:
+            job_ids.append(ctx.job_id)
+            self.adapter.ack(ctx.job_id)
+        return job_ids
+
+    def test_cancel_removes_queued_job_so_retry_queues_it_once(self):
+        self.adapter.enqueue(self.article)
+
+        asyncio.run(self.async_adapter.cancel(self.article.job_id, self.article.id, user_id="alice"))
+        self.assertEqual(self.adapter.get_lane_stats()["normal"]["depth"], 0)
+        self.assertTrue(asyncio.run(self.async_adapter.retry(self.article)))
+
+        self.assertFalse(self.adapter.is_cancelled(self.article.job_id))
+        self.assertEqual(self.adapter.get_status(self.article.job_id)["status"], "queued")
+        self.assertEqual(self._job_ids(), [self.article.job_id])
+
+    def test_retry_is_refused_while_the_job_is_still_running(self):
+        self.adapter.enqueue(self.article)
+        self.adapter.dequeue(timeout=0)
+        asyncio.run(self.async_adapter.cancel(self.article.job_id, self.article.id, user_id="alice"))
+
+        self.assertFalse(asyncio.run(self.async_adapter.retry(self.article)))
+
+        self.assertTrue(self.adapter.is_cancelled(self.article.job_id))
+        self.assertEqual(self.adapter.get_status(self.article.job_id)["status"], "cancelled")
+        self.assertEqual(self._job_ids(), [])
+
+        self.adapter.ack(self.article.job_id)
+        self.assertTrue(asyncio.run(self.async_adapter.retry(self.article)))
+        self.assertEqual(self._job_ids(), [self.article.job_id])
+
+    def test_cancelling_a_users_last_job_keeps_round_robin_fair(self):
+        first = Article.create(TEST_INPUTS, "alice")
+        bob = [Article.create(TEST_INPUTS, "bob") for _ in range(3)]
+        for article in [first, *bob]:
+            self.adapter.enqueue(article)
+        asyncio.run(self.async_adapter.cancel(first.job_id, first.id, user_id="alice"))
+        alice = [Article.create(TEST_INPUTS, "alice") for _ in range(3)]
+        for article in alice:
+            self.adapter.enqueue(article)
+
+        self.assertEqual(self.redis.lrange("opad:jobs:lane:normal:ready", 0, -1), ["bob", "alice"])
+        self.assertEqual(
+            self._job_ids(),
+            [bob[0].job_id, alice[0].job_id, bob[1].job_id, alice[1].job_id, bob[2].job_id, alice[2].job_id],
+        )
+
+    def test_enqueue_skips_job_already_pending(self):
+        self.adapter.enqueue(self.article)
+        self.adapter.enqueue(self.article)
+
+        self.assertEqual(self._job_ids(), [self.article.job_id])
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestStalledRecovery(unittest.TestCase):
+    """Run the recovery script against fakeredis."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.worker = RedisJobQueueAdapter(worker_id="w2", reliable=True, max_attempts=2)
+        self.reaper = RedisJobQueueAdapter(worker_id="w1", reliable=True, max_attempts=2)
+        self.article = Article.create(TEST_INPUTS, "alice")
+        self.worker.enqueue(self.article)
+        self.worker.dequeue(timeout=0)
+
+    def test_running_job_is_left_alone(self):
+        self.assertEqual(self.reaper.recover_stalled(), [])
+
+        self.assertEqual(self.redis.llen("opad:jobs:processing:w2"), 1)
+        self.assertEqual(self.worker.get_lane_stats()["normal"]["depth"], 0)
+
+    def test_stalled_job_is_requeued_once(self):
+        self.redis.delete(f"opad:heartbeat:{self.article.job_id}")
+
+        self.assertEqual(self.reaper.recover_stalled(), [])
+        self.assertEqual(self.reaper.recover_stalled(), [])
+
+        self.assertEqual(self.redis.llen("opad:jobs:processing:w2"), 0)
+        self.assertEqual(self.reaper.get_status(self.article.job_id)["status"], "queued")
+        ctx = self.reaper.dequeue(timeout=0)
+        self.assertEqual((ctx.job_id, ctx.attempts), (self.article.job_id, 1))
+        self.assertIsNone(self.reaper.dequeue(timeout=0))
+
+    def test_stalled_job_is_dead_lettered_after_max_attempts(self):
+        for _ in range(2):
+            self.redis.delete(f"opad:heartbeat:{self.article.job_id}")
+            dead = self.reaper.recover_stalled()
+            self.worker.dequeue(timeout=0)
+
+        self.assertEqual([ctx.job_id for ctx in dead], [self.article.job_id])
+        self.assertEqual(self.redis.llen("opad:jobs:dead"), 1)
+        self.assertEqual(self.reaper.get_status(self.article.job_id)["status"], "failed")
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestScheduleClaims(unittest.TestCase):
+    """Run the schedule claim script against fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+
+    def _store(self, repeat_daily, days_overdue=0):
+        schedule = Schedule.create(TEST_INPUTS, "u1", "06:00", repeat_daily)
+        self.redis.register_script(scripts.SAVE_SCHEDULE_LUA)(**scripts.save_schedule_call(schedule))
+        due_ms = int(time.time() * 1000) - 1000 - days_overdue * 86_400_000
+        self.redis.zadd(schedules.DUE_KEY, {schedule.id: due_ms})
+        return schedule, due_ms
+
+    def test_daily_schedule_claimed_once_per_run(self):
+        schedule, due_ms = self._store(True, days_overdue=3)
+
+        self.assertEqual([s.id for s in self.adapter.claim_due_schedules()], [schedule.id])
+        self.assertEqual(self.adapter.claim_due_schedules(), [])
+        next_ms = self.redis.zscore(schedules.DUE_KEY, schedule.id)
+        self.assertEqual((next_ms - due_ms) % 86_400_000, 0)
+        self.assertGreater(next_ms, time.time() * 1000)
+
+    def test_one_off_schedule_removed_when_claimed(self):
+        schedule, _ = self._store(False)
+
+        self.assertEqual(len(self.adapter.claim_due_schedules()), 1)
+        self.assertIsNone(self.redis.hget(schedules.SCHEDULES_KEY, schedule.id))
+        self.assertEqual(self.redis.smembers(schedules.user_schedules_key("u1")), set())
+
+    def test_released_run_is_claimed_again_at_its_time_of_day(self):
+        schedule, _ = self._store(True)
+        claimed = self.adapter.claim_due_schedules()
+
+        self.assertTrue(self.adapter.release_schedule(claimed[0]))
+
+        run_ms = self.redis.zscore(schedules.DUE_KEY, schedule.id)
+        self.assertEqual(run_ms, schedule.last_run().timestamp() * 1000)
+        self.assertEqual([s.id for s in self.adapter.claim_due_schedules()], [schedule.id])
+
+    def test_released_one_off_schedule_is_restored(self):
+        schedule, _ = self._store(False)
+        claimed = self.adapter.claim_due_schedules()
+
+        self.adapter.release_schedule(claimed[0])
+
+        self.assertEqual(self.redis.smembers(schedules.user_schedules_key("u1")), {schedule.id})
+        self.assertEqual([s.id for s in self.adapter.claim_due_schedules()], [schedule.id])
+
+    def test_release_does_not_revive_a_deleted_daily_schedule(self):
+        schedule, _ = self._store(True)
+        claimed = self.adapter.claim_due_schedules()
+        self.redis.zrem(schedules.DUE_KEY, schedule.id)
+
+        self.adapter.release_schedule(claimed[0])
+
+        self.assertIsNone(self.redis.zscore(schedules.DUE_KEY, schedule.id))
+
+    def test_save_stops_at_the_per_user_limit(self):
+        import fakeredis
+        async_adapter = AsyncRedisJobQueueAdapter(client=fakeredis.aioredis.FakeRedis(decode_responses=True))
+
+        async def save_concurrently():
+            return await asyncio.gather(*(
+                async_adapter.save_schedule(Schedule.create(TEST_INPUTS, "u1", "06:00"), limit=2)
+                for _ in range(4)
+            ))
+
+        self.assertEqual(sorted(asyncio.run(save_concurrently())), [False, False, True, True])
+
+    def test_periodic_task_claimed_by_one_worker_per_window(self):
+        other = RedisJobQueueAdapter(worker_id="w2")
+
+        self.assertTrue(self.adapter.claim_periodic("article-pool-refill", 600))
+        self.assertFalse(other.claim_periodic("article-pool-refill", 600))
+        self.assertTrue(other.claim_periodic("another-task", 600))
+        self.assertLessEqual(self.redis.ttl("opad:jobs:claim:article-pool-refill"), 600)
+
+
+class TestQueueTelemetry(unittest.TestCase):
+    """Test heartbeat/runtime commands and queue metrics parsing."""
+
+    def test_runtime_commands_pick_bucket(self):
+        pipe = MagicMock()
+
+        telemetry.queue_runtime_commands(pipe, 95.5, 'completed')
+
+        fields = [c.args[1] for c in pipe.hincrby.call_args_list]
+        self.assertEqual(fields, ['count', 'sum_ms', 'le_120', 'status_completed'])
+        self.assertEqual(pipe.hincrby.call_args_list[1].args[2], 95500)
+
+    def test_heartbeat_commands_expire_worker_info(self):
+        pipe = MagicMock()
+
+        telemetry.queue_heartbeat_commands(pipe, 'w1', 4, ['job-1'])
+
+        key, raw = pipe.set.call_args.args
+        self.assertEqual(key, 'opad:workers:info:w1')
+        self.assertEqual(json.loads(raw)['in_flight'], ['job-1'])
+        self.assertEqual(pipe.set.call_args.kwargs['ex'], telemetry.WORKER_INFO_TTL)
+
+    def test_metrics_from_results(self):
+        now_ms = int(time.time() * 1000)
+        results = []
+        for lane in lanes.LANES:
+            if lane == 'normal':
+                results += ['2', [('job-1', now_ms - 30_000)]]
+            else:
+                results += [None, []]
+        results += [0, ['w1', 'w2'], {'count': '2', 'sum_ms': '300000', 'le_120': '1', 'le_300': '1', 'status_failed': '1'}]
+        infos = [
+            json.dumps({'worker_id': 'w1', 'concurrency': 4, 'in_flight': ['a', 'b']}),
+            None,  # expired between the two round trips
+        ]
+
+        self.assertEqual(telemetry.worker_info_keys(results), ['opad:workers:info:w1', 'opad:workers:info:w2'])
+        metrics = telemetry.metrics_from_results(results, infos)
+
+        self.assertEqual(metrics['depth'], 2)
+        self.assertAlmostEqual(metrics['oldest_age_seconds'], 30, delta=1)
+        self.assertEqual((metrics['workers'], metrics['slots'], metrics['in_flight']), (1, 4, 2))
+        self.assertEqual(metrics['processing_time']['avg_seconds'], 150.0)
+        self.assertEqual(metrics['processing_time']['buckets']['300'], 2)
+        self.assertEqual(metrics['processing_time']['failed'], 1)
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestQueueMetrics(unittest.TestCase):
+    """Read queue metrics from fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+
+    def test_metrics_track_pending_workers_and_runtime(self):
+        first = Article.create(TEST_INPUTS, "alice")
+        self.adapter.enqueue(first)
+        self.adapter.enqueue(Article.create(TEST_INPUTS, "bob"), priority="high")
+        ctx = self.adapter.dequeue(timeout=0)
+        self.adapter.publish_worker_heartbeat(2, [ctx.job_id])
+        self.adapter.record_processing_time(90, 'completed')
+
+        metrics = self.adapter.get_queue_metrics()
+
+        self.assertEqual(metrics['depth'], 1)
+        self.assertEqual(self.redis.zrange(f"{lanes.LANE_PREFIX}high:pending", 0, -1), [])
+        self.assertEqual(self.redis.zrange(f"{lanes.LANE_PREFIX}normal:pending", 0, -1), [first.job_id])
+        self.assertEqual((metrics['workers'], metrics['slots'], metrics['in_flight']), (1, 2, 1))
+        self.assertEqual(metrics['processing_time']['completed'], 1)
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestCheckpoints(unittest.TestCase):
+    """Store task checkpoints in fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+
+    def test_checkpoint_roundtrip(self):
+        self.adapter.save_checkpoint("job-1", "find_news_articles", {"raw": "[]", "agent": "finder"})
+        self.adapter.save_checkpoint("job-1", "pick_best_article", {"raw": "{}", "agent": "picker"})
+
+        checkpoints = self.adapter.load_checkpoints("job-1")
+
+        self.assertEqual(checkpoints["pick_best_article"], {"raw": "{}", "agent": "picker"})
+        self.assertGreater(self.redis.ttl("opad:jobs:checkpoint:job-1"), 0)
+        self.assertTrue(self.adapter.clear_checkpoints("job-1"))
+        self.assertEqual(self.adapter.load_checkpoints("job-1"), {})
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestInflightFanIn(unittest.TestCase):
+    """Attach identical requests to one job and fan its status out (fakeredis)."""
+
+    def setUp(self):
+        import fakeredis
+        server = fakeredis.FakeServer()
+        self.redis = fakeredis.FakeRedis(server=server, decode_responses=True)
+        patcher = patch.object(RedisJobQueueAdapter, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = RedisJobQueueAdapter(worker_id="w1")
+        self.async_adapter = AsyncRedisJobQueueAdapter(
+            client=fakeredis.aioredis.FakeRedis(server=server, decode_responses=True),
+        )
+        self.leader = Article.create(TEST_INPUTS, 'user-1')
+        self.follower = Article.create(ArticleInputs('german', 'B2', '500', ' ai '), 'user-2')
+
+    def _join(self, article, attach):
+        async def run():
+            await self.async_adapter.update_status(article.job_id, 'queued', 0, 'queued', article_id=article.id)
+            return await self.async_adapter.join_inflight(article, attach)
+        return asyncio.run(run())
+
+    def test_follower_receives_leader_progress_but_not_terminal_status(self):
+        self.assertIsNone(self._join(self.leader, attach=True))
+        self.assertEqual(self._join(self.follower, attach=True), self.leader.job_id)
+
+        self.adapter.update_status(self.leader.job_id, 'running', 40, 'Writing')
+        follower_status = self.adapter.get_status(self.follower.job_id)
+        self.assertEqual((follower_status['status'], follower_status['progress']), ('running', 40))
+        self.assertEqual(follower_status['article_id'], self.follower.id)
+
+        self.adapter.update_status(self.leader.job_id, 'cancelled', 0, 'Job cancelled')
+
+        self.assertEqual(self.adapter.get_status(self.follower.job_id)['status'], 'running')
+        self.assertIsNone(self.redis.zscore('opad:jobs:status:cancelled', self.follower.job_id))
+
+    def test_close_detaches_followers(self):
+        self._join(self.leader, attach=True)
+        self._join(self.follower, attach=True)
+
+        followers = asyncio.run(self.async_adapter.close_inflight(self.leader.job_id, TEST_INPUTS))
+
+        self.assertEqual([f['article_id'] for f in followers], [self.follower.id])
+        self.assertFalse(self.redis.exists(f'opad:jobs:followers:{self.leader.job_id}'))
+        self.assertFalse(self.redis.exists(f'opad:jobs:inflight:{TEST_INPUTS.fingerprint}'))
+        self.assertEqual(self.adapter.close_inflight(self.leader.job_id, TEST_INPUTS), [])
+
+    def test_without_attach_or_after_leader_ends_registers_itself(self):
+        self._join(self.leader, attach=False)
+        self.assertIsNone(self._join(self.follower, attach=False))
+
+        self.adapter.update_status(self.leader.job_id, 'failed', 0, 'Boom')
+        self.assertIsNone(self._join(self.follower, attach=True))
+        self.assertEqual(self.redis.get(f'opad:jobs:inflight:{TEST_INPUTS.fingerprint}'), self.follower.job_id)
+
+    def test_cancelled_follower_keeps_its_status(self):
+        self._join(self.leader, attach=True)
+        self._join(self.follower, attach=True)
+        self.adapter.update_status(self.follower.job_id, 'cancelled', 0, 'Job cancelled')
+
+        self.adapter.update_status(self.leader.job_id, 'running', 10, 'Working')
+
+        self.assertEqual(self.adapter.get_status(self.follower.job_id)['status'], 'cancelled')
+
+
 class TestJobStatusFields(unittest.TestCase):
     """Test job status field storage and preservation using FakeJobQueueAdapter."""
 
@@ -0,0 +1,74 @@
+"""Tests for scheduled generation routes."""
+
+import unittest
+from datetime import datetime, timezone
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.models import UserResponse
+from api.security import get_current_user_required
+from api.dependencies import get_job_queue
+from api.routes.schedules import MAX_SCHEDULES_PER_USER
+from adapter.fake.job_queue import FakeAsyncJobQueueAdapter
+
+SCHEDULE = {
+    "language": "German", "level": "B2", "length": "500", "topic": "AI",
+    "time_utc": "06:30",
+}
+
+
+def _user(user_id: str) -> UserResponse:
+    now = datetime.now(timezone.utc)
+    return UserResponse(
+        id=user_id, email=f"{user_id}@example.com", name="Test User",
+        created_at=now, updated_at=now, provider="email",
+    )
+
+
+class TestScheduleRoutes(unittest.TestCase):
+
+    def setUp(self):
+        self.client = TestClient(app)
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        self.user = _user("user-1")
+        app.dependency_overrides[get_job_queue] = lambda: self.job_queue
+        app.dependency_overrides[get_current_user_required] = lambda: self.user
+
+    def tearDown(self):
+        app.dependency_overrides.clear()
+
+    def test_create_and_list_schedule(self):
+        response = self.client.post("/schedules", json=SCHEDULE)
+
+        self.assertEqual(response.status_code, 201)
+        body = response.json()
+        self.assertTrue(body["repeat_daily"])
+        self.assertIn("T06:30:00", body["next_run_at"])
+
+        listed = self.client.get("/schedules").json()
+        self.assertEqual([s["id"] for s in listed], [body["id"]])
+
+    def test_invalid_time_rejected(self):
+        response = self.client.post("/schedules", json={**SCHEDULE, "time_utc": "25:00"})
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_schedule_limit(self):
+        for _ in range(MAX_SCHEDULES_PER_USER):
+            self.client.post("/schedules", json=SCHEDULE)
+
+        self.assertEqual(self.client.post("/schedules", json=SCHEDULE).status_code, 409)
+
+    def test_cannot_delete_other_users_schedule(self):
+        schedule_id = self.client.post("/schedules", json=SCHEDULE).json()["id"]
+
+        self.user = _user("user-2")
+        self.assertEqual(self.client.delete(f"/schedules/{schedule_id}").status_code, 404)
+
+        self.user = _user("user-1")
+        self.assertEqual(self.client.delete(f"/schedules/{schedule_id}").status_code, 204)
+        self.assertEqual(self.client.get("/schedules").json(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
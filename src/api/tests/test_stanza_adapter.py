@@ -0,0 +1,307 @@
+"""Unit tests for StanzaAdapter two-stage parsing and pipeline registry.
+
+Stanza pipelines are replaced with stand-ins that build documents from
+preset token tuples, so these tests run without the Stanza models.
+"""
+
+import asyncio
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from adapter.nlp.stanza import StanzaAdapter, _LANGUAGE_SPECS, _LanguagePipelines
+
+
+def _word(id, text, lemma, upos, xpos, head=0, deprel=None, feats=None):
+    return SimpleNamespace(
+        id=id, text=text, lemma=lemma, upos=upos, xpos=xpos,
+        head=head, deprel=deprel, feats=feats,
+    )
+
+
+class _FakeTagger:
+    """Tags the sentence but leaves dependency fields unset."""
+
+    def __init__(self, words):
+        self.words = words
+        self.calls = 0
+
+    def __call__(self, sentence):
+        self.calls += 1
+        untagged = [
+            SimpleNamespace(**{**vars(w), "head": None, "deprel": None})
+            for w in self.words
+        ]
+        return SimpleNamespace(sentences=[SimpleNamespace(words=untagged)])
+
+
+class _FakeParser:
+    """Fills head/deprel in place, like depparse on a pre-tagged document."""
+
+    def __init__(self, words):
+        self.by_id = {w.id: w for w in words}
+        self.calls = 0
+
+    def __call__(self, doc):
+        self.calls += 1
+        for sentence in doc.sentences:
+            for w in sentence.words:
+                w.head = self.by_id[w.id].head
+                w.deprel = self.by_id[w.id].deprel
+        return doc
+
+
+# "Er hängt von Faktoren ab."
+SEPARABLE_SENTENCE = [
+    _word(1, "Er", "er", "PRON", "PPER", head=2, deprel="nsubj"),
+    _word(2, "hängt", "hängen", "VERB", "VVFIN", head=0, deprel="root"),
+    _word(3, "von", "von", "ADP", "APPR", head=4, deprel="case"),
+    _word(4, "Faktoren", "Faktor", "NOUN", "NN", head=2, deprel="obl",
+          feats="Case=Dat|Gender=Masc|Number=Plur"),
+    _word(5, "ab", "ab", "ADP", "PTKVZ", head=2, deprel="compound:prt"),
+]
+
+
+def _install(adapter, language, tagger, parser=None):
+    """Register stand-in pipelines for a language."""
+    adapter._pipelines[language] = _LanguagePipelines(
+        spec=_LANGUAGE_SPECS[language], tagger=tagger, parser=parser,
+    )
+
+
+class TestTwoStageExtraction(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = StanzaAdapter(two_stage=True)
+        self.tagger = _FakeTagger(SEPARABLE_SENTENCE)
+        self.parser = _FakeParser(SEPARABLE_SENTENCE)
+        _install(self.adapter, "German", self.tagger, self.parser)
+
+    def test_noun_skips_depparse(self):
+        info = asyncio.run(self.adapter.extract("Faktoren", "Er hängt von Faktoren ab."))
+
+        self.assertEqual(self.parser.calls, 0)
+        self.assertEqual(info["lemma"], "Faktor")
+        self.assertEqual(info["gender"], "der")
+        self.assertIsNone(info["prefix"])
+        self.assertEqual(info["parts"], ["Faktoren"])
+
+    def test_verb_runs_depparse(self):
+        info = asyncio.run(self.adapter.extract("hängt", "Er hängt von Faktoren ab."))
+
+        self.assertEqual(self.parser.calls, 1)
+        self.assertEqual(info["prefix"], "ab")
+        self.assertEqual(info["parts"], ["hängt", "ab"])
+
+    def test_separable_prefix_runs_depparse(self):
+        asyncio.run(self.adapter.extract("ab", "Er hängt von Faktoren ab."))
+
+        self.assertEqual(self.parser.calls, 1)
+
+    def test_depparse_error_returns_none(self):
+        def broken_parser(doc):
+            raise RuntimeError("boom")
+        self.adapter._pipelines["German"].parser = broken_parser
+
+        info = asyncio.run(self.adapter.extract("hängt", "Er hängt von Faktoren ab."))
+
+        self.assertIsNone(info)
+
+    def test_unmatched_word_returns_none(self):
+        info = asyncio.run(self.adapter.extract("Haus", "Er hängt von Faktoren ab."))
+
+        self.assertIsNone(info)
+        self.assertEqual(self.parser.calls, 0)
+
+
+class TestSingleStageExtraction(unittest.TestCase):
+
+    def test_full_pipeline_does_not_use_parser(self):
+        adapter = StanzaAdapter(two_stage=False)
+        parser = _FakeParser(SEPARABLE_SENTENCE)
+
+        def full_pipeline(sentence):
+            return SimpleNamespace(sentences=[SimpleNamespace(words=SEPARABLE_SENTENCE)])
+
+        _install(adapter, "German", full_pipeline, parser)
+
+        info = asyncio.run(adapter.extract("hängt", "Er hängt von Faktoren ab."))
+
+        self.assertEqual(parser.calls, 0)
+        self.assertEqual(info["prefix"], "ab")
+
+
+# "She gave it up."
+PHRASAL_SENTENCE = [
+    _word(1, "She", "she", "PRON", "PRP", head=2, deprel="nsubj"),
+    _word(2, "gave", "give", "VERB", "VBD", head=0, deprel="root"),
+    _word(3, "it", "it", "PRON", "PRP", head=2, deprel="obj"),
+    _word(4, "up", "up", "ADP", "RP", head=2, deprel="compound:prt"),
+]
+
+# "Elle se lève tôt."
+FRENCH_REFLEXIVE_SENTENCE = [
+    _word(1, "Elle", "il", "PRON", None, head=3, deprel="nsubj"),
+    _word(2, "se", "se", "PRON", None, head=3, deprel="expl:comp",
+          feats="Person=3|PronType=Prs|Reflex=Yes"),
+    _word(3, "lève", "lever", "VERB", None, head=0, deprel="root"),
+    _word(4, "tôt", "tôt", "ADV", None, head=3, deprel="advmod"),
+]
+
+
+class TestLanguageRules(unittest.TestCase):
+
+    def test_english_particle(self):
+        adapter = StanzaAdapter()
+        _install(adapter, "English", _FakeTagger(PHRASAL_SENTENCE), _FakeParser(PHRASAL_SENTENCE))
+
+        info = asyncio.run(adapter.extract("gave", "She gave it up.", "English"))
+
+        self.assertEqual(info["prefix"], "up")
+        self.assertIsNone(info["reflexive"])
+        self.assertEqual(info["parts"], ["gave", "up"])
+
+    def test_french_reflexive_from_feats(self):
+        adapter = StanzaAdapter()
+        _install(
+            adapter, "French",
+            _FakeTagger(FRENCH_REFLEXIVE_SENTENCE), _FakeParser(FRENCH_REFLEXIVE_SENTENCE),
+        )
+
+        info = asyncio.run(adapter.extract("lève", "Elle se lève tôt.", "French"))
+
+        self.assertEqual(info["reflexive"], "se")
+        self.assertIsNone(info["prefix"])
+        self.assertEqual(info["parts"], ["se", "lève"])
+
+    def test_french_gender_article(self):
+        adapter = StanzaAdapter()
+        sentence = [_word(1, "maison", "maison", "NOUN", None, feats="Gender=Fem|Number=Sing")]
+        _install(adapter, "French", _FakeTagger(sentence))
+
+        info = asyncio.run(adapter.extract("maison", "maison", "French"))
+
+        self.assertEqual(info["gender"], "la")
+
+    def test_unsupported_language_returns_none(self):
+        adapter = StanzaAdapter()
+
+        self.assertFalse(adapter.supports("Polish"))
+        self.assertIsNone(asyncio.run(adapter.extract("dom", "To jest dom.", "Polish")))
+
+
+class TestPipelineRegistry(unittest.TestCase):
+
+    def _adapter(self, budget_mb):
+        adapter = StanzaAdapter(memory_budget_mb=budget_mb)
+        self.loaded = []
+
+        def fake_load(spec):
+            self.loaded.append(spec.code)
+            return _FakeTagger([])
+
+        adapter._load_tagger = fake_load
+        return adapter
+
+    def test_loads_lazily_once(self):
+        adapter = self._adapter(budget_mb=10_000)
+
+        adapter._ensure_pipelines("German")
+        adapter._ensure_pipelines("German")
+
+        self.assertEqual(self.loaded, ["de"])
+
+    def test_evicts_least_recently_used(self):
+        budget = _LANGUAGE_SPECS["German"].memory_mb + _LANGUAGE_SPECS["English"].memory_mb
+        adapter = self._adapter(budget_mb=budget)
+
+        adapter._ensure_pipelines("German")
+        adapter._ensure_pipelines("English")
+        adapter._ensure_pipelines("German")  # German becomes most recently used
+        adapter._ensure_pipelines("French")
+
+        self.assertEqual(adapter.loaded_languages, ["German", "French"])
+
+    def test_single_pipeline_over_budget_still_loads(self):
+        adapter = self._adapter(budget_mb=1)
+
+        adapter._ensure_pipelines("German")
+        adapter._ensure_pipelines("Spanish")
+
+        self.assertEqual(adapter.loaded_languages, ["Spanish"])
+
+    def test_concurrent_loads_stay_within_budget(self):
+        adapter = self._adapter(budget_mb=max(spec.memory_mb for spec in _LANGUAGE_SPECS.values()))
+        german_loading, french_loading = threading.Event(), threading.Event()
+        loading_mb, peak_mb = [], []
+
+        def slow_load(spec):
+            loading_mb.append(spec.memory_mb)
+            peak_mb.append(adapter._used_mb() + sum(loading_mb))
+            if spec.code == "de":
+                german_loading.set()
+                french_loading.wait(timeout=0.3)  # give a concurrent French load the chance to start
+            else:
+                french_loading.set()
+            peak_mb.append(adapter._used_mb() + sum(loading_mb))
+            loading_mb.remove(spec.memory_mb)
+            return _FakeTagger([])
+
+        adapter._load_tagger = slow_load
+        german = threading.Thread(target=adapter._ensure_pipelines, args=("German",))
+        german.start()
+        german_loading.wait(timeout=1)
+        french = threading.Thread(target=adapter._ensure_pipelines, args=("French",))
+        french.start()
+        german.join()
+        french.join()
+
+        self.assertLessEqual(max(peak_mb), adapter.memory_budget_mb)
+        self.assertEqual(adapter.loaded_languages, ["French"])
+
+    def test_preload_loads_requested_languages(self):
+        adapter = self._adapter(budget_mb=10_000)
+
+        with patch.object(StanzaAdapter, '_ensure_parser'):
+            adapter.preload(("German", "English"))
+
+        self.assertEqual(self.loaded, ["de", "en"])
+
+
+class TestBackgroundPreload(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = StanzaAdapter()
+        self.adapter._load_tagger = lambda spec: _FakeTagger([])
+        self.adapter._ensure_parser = lambda entry: setattr(entry, "parser", _FakeParser([]))
+
+    def test_not_ready_starts_background_load(self):
+        self.assertFalse(self.adapter.is_ready("English"))
+
+        self.adapter.start_preload(("English",))  # already loading: no new thread
+        for thread in list(threading.enumerate()):
+            if thread.name == "stanza-preload":
+                thread.join(timeout=5)
+
+        self.assertTrue(self.adapter.is_ready("English"))
+        self.assertEqual(self.adapter.load_state()["English"], "ready")
+
+    def test_failed_load_is_reported_and_not_retried(self):
+        def broken_load(spec):
+            raise OSError("model download failed")
+        self.adapter._load_tagger = broken_load
+
+        self.adapter.start_preload(("German",)).join(timeout=5)
+
+        self.assertEqual(self.adapter.load_state()["German"], "failed")
+        self.assertFalse(self.adapter.is_ready("German"))
+        self.assertEqual(self.adapter.load_state()["German"], "failed")
+
+    def test_unsupported_language_never_ready(self):
+        self.assertFalse(self.adapter.is_ready("Polish"))
+        self.assertNotIn("Polish", self.adapter.load_state())
+
+
+if __name__ == '__main__':
+    unittest.main()
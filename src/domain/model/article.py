@@ -1,5 +1,6 @@
 # domain/model/article.py
 
+import hashlib
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -22,6 +23,15 @@ class ArticleInputs:
     length: str
     topic: str
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the inputs, ignoring case and extra whitespace."""
+        normalized = '\x1f'.join(
+            ' '.join(value.split()).casefold()
+            for value in (self.language, self.level, self.length, self.topic)
+        )
+        return hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
 
 # ── Value Objects ────────────────────────────────────────
 
@@ -88,6 +98,12 @@ class Article:
             job_id=str(uuid.uuid4()),
         )
 
+    def clone_for(self, user_id: str) -> 'Article':
+        """Copy this article's inputs and content into a new completed article for user_id."""
+        article = Article.create(self.inputs, user_id)
+        article.complete(self.content or '', self.source, list(self.edit_history))
+        return article
+
     # ── queries ───────────────────────────────────────────
 
     @property
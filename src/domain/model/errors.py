@@ -36,3 +36,19 @@ class DuplicateArticleError(DuplicateError):
 
 class EnqueueError(DomainError):
     """Failed to enqueue a job to the queue."""
+
+
+class JobActiveError(DomainError):
+    """The job is still queued or running, so it cannot be requeued."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Job {job_id} is still active")
+
+
+class JobCancelledError(DomainError):
+    """The job was cancelled while it was running."""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        super().__init__(f"Job {job_id} was cancelled")
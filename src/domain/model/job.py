@@ -8,6 +8,22 @@ from domain.model.article import ArticleInputs
 
 logger = logging.getLogger(__name__)
 
+# Job statuses after which the status no longer changes
+TERMINAL_JOB_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+# Status message of a job waiting in the queue (API submissions and worker requeues)
+QUEUED_MESSAGE = 'Job queued, waiting for worker...'
+
+
+def _parse_datetime(value) -> datetime | None:
+    """Parse an ISO timestamp from queue data; naive values are taken as UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
 
 @dataclass
 class JobContext:
@@ -18,6 +34,8 @@ class JobContext:
     user_id: str | None
     inputs: ArticleInputs
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    attempts: int = 0
+    created_at: datetime | None = None
 
     @classmethod
     def from_dict(cls, job_data: dict) -> 'JobContext | None':
@@ -39,8 +57,17 @@ class JobContext:
                 length=raw_inputs.get('length', ''),
                 topic=raw_inputs.get('topic', ''),
             ),
+            attempts=job_data.get('attempts', 0),
+            created_at=_parse_datetime(job_data.get('created_at')),
         )
 
+    @property
+    def pickup_latency(self) -> float | None:
+        """Seconds from job creation (submit) to dequeue, if known."""
+        if self.created_at is None:
+            return None
+        return max(0.0, (self.started_at - self.created_at).total_seconds())
+
     @property
     def log_extra(self) -> dict:
         """Common extra fields for structured logging."""
@@ -0,0 +1,74 @@
+"""Schedule domain model — article generation at a fixed time of day."""
+
+import logging
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, time, timedelta, timezone
+
+from domain.model.article import ArticleInputs
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Schedule:
+    """Generate an article for user_id at time_utc ('HH:MM'), daily or once."""
+
+    id: str
+    user_id: str
+    inputs: ArticleInputs
+    time_utc: str
+    repeat_daily: bool = True
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @staticmethod
+    def create(inputs: ArticleInputs, user_id: str, time_utc: str, repeat_daily: bool = True) -> 'Schedule':
+        """Create a new Schedule with a generated ID. Raises ValueError for a bad time."""
+        time.fromisoformat(time_utc)
+        return Schedule(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            inputs=inputs,
+            time_utc=time_utc,
+            repeat_daily=repeat_daily,
+        )
+
+    def next_run(self, after: datetime | None = None) -> datetime:
+        """First occurrence of time_utc strictly after `after` (default: now)."""
+        after = after or datetime.now(timezone.utc)
+        at = time.fromisoformat(self.time_utc)
+        candidate = after.replace(hour=at.hour, minute=at.minute, second=0, microsecond=0)
+        if candidate <= after:
+            candidate += timedelta(days=1)
+        return candidate
+
+    def last_run(self, before: datetime | None = None) -> datetime:
+        """Latest occurrence of time_utc at or before `before` (default: now)."""
+        before = before or datetime.now(timezone.utc)
+        return self.next_run(before - timedelta(days=1))
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'inputs': asdict(self.inputs),
+            'time_utc': self.time_utc,
+            'repeat_daily': self.repeat_daily,
+            'created_at': self.created_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Schedule | None':
+        """Create Schedule from stored data. Returns None if invalid."""
+        try:
+            return cls(
+                id=data['id'],
+                user_id=data['user_id'],
+                inputs=ArticleInputs(**data['inputs']),
+                time_utc=data['time_utc'],
+                repeat_daily=data.get('repeat_daily', True),
+                created_at=datetime.fromisoformat(data['created_at']),
+            )
+        except (KeyError, TypeError, ValueError):
+            logger.error(f"Invalid schedule data: {data}")
+            return None
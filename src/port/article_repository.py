@@ -8,6 +8,8 @@ from domain.model.article import Article, ArticleInputs, ArticleStatus, Articles
 class ArticleRepository(Protocol):
     def save(self, article: Article) -> bool: ...
 
+    def save_many(self, articles: list[Article]) -> set[str]: ...
+
     def get_by_id(self, article_id: str) -> Article | None: ...
 
     def find_many(
@@ -28,6 +30,34 @@ class ArticleRepository(Protocol):
         hours: int = 24,
     ) -> Article | None: ...
 
+    def find_duplicates(
+        self,
+        inputs: list[ArticleInputs],
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> dict[ArticleInputs, Article]: ...
+
+    def find_completed(
+        self,
+        inputs: ArticleInputs,
+        user_id: str | None = None,
+        hours: int = 24,
+    ) -> list[Article]: ...
+
+    def find_reusable(
+        self,
+        inputs: ArticleInputs,
+        hours: int = 24,
+        exclude_user_id: str | None = None,
+    ) -> Article | None: ...
+
+    def count_by_inputs(
+        self,
+        hours: int = 168,
+        limit: int = 20,
+        exclude_user_id: str | None = None,
+    ) -> list[tuple[ArticleInputs, int]]: ...
+
     def update_status(self, article_id: str, status: ArticleStatus) -> bool: ...
 
     def delete(self, article_id: str) -> bool: ...
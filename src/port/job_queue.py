@@ -2,13 +2,17 @@
 
 from typing import Protocol
 
-from domain.model.article import Article
+from domain.model.article import Article, ArticleInputs
 from domain.model.job import JobContext
+from domain.model.schedule import Schedule
 
 
 class JobQueuePort(Protocol):
-    def enqueue(self, article: Article) -> bool: ...
-    def dequeue(self, timeout: int = 1) -> JobContext | None: ...
+    def enqueue(self, article: Article, priority: str | None = None) -> bool: ...
+    def dequeue(self, timeout: float = 1) -> JobContext | None: ...
+    def heartbeat(self, job_id: str) -> bool: ...
+    def ack(self, job_id: str) -> bool: ...
+    def recover_stalled(self) -> list[JobContext]: ...
     def get_status(self, job_id: str) -> dict | None: ...
     def update_status(
         self,
@@ -19,5 +23,67 @@ class JobQueuePort(Protocol):
         error: str | None = None,
         article_id: str | None = None,
     ) -> bool: ...
+    def is_cancelled(self, job_id: str) -> bool: ...
+    def close_inflight(self, job_id: str, inputs: ArticleInputs) -> list[dict]: ...
+    def save_checkpoint(self, job_id: str, task_name: str, output: dict) -> bool: ...
+    def load_checkpoints(self, job_id: str) -> dict[str, dict]: ...
+    def clear_checkpoints(self, job_id: str) -> bool: ...
     def get_stats(self) -> dict | None: ...
+    def get_lane_stats(self) -> dict | None: ...
+    def publish_worker_heartbeat(self, concurrency: int, in_flight: list[str]) -> bool: ...
+    def record_processing_time(self, seconds: float, status: str) -> bool: ...
+    def get_queue_metrics(self) -> dict | None: ...
+    def claim_due_schedules(self, limit: int = 100) -> list[Schedule]: ...
+    def release_schedule(self, schedule: Schedule) -> bool: ...
+    def claim_periodic(self, name: str, seconds: int) -> bool: ...
     def ping(self) -> bool: ...
+
+
+class AsyncJobQueuePort(Protocol):
+    """API-side subset of JobQueuePort for use from async routes and services."""
+
+    async def enqueue(self, article: Article, priority: str | None = None) -> bool: ...
+    async def enqueue_many(
+        self,
+        articles: list[Article],
+        message: str = '',
+        priority: str | None = None,
+    ) -> list[bool]: ...
+    async def join_inflight(self, article: Article, attach: bool = False) -> str | None: ...
+    async def close_inflight(self, job_id: str, inputs: ArticleInputs) -> list[dict]: ...
+    async def get_status(self, job_id: str) -> dict | None: ...
+    async def read_events(
+        self,
+        job_id: str,
+        last_event_id: str | None = None,
+        block_ms: int | None = None,
+    ) -> list[tuple[str, dict]] | None: ...
+    async def update_status(
+        self,
+        job_id: str,
+        status: str,
+        progress: int = 0,
+        message: str = '',
+        error: str | None = None,
+        article_id: str | None = None,
+    ) -> bool: ...
+    async def cancel(
+        self,
+        job_id: str,
+        article_id: str | None = None,
+        message: str = 'Job cancelled',
+        user_id: str | None = None,
+    ) -> bool: ...
+    async def retry(
+        self,
+        article: Article,
+        message: str = 'Retrying from last checkpoint',
+        priority: str | None = None,
+    ) -> bool | None: ...
+    async def get_stats(self) -> dict | None: ...
+    async def get_lane_stats(self) -> dict | None: ...
+    async def get_queue_metrics(self) -> dict | None: ...
+    async def save_schedule(self, schedule: Schedule, limit: int = 0) -> bool | None: ...
+    async def list_schedules(self, user_id: str) -> list[Schedule] | None: ...
+    async def delete_schedule(self, user_id: str, schedule_id: str) -> bool: ...
+    async def ping(self) -> bool: ...
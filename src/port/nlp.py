@@ -14,12 +14,29 @@ class NLPPort(Protocol):
         text, lemma, pos, xpos, gender, prefix, reflexive, parts
     """
 
-    async def extract(self, word: str, sentence: str) -> dict | None:
+    def supports(self, language: str) -> bool:
+        """Whether extraction is available for the language (e.g. "German")."""
+        ...
+
+    def is_ready(self, language: str) -> bool:
+        """Whether extraction can run now without waiting for a model load.
+
+        Implementations may start loading in the background when not ready;
+        callers should use a non-NLP path meanwhile.
+        """
+        ...
+
+    def load_state(self) -> dict[str, str]:
+        """Load state per supported language (e.g. {"German": "ready"})."""
+        ...
+
+    async def extract(self, word: str, sentence: str, language: str = "German") -> dict | None:
         """Extract linguistic info for a word in context.
 
         Args:
             word: The clicked word to analyze.
             sentence: Full sentence containing the word.
+            language: Full language name of the sentence.
 
         Returns:
             Dict with extracted primitives, or None on failure.
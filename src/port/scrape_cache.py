@@ -0,0 +1,19 @@
+"""Port definition for the shared scrape cache."""
+
+from typing import Protocol
+
+
+class ScrapeCachePort(Protocol):
+    """Extracted page text shared across jobs and workers, keyed by URL.
+
+    get() returns {'text', 'etag', 'last_modified', 'fresh'} or None;
+    entries older than fresh_seconds come back with fresh=False so the
+    caller can revalidate them (If-None-Match / If-Modified-Since) and
+    call revalidated() on a 304. The store is size-bounded and evicts
+    the least recently used pages first.
+    """
+
+    def get(self, key: str, fresh_seconds: int) -> dict | None: ...
+    def put(self, key: str, text: str, etag: str = '', last_modified: str = '') -> bool: ...
+    def revalidated(self, key: str) -> bool: ...
+    def get_stats(self) -> dict | None: ...
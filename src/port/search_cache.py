@@ -0,0 +1,16 @@
+"""Port definition for the shared search result cache."""
+
+from typing import Protocol
+
+
+class SearchCachePort(Protocol):
+    """Search tool results shared across jobs and workers.
+
+    Keys are opaque strings built by the caller (see
+    adapter.cache.keys.search_cache_key). get() counts a hit or
+    a miss, so get_stats() reports the cache's hit rate.
+    """
+
+    def get(self, key: str) -> dict | None: ...
+    def put(self, key: str, results: dict, ttl_seconds: int) -> bool: ...
+    def get_stats(self) -> dict | None: ...
@@ -0,0 +1,170 @@
+"""Pre-generated article pool for the most requested inputs.
+
+Worker-side producer: refill_pool() counts demand per (language, level,
+length, topic) over recent user articles, and during off-peak hours keeps
+up to ARTICLE_POOL_SIZE fresh articles for each of the top combinations.
+Pool articles are ordinary articles owned by POOL_USER_ID, generated on
+the low-priority lane; stale ones are soft deleted.
+
+API-side consumer: pick_pool_article() chooses one of the fresh pool
+articles, which submit_generation() copies into the requesting user's
+account as a completed article with a completed job, so the request
+finishes without a crew run. The same pool article can serve many users
+until it goes stale.
+
+Pool articles are generated without a user's vocabulary, so a served
+article does not reinforce the user's saved words. ARTICLE_POOL_SERVE_RATIO
+controls what share of eligible requests take that trade-off.
+"""
+
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+
+from domain.model.article import Article, ArticleInputs, ArticleStatus
+from port.article_repository import ArticleRepository
+from port.job_queue import JobQueuePort
+
+logger = logging.getLogger(__name__)
+
+POOL_USER_ID = os.getenv('ARTICLE_POOL_USER_ID', 'article-pool')
+# Fresh articles kept per combination; 0 disables the pool
+POOL_SIZE = int(os.getenv('ARTICLE_POOL_SIZE', '0'))
+POOL_TOP_COMBINATIONS = int(os.getenv('ARTICLE_POOL_TOP_COMBINATIONS', '20'))
+# A combination needs this many requests in the demand window to be pooled
+POOL_MIN_REQUESTS = int(os.getenv('ARTICLE_POOL_MIN_REQUESTS', '3'))
+POOL_DEMAND_HOURS = int(os.getenv('ARTICLE_POOL_DEMAND_HOURS', '168'))
+# Older pool articles are neither served nor counted as stock. Keep this
+# within the 24h duplicate window so a user is never served the same one twice.
+POOL_MAX_AGE_HOURS = int(os.getenv('ARTICLE_POOL_MAX_AGE_HOURS', '12'))
+# Share of eligible requests served from the pool (0.0-1.0)
+POOL_SERVE_RATIO = float(os.getenv('ARTICLE_POOL_SERVE_RATIO', '1.0'))
+# UTC hours the producer may run, e.g. '2-6' (2:00-5:59) or '22-4,13'
+POOL_OFF_PEAK_HOURS = os.getenv('ARTICLE_POOL_OFF_PEAK_HOURS', '2-6')
+# Caps the generations one refill adds to the queue
+POOL_MAX_ENQUEUE = int(os.getenv('ARTICLE_POOL_MAX_ENQUEUE', '10'))
+POOL_PRIORITY = os.getenv('ARTICLE_POOL_PRIORITY', 'low')
+# Seconds between refills; one worker claims each run
+POOL_REFILL_INTERVAL = int(os.getenv('ARTICLE_POOL_REFILL_INTERVAL', '600'))
+REFILL_TASK = 'article-pool-refill'
+# Pool articles read per repository call while expiring and counting stock
+POOL_SCAN_PAGE_SIZE = 200
+
+
+def parse_hours(spec: str) -> frozenset[int]:
+    """UTC hours from a spec like '2-6' or '22-4,13'; ranges are end-exclusive and may wrap.
+
+    An empty spec means every hour.
+    """
+    hours: set[int] = set()
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            start, end = (int(h) % 24 for h in part.split('-', 1))
+            hour = start
+            while hour != end:
+                hours.add(hour)
+                hour = (hour + 1) % 24
+        else:
+            hours.add(int(part) % 24)
+    return frozenset(hours) if hours else frozenset(range(24))
+
+
+def is_off_peak(now: datetime) -> bool:
+    return now.astimezone(timezone.utc).hour in parse_hours(POOL_OFF_PEAK_HOURS)
+
+
+def refill_pool(
+    repo: ArticleRepository,
+    job_queue: JobQueuePort,
+    now: datetime | None = None,
+) -> int:
+    """Expire stale pool articles and queue generations for missing stock.
+
+    Does nothing outside off-peak hours or when the pool is disabled.
+    Every worker calls this, but only the one that claims the run
+    (JobQueuePort.claim_periodic, once per POOL_REFILL_INTERVAL) refills.
+    Queued and running pool articles count as stock, so a refill that
+    runs again before its jobs finish does not queue them twice.
+    Returns the number of generations queued.
+    """
+    now = now or datetime.now(timezone.utc)
+    if POOL_SIZE <= 0 or not is_off_peak(now):
+        return 0
+    if not job_queue.claim_periodic(REFILL_TASK, POOL_REFILL_INTERVAL):
+        return 0
+
+    stock = _expire_and_count_stock(repo, now - timedelta(hours=POOL_MAX_AGE_HOURS))
+
+    started = 0
+    for inputs, requests in repo.count_by_inputs(POOL_DEMAND_HOURS, POOL_TOP_COMBINATIONS, POOL_USER_ID):
+        if requests < POOL_MIN_REQUESTS:
+            break
+        for _ in range(POOL_SIZE - stock.get(inputs, 0)):
+            if started >= POOL_MAX_ENQUEUE:
+                return started
+            if not _queue_pool_article(repo, job_queue, inputs):
+                return started
+            started += 1
+    if started:
+        logger.info("Article pool refill queued", extra={"count": started})
+    return started
+
+
+def _expire_and_count_stock(repo: ArticleRepository, cutoff: datetime) -> dict[ArticleInputs, int]:
+    """Soft delete pool articles created before cutoff; count the rest per inputs.
+
+    Pages through every pool article, so stale ones are expired however
+    large the pool has grown. Deletes after the scan, since deleted
+    articles drop out of the listing and would shift the pages.
+    """
+    stock: dict[ArticleInputs, int] = {}
+    stale: list[str] = []
+    skip = 0
+    while True:
+        page = repo.find_many(skip=skip, limit=POOL_SCAN_PAGE_SIZE, user_id=POOL_USER_ID).items
+        for article in page:
+            if article.created_at < cutoff:
+                stale.append(article.id)
+            elif article.status in (ArticleStatus.COMPLETED, ArticleStatus.RUNNING):
+                stock[article.inputs] = stock.get(article.inputs, 0) + 1
+        if len(page) < POOL_SCAN_PAGE_SIZE:
+            break
+        skip += len(page)
+
+    for article_id in stale:
+        repo.delete(article_id)
+    if stale:
+        logger.info("Stale pool articles expired", extra={"count": len(stale)})
+    return stock
+
+
+def _queue_pool_article(repo: ArticleRepository, job_queue: JobQueuePort, inputs: ArticleInputs) -> bool:
+    article = Article.create(inputs, POOL_USER_ID)
+    extra = {"articleId": article.id, "jobId": article.job_id, "topic": inputs.topic}
+
+    if not repo.save(article):
+        logger.error("Failed to save pool article", extra=extra)
+        return False
+    if not (
+        job_queue.update_status(article.job_id, 'queued', 0, 'Pool job queued', article_id=article.id)
+        and job_queue.enqueue(article, priority=POOL_PRIORITY)
+    ):
+        job_queue.update_status(article.job_id, 'failed', 0, 'Failed to enqueue pool job', article_id=article.id)
+        repo.update_status(article.id, ArticleStatus.FAILED)
+        logger.error("Failed to enqueue pool job", extra=extra)
+        return False
+    return True
+
+
+def pick_pool_article(inputs: ArticleInputs, user_id: str, repo: ArticleRepository) -> Article | None:
+    """A fresh pool article for the inputs, or None on a miss or when the pool is off."""
+    if POOL_SIZE <= 0 or user_id == POOL_USER_ID or random.random() >= POOL_SERVE_RATIO:
+        return None
+
+    pooled = repo.find_completed(inputs, POOL_USER_ID, hours=POOL_MAX_AGE_HOURS)
+    logger.info("Article pool hit" if pooled else "Article pool miss", extra={"userId": user_id, "topic": inputs.topic})
+    return random.choice(pooled) if pooled else None
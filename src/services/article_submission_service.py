@@ -1,28 +1,59 @@
 """Article submission service — handles article creation and queue submission.
 
-API-side flow: duplicate check → create → enqueue
+API-side flow: duplicate check → article pool → reuse → create → enqueue
+
+A request the pre-generated pool (services.article_pool_service) can
+serve, or with reuse set one matching a recent article of another user,
+gets a completed copy of that article instead of a job; force skips both.
+With reuse, a request whose inputs match a queued or running job attaches
+to that job (adapter.queue.inflight) instead of being enqueued: its own
+job id reports the shared job's progress and its article is completed
+from the shared result.
+
+submit_generation_batch() runs the same flow for many inputs with one
+duplicate query, one insert_many and one Redis pipeline. cancel_generation()
+stops an article's queued or running job; jobs attached to it carry on,
+the first one enqueued in its place and the rest attached to that one
+(the same happens when an in-flight job fails to enqueue).
 """
 
 import logging
+import os
 
 from domain.model.article import Article, ArticleInputs, ArticleStatus
-from domain.model.errors import DuplicateArticleError, EnqueueError, DomainError
+from domain.model.errors import DuplicateArticleError, EnqueueError, DomainError, JobActiveError
+from domain.model.job import QUEUED_MESSAGE, TERMINAL_JOB_STATUSES
 from port.article_repository import ArticleRepository
-from port.job_queue import JobQueuePort
+from services.article_pool_service import pick_pool_article
+from port.job_queue import AsyncJobQueuePort
 
 logger = logging.getLogger(__name__)
 
+POOL_SERVED_MESSAGE = 'Served from the pre-generated article pool'
+REUSED_MESSAGE = 'Reused a recently generated article'
+ATTACHED_MESSAGE = 'Waiting for an identical article that is being generated...'
+# How recent another user's article must be to be reused
+REUSE_WINDOW_HOURS = int(os.getenv('ARTICLE_REUSE_WINDOW_HOURS', '24'))
 
-def submit_generation(
+
+async def submit_generation(
     inputs: ArticleInputs,
     user_id: str,
     repo: ArticleRepository,
-    job_queue: JobQueuePort,
+    job_queue: AsyncJobQueuePort,
     force: bool = False,
+    reuse: bool = False,
 ) -> Article:
     """Submit article generation request.
 
-    Returns the created Article (with job_id set).
+    reuse opts in to copying the newest completed article another user
+    generated from the same inputs within REUSE_WINDOW_HOURS, or to
+    attaching to another user's queued or running job for them. That
+    article was personalized for its owner's vocabulary, so callers should
+    only set it when personalization does not matter.
+
+    Returns the created Article (with job_id set); when served from the
+    article pool or reused it is already completed.
     Raises DuplicateArticleError or EnqueueError on failure.
     """
     logger.info("Article generation requested", extra={
@@ -31,7 +62,16 @@ def submit_generation(
         "language": inputs.language
     })
 
-    _check_duplicate(repo, job_queue, inputs, force, user_id)
+    await _check_duplicate(repo, job_queue, inputs, force, user_id)
+
+    if not force:
+        source = pick_pool_article(inputs, user_id, repo)
+        if source:
+            return await _copy_article(repo, job_queue, source, user_id, POOL_SERVED_MESSAGE)
+        if reuse:
+            source = repo.find_reusable(inputs, REUSE_WINDOW_HOURS, exclude_user_id=user_id)
+            if source:
+                return await _copy_article(repo, job_queue, source, user_id, REUSED_MESSAGE)
 
     article = Article.create(inputs, user_id)
 
@@ -40,14 +80,183 @@ def submit_generation(
 
     logger.info("Article created", extra={"articleId": article.id, "jobId": article.job_id})
 
-    _enqueue_job(job_queue, repo, article)
+    if reuse and not force and await _attach_to_inflight(job_queue, article):
+        return article
+
+    try:
+        await _enqueue_job(job_queue, repo, article)
+    except EnqueueError:
+        # _attach_to_inflight registered the job as in-flight; settle the
+        # jobs that attached to it meanwhile
+        await _release_followers(repo, job_queue, article)
+        raise
+    await job_queue.join_inflight(article)
 
     return article
 
 
-def _check_duplicate(
+async def submit_generation_batch(
+    inputs_list: list[ArticleInputs],
+    user_id: str,
+    repo: ArticleRepository,
+    job_queue: AsyncJobQueuePort,
+    force: bool = False,
+) -> list[Article | DomainError]:
+    """Submit several article generation requests at once.
+
+    Returns one entry per input, in order: the created Article (with
+    job_id set), or the DomainError that stopped that item
+    (DuplicateArticleError, EnqueueError or a save failure). Repeated
+    inputs within the batch count as duplicates of the first one unless
+    force is set. Duplicates carry no job_data; clients can poll the
+    existing article's job.
+    """
+    logger.info("Batch article generation requested", extra={
+        "userId": user_id,
+        "count": len(inputs_list),
+    })
+
+    existing = {} if force else repo.find_duplicates(list(set(inputs_list)), user_id, hours=24)
+
+    results: list[Article | DomainError] = []
+    created: dict[ArticleInputs, Article] = {}
+    for inputs in inputs_list:
+        duplicate = None if force else existing.get(inputs) or created.get(inputs)
+        if duplicate:
+            results.append(DuplicateArticleError(duplicate.id))
+            continue
+        article = Article.create(inputs, user_id)
+        created.setdefault(inputs, article)
+        results.append(article)
+
+    new_articles = [r for r in results if isinstance(r, Article)]
+    saved_ids = repo.save_many(new_articles)
+    saved = [a for a in new_articles if a.id in saved_ids]
+
+    enqueued = dict(zip(
+        (a.id for a in saved),
+        await job_queue.enqueue_many(saved, QUEUED_MESSAGE),
+    ))
+
+    for i, result in enumerate(results):
+        if not isinstance(result, Article):
+            continue
+        if result.id not in saved_ids:
+            results[i] = DomainError("Failed to save article to repository")
+        elif not enqueued.get(result.id):
+            await job_queue.update_status(
+                result.job_id, 'failed', 0,
+                'Failed to enqueue job', 'Queue service unavailable',
+                article_id=result.id,
+            )
+            repo.update_status(result.id, ArticleStatus.FAILED)
+            results[i] = EnqueueError("Failed to enqueue job")
+
+    logger.info("Batch articles submitted", extra={
+        "userId": user_id,
+        "queued": sum(isinstance(r, Article) for r in results),
+        "count": len(results),
+    })
+    return results
+
+
+async def cancel_generation(
+    repo: ArticleRepository,
+    job_queue: AsyncJobQueuePort,
+    article: Article,
+    job_data: dict | None = None,
+) -> bool:
+    """Cancel the article's job if it is still queued or running.
+
+    A running article is marked failed. Jobs of other requests attached to
+    it are released (_release_followers). Returns False when there is no
+    job, it already finished, or the queue is unavailable.
+    """
+    if not article.job_id:
+        return False
+    if job_data is None:
+        job_data = await job_queue.get_status(article.job_id)
+    if not job_data or job_data.get('status') in TERMINAL_JOB_STATUSES:
+        return False
+
+    if not await job_queue.cancel(article.job_id, article.id, user_id=article.user_id):
+        return False
+    if article.status == ArticleStatus.RUNNING:
+        repo.update_status(article.id, ArticleStatus.FAILED)
+    logger.info("Generation cancelled", extra={"articleId": article.id, "jobId": article.job_id})
+    await _release_followers(repo, job_queue, article)
+    return True
+
+
+async def _release_followers(
     repo: ArticleRepository,
-    job_queue: JobQueuePort,
+    job_queue: AsyncJobQueuePort,
+    article: Article,
+) -> None:
+    """Give the jobs attached to the article's job a live job.
+
+    Used when that job was cancelled or could not be enqueued. The first
+    follower is enqueued and becomes the in-flight job; the others attach
+    to it. Followers cancelled meanwhile are dropped, and one that cannot
+    be enqueued is marked failed (_enqueue_job) and its own followers are
+    released in turn.
+    """
+    for follower in await job_queue.close_inflight(article.job_id, article.inputs):
+        status = await job_queue.get_status(follower['job_id'])
+        if not follower.get('article_id') or (status or {}).get('status') == 'cancelled':
+            continue
+        follower_article = repo.get_by_id(follower['article_id'])
+        if not follower_article or await _attach_to_inflight(job_queue, follower_article):
+            continue
+        try:
+            await _enqueue_job(job_queue, repo, follower_article)
+        except EnqueueError:
+            logger.error("Failed to requeue follower", extra={
+                "articleId": follower_article.id, "jobId": follower_article.job_id, "leaderJobId": article.job_id,
+            })
+            await _release_followers(repo, job_queue, follower_article)
+            continue
+        logger.info("Follower requeued", extra={
+            "articleId": follower_article.id, "jobId": follower_article.job_id, "leaderJobId": article.job_id,
+        })
+
+
+RETRYABLE_JOB_STATUSES = frozenset({'failed', 'cancelled'})
+
+
+async def retry_generation(
+    repo: ArticleRepository,
+    job_queue: AsyncJobQueuePort,
+    article: Article,
+    job_data: dict | None = None,
+) -> bool:
+    """Requeue the article's failed or cancelled job under the same job id.
+
+    The worker resumes after the job's last checkpointed task. The article
+    goes back to running. Returns False when the job is not retryable or
+    the queue is unavailable. Raises JobActiveError when the job is still
+    pending or running (e.g. its worker has not acked it yet).
+    """
+    if not article.job_id or article.status == ArticleStatus.DELETED:
+        return False
+    if job_data is None:
+        job_data = await job_queue.get_status(article.job_id)
+    if not job_data or job_data.get('status') not in RETRYABLE_JOB_STATUSES:
+        return False
+
+    requeued = await job_queue.retry(article)
+    if requeued is None:
+        return False
+    if not requeued:
+        raise JobActiveError(article.job_id)
+    repo.update_status(article.id, ArticleStatus.RUNNING)
+    logger.info("Generation retried", extra={"articleId": article.id, "jobId": article.job_id})
+    return True
+
+
+async def _check_duplicate(
+    repo: ArticleRepository,
+    job_queue: AsyncJobQueuePort,
     inputs: ArticleInputs,
     force: bool,
     user_id: str | None,
@@ -62,26 +271,64 @@ def _check_duplicate(
 
     job_data = None
     if existing.job_id:
-        job_data = job_queue.get_status(existing.job_id)
+        job_data = await job_queue.get_status(existing.job_id)
 
     raise DuplicateArticleError(existing.id, job_data)
 
 
-def _enqueue_job(
-    job_queue: JobQueuePort,
+async def _copy_article(
+    repo: ArticleRepository,
+    job_queue: AsyncJobQueuePort,
+    source: Article,
+    user_id: str,
+    message: str,
+) -> Article:
+    """Copy a completed article into the user's account with a completed job."""
+    article = source.clone_for(user_id)
+    if not repo.save(article):
+        raise DomainError("Failed to save article to repository")
+    await job_queue.update_status(article.job_id, 'completed', 100, message, article_id=article.id)
+
+    logger.info("Article copied", extra={
+        "articleId": article.id,
+        "sourceArticleId": source.id,
+        "jobId": article.job_id,
+        "reason": message,
+    })
+    return article
+
+
+async def _attach_to_inflight(job_queue: AsyncJobQueuePort, article: Article) -> bool:
+    """Attach the article's job to a live job for the same inputs.
+
+    Returns False when there is none (the job is then registered as the
+    live one and must be enqueued).
+    """
+    if not await job_queue.update_status(article.job_id, 'queued', 0, ATTACHED_MESSAGE, article_id=article.id):
+        return False
+    leader = await job_queue.join_inflight(article, attach=True)
+    if not leader:
+        return False
+    logger.info("Article attached to in-flight job", extra={
+        "articleId": article.id, "jobId": article.job_id, "leaderJobId": leader,
+    })
+    return True
+
+
+async def _enqueue_job(
+    job_queue: AsyncJobQueuePort,
     repo: ArticleRepository,
     article: Article,
 ) -> None:
     """Enqueue job or raise EnqueueError."""
-    if not job_queue.update_status(
-        article.job_id, 'queued', 0,
-        'Job queued, waiting for worker...',
+    if not await job_queue.update_status(
+        article.job_id, 'queued', 0, QUEUED_MESSAGE,
         article_id=article.id,
     ):
         raise EnqueueError("Failed to initialize job status")
 
-    if not job_queue.enqueue(article):
-        job_queue.update_status(
+    if not await job_queue.enqueue(article):
+        await job_queue.update_status(
             article.job_id, 'failed', 0,
             'Failed to enqueue job', 'Queue service unavailable',
             article_id=article.id,
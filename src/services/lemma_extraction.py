@@ -1,7 +1,8 @@
 """Lemma extraction module — Step 1 of the dictionary lookup pipeline.
 
 Extracts lemma + related_words + CEFR level from a word in context.
-German uses NLP adapter (Stanza, ~51ms); other languages use LLM (~800ms).
+Languages supported by the NLP adapter (Stanza, ~51ms: German, English,
+French, Spanish) resolve the lemma locally; others use LLM (~800ms).
 Both paths return the same dict format: {"lemma", "related_words", "level"}.
 """
 
@@ -26,6 +27,16 @@ class LemmaResult(TypedDict):
 _REDUCED_PROMPT_MAX_TOKENS = 200
 _CEFR_PROMPT_MAX_TOKENS = 10
 
+# French "se" elides before a vowel or mute h: s'appeler, s'habiller
+_FRENCH_ELISION_INITIALS = frozenset("aeiouyhàâéèêëîïôûù")
+# ...but not before an aspirated h: se hâter, se hisser
+_FRENCH_ASPIRATED_H_VERBS = frozenset({
+    "hacher", "haïr", "haler", "hâler", "haleter", "hancher", "handicaper",
+    "hanter", "harceler", "harnacher", "hasarder", "hâter",
+    "hausser", "heurter", "hisser", "hérisser", "hocher", "honnir", "hurler",
+    "huer", "hâbler", "hucher", "hiérarchiser",
+})
+
 
 # ---------------------------------------------------------------------------
 # Public interface
@@ -41,20 +52,25 @@ async def extract_lemma(
 ) -> tuple[LemmaResult | None, LLMCallResult | None]:
     """Extract lemma, related_words, and CEFR level for a word in context.
 
-    German uses NLP adapter with a small LLM call for CEFR.
-    Other languages use LLM reduced prompt.
+    NLP-supported languages use the NLP adapter with a small LLM call for CEFR.
+    Other languages, NLP failures, or a model still loading use LLM reduced prompt.
 
     Returns:
         Tuple of (LemmaResult, token_stats).
         Returns (None, None) on failure.
     """
-    if language == "German" and nlp is not None:
-        word_info = await nlp.extract(word, sentence)
+    if nlp is not None and nlp.supports(language):
+        if not nlp.is_ready(language):
+            logger.info("NLP pipeline not ready, using LLM",
+                        extra={"word": word, "language": language})
+            return await _extract_with_llm(word, sentence, language, llm, model)
+
+        word_info = await nlp.extract(word, sentence, language)
         if word_info is not None:
-            lemma, related_words = resolve_lemma(word_info, word)
+            lemma, related_words = resolve_lemma(word_info, word, language)
             level, stats = await _estimate_cefr(word, sentence, lemma, llm, model)
             logger.info("Lemma extracted (NLP)", extra={
-                "word": word, "lemma": lemma,
+                "word": word, "lemma": lemma, "language": language,
                 "related_words": related_words, "level": level,
             })
             return LemmaResult(
@@ -64,7 +80,7 @@ async def extract_lemma(
             ), stats
         # NLP failed — fall through to LLM path
         logger.info("NLP extraction failed, falling back to LLM",
-                     extra={"word": word})
+                     extra={"word": word, "language": language})
 
     return await _extract_with_llm(word, sentence, language, llm, model)
 
@@ -73,33 +89,50 @@ async def extract_lemma(
 # Business rules (no external library access)
 # ---------------------------------------------------------------------------
 
-def resolve_lemma(info: dict[str, Any], original_word: str) -> tuple[str, list[str]]:
+def resolve_lemma(
+    info: dict[str, Any], original_word: str, language: str = "German",
+) -> tuple[str, list[str]]:
     """Determine lemma and related_words from extracted word info.
 
-    Applies German grammar rules:
-    - Articles (ART): lowercase text
-    - Past-participle adjectives (ending in -en/-ern/-eln): lowercase text
+    Applies per-language grammar rules:
+    - German articles (ART): lowercase text
+    - German past-participle adjectives (ending in -en/-ern/-eln): lowercase text
     - Non-verbs: use NLP lemma directly
-    - Verbs: combine base lemma with separable prefix and/or reflexive
+    - Verbs: combine base lemma with particle/prefix and/or reflexive
+      (German "sich aufregen", English "give up", French "se lever",
+      Spanish "levantarse")
     """
-    if info["xpos"] == "ART":
-        return info["text"].lower(), [original_word]
+    if language == "German":
+        if info["xpos"] == "ART":
+            return info["text"].lower(), [original_word]
 
-    if info["pos"] == "adj" and info["lemma"].endswith(("en", "ern", "eln")):
-        return info["text"].lower(), [original_word]
+        if info["pos"] == "adj" and info["lemma"].endswith(("en", "ern", "eln")):
+            return info["text"].lower(), [original_word]
 
     if info["pos"] != "verb":
         return info["lemma"], [original_word]
 
     # Verb: combine prefix + reflexive
-    lemma = _combine_verb_lemma(info["lemma"], info["prefix"], info["reflexive"])
+    lemma = _combine_verb_lemma(
+        info["lemma"], info["prefix"], info["reflexive"], language,
+    )
     return lemma, info["parts"]
 
 
 def _combine_verb_lemma(
-    base: str, prefix: str | None, reflexive: str | None,
+    base: str, prefix: str | None, reflexive: str | None, language: str = "German",
 ) -> str:
-    """Combine verb lemma with separable prefix and/or reflexive pronoun."""
+    """Combine verb lemma with particle/prefix and/or reflexive pronoun."""
+    if language == "English":
+        return f"{base} {prefix.lower()}" if prefix else base
+    if language == "French":
+        if not reflexive:
+            return base
+        elides = base[:1].lower() in _FRENCH_ELISION_INITIALS and base.lower() not in _FRENCH_ASPIRATED_H_VERBS
+        return f"s'{base}" if elides else f"se {base}"
+    if language == "Spanish":
+        return f"{base}se" if reflexive and not base.endswith("se") else base
+
     if reflexive:
         return f"sich {prefix}{base}" if prefix else f"sich {base}"
     if prefix:
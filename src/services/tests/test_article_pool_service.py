@@ -0,0 +1,148 @@
+"""Unit tests for article_pool_service module."""
+
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import services.article_pool_service as pool
+from services.article_pool_service import POOL_USER_ID, parse_hours, pick_pool_article, refill_pool
+from services.article_submission_service import submit_generation
+from adapter.fake.article_repository import FakeArticleRepository
+from adapter.fake.job_queue import FakeAsyncJobQueueAdapter, FakeJobQueueAdapter
+from domain.model.article import Article, ArticleInputs, ArticleStatus
+
+
+POPULAR = ArticleInputs(language='German', level='B2', length='500', topic='AI')
+RARE = ArticleInputs(language='French', level='A1', length='300', topic='Chess')
+OFF_PEAK = datetime(2026, 1, 1, 3, tzinfo=timezone.utc)
+
+
+def _requested(repo, inputs, count, user_id='user-1'):
+    for _ in range(count):
+        repo.save(Article.create(inputs, user_id))
+
+
+def _pooled(repo, inputs, age_hours=1.0, content='Pooled article'):
+    article = Article.create(inputs, POOL_USER_ID)
+    article.complete(content)
+    article.created_at = datetime.now(timezone.utc) - timedelta(hours=age_hours)
+    repo.save(article)
+    return article
+
+
+class TestParseHours(unittest.TestCase):
+    def test_ranges_are_end_exclusive_and_wrap(self):
+        self.assertEqual(parse_hours('2-6'), {2, 3, 4, 5})
+        self.assertEqual(parse_hours('22-1,13'), {22, 23, 0, 13})
+
+    def test_empty_spec_means_every_hour(self):
+        self.assertEqual(parse_hours(''), frozenset(range(24)))
+
+
+@patch.multiple(pool, POOL_SIZE=2, POOL_MIN_REQUESTS=3, POOL_OFF_PEAK_HOURS='2-6')
+class TestRefillPool(unittest.TestCase):
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeJobQueueAdapter()
+        _requested(self.repo, POPULAR, 5)
+        _requested(self.repo, RARE, 1)
+
+    def _pool_articles(self):
+        return [a for a in self.repo.store.values() if a.user_id == POOL_USER_ID]
+
+    def test_queues_missing_stock_for_popular_inputs_only(self):
+        self.assertEqual(refill_pool(self.repo, self.job_queue, now=OFF_PEAK), 2)
+
+        self.assertEqual([a.inputs for a in self._pool_articles()], [POPULAR, POPULAR])
+        self.assertEqual(set(self.job_queue.lanes.values()), {pool.POOL_PRIORITY})
+
+    def test_running_and_fresh_articles_count_as_stock(self):
+        refill_pool(self.repo, self.job_queue, now=OFF_PEAK)
+        self.assertEqual(refill_pool(self.repo, FakeJobQueueAdapter(), now=OFF_PEAK), 0)
+
+    def test_concurrent_refills_enqueue_once(self):
+        results = []
+        workers = [
+            threading.Thread(target=lambda: results.append(refill_pool(self.repo, self.job_queue, now=OFF_PEAK)))
+            for _ in range(2)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(sorted(results), [0, 2])
+        self.assertEqual(len(self._pool_articles()), 2)
+
+    def test_expires_stale_articles_and_replaces_them(self):
+        stale = _pooled(self.repo, POPULAR, age_hours=pool.POOL_MAX_AGE_HOURS + 1)
+        _pooled(self.repo, POPULAR)
+
+        with patch.object(pool, 'POOL_OFF_PEAK_HOURS', ''):
+            self.assertEqual(refill_pool(self.repo, self.job_queue), 1)
+        self.assertEqual(stale.status, ArticleStatus.DELETED)
+
+    def test_expires_stale_articles_beyond_the_first_page(self):
+        stale = [_pooled(self.repo, POPULAR, age_hours=pool.POOL_MAX_AGE_HOURS + 1 + i) for i in range(3)]
+        fresh = [_pooled(self.repo, POPULAR, age_hours=i) for i in range(3)]
+
+        with patch.object(pool, 'POOL_SCAN_PAGE_SIZE', 2), patch.object(pool, 'POOL_OFF_PEAK_HOURS', ''):
+            self.assertEqual(refill_pool(self.repo, self.job_queue), 0)
+        self.assertEqual({a.status for a in stale}, {ArticleStatus.DELETED})
+        self.assertEqual({a.status for a in fresh}, {ArticleStatus.COMPLETED})
+
+    def test_waits_for_off_peak_hours(self):
+        self.assertEqual(refill_pool(self.repo, self.job_queue, now=OFF_PEAK.replace(hour=12)), 0)
+
+    def test_disabled_pool_does_nothing(self):
+        with patch.object(pool, 'POOL_SIZE', 0):
+            self.assertEqual(refill_pool(self.repo, self.job_queue, now=OFF_PEAK), 0)
+        self.assertEqual(self._pool_articles(), [])
+
+
+@patch.multiple(pool, POOL_SIZE=2, POOL_SERVE_RATIO=1.0)
+class TestServeFromPool(unittest.TestCase):
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeAsyncJobQueueAdapter()
+
+    def test_picks_fresh_pool_article_for_inputs(self):
+        source = _pooled(self.repo, POPULAR)
+        _pooled(self.repo, POPULAR, age_hours=pool.POOL_MAX_AGE_HOURS + 1)
+        _pooled(self.repo, RARE)
+
+        self.assertEqual(pick_pool_article(POPULAR, 'user-1', self.repo), source)
+
+    def test_stale_articles_miss(self):
+        _pooled(self.repo, POPULAR, age_hours=pool.POOL_MAX_AGE_HOURS + 1)
+
+        self.assertIsNone(pick_pool_article(POPULAR, 'user-1', self.repo))
+
+    def test_serve_ratio_zero_skips_pool(self):
+        _pooled(self.repo, POPULAR)
+        with patch.object(pool, 'POOL_SERVE_RATIO', 0.0):
+            self.assertIsNone(pick_pool_article(POPULAR, 'user-1', self.repo))
+
+    def test_submit_generation_serves_from_pool_unless_forced(self):
+        source = _pooled(self.repo, POPULAR)
+
+        served = asyncio.run(submit_generation(POPULAR, 'user-1', self.repo, self.job_queue))
+        forced = asyncio.run(submit_generation(POPULAR, 'user-1', self.repo, self.job_queue, force=True))
+
+        self.assertNotEqual(served.id, source.id)
+        self.assertEqual((served.user_id, served.status, served.content), ('user-1', ArticleStatus.COMPLETED, source.content))
+        self.assertEqual(self.job_queue.statuses[served.job_id]['status'], 'completed')
+        self.assertEqual(source.user_id, POOL_USER_ID)
+        self.assertEqual(forced.status, ArticleStatus.RUNNING)
+        self.assertEqual([ctx.article_id for ctx in self.job_queue.queue], [forced.id])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 """Unit tests for article_submission_service module."""
 
+import asyncio
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 import sys
 from pathlib import Path
 
@@ -9,12 +10,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from services.article_submission_service import (
+    cancel_generation,
     submit_generation,
+    submit_generation_batch,
     _check_duplicate,
     _enqueue_job,
 )
 from adapter.fake.article_repository import FakeArticleRepository
-from adapter.fake.job_queue import FakeJobQueueAdapter
+from adapter.fake.job_queue import FakeAsyncJobQueueAdapter
 from domain.model.article import (
     Article,
     ArticleInputs,
@@ -25,6 +28,7 @@ from domain.model.errors import (
     EnqueueError,
     DomainError,
 )
+from domain.model.job import QUEUED_MESSAGE
 
 
 TEST_INPUTS = ArticleInputs(language='German', level='B2', length='500', topic='AI')
@@ -36,17 +40,17 @@ class TestSubmitGeneration(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.repo = FakeArticleRepository()
-        self.job_queue = FakeJobQueueAdapter()
+        self.job_queue = FakeAsyncJobQueueAdapter()
 
     def test_submit_generation_success(self):
         """Test successful article submission."""
-        article = submit_generation(
+        article = asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=False,
-        )
+        ))
 
         self.assertIsNotNone(article)
         self.assertEqual(article.user_id, 'user-123')
@@ -57,13 +61,13 @@ class TestSubmitGeneration(unittest.TestCase):
 
     def test_submit_generation_creates_article_in_repo(self):
         """Test that submitted article is saved to repository."""
-        article = submit_generation(
+        article = asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=False,
-        )
+        ))
 
         saved_article = self.repo.get_by_id(article.id)
         self.assertIsNotNone(saved_article)
@@ -71,55 +75,55 @@ class TestSubmitGeneration(unittest.TestCase):
 
     def test_submit_generation_enqueues_job(self):
         """Test that job is enqueued in job queue."""
-        article = submit_generation(
+        article = asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=False,
-        )
+        ))
 
-        status = self.job_queue.get_status(article.job_id)
+        status = self.job_queue.inner.get_status(article.job_id)
         self.assertIsNotNone(status)
         self.assertEqual(status['status'], 'queued')
         self.assertEqual(status['article_id'], article.id)
 
     def test_submit_generation_raises_duplicate_error(self):
         """Test that duplicate article raises DuplicateArticleError."""
-        submit_generation(
+        asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=False,
-        )
+        ))
 
         with self.assertRaises(DuplicateArticleError):
-            submit_generation(
+            asyncio.run(submit_generation(
                 inputs=TEST_INPUTS,
                 user_id='user-123',
                 repo=self.repo,
                 job_queue=self.job_queue,
                 force=False,
-            )
+            ))
 
     def test_submit_generation_force_skips_duplicate_check(self):
         """Test that force=True bypasses duplicate checking."""
-        submit_generation(
+        asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=False,
-        )
+        ))
 
-        article = submit_generation(
+        article = asyncio.run(submit_generation(
             inputs=TEST_INPUTS,
             user_id='user-123',
             repo=self.repo,
             job_queue=self.job_queue,
             force=True,
-        )
+        ))
 
         self.assertIsNotNone(article)
 
@@ -128,16 +132,16 @@ class TestSubmitGeneration(unittest.TestCase):
         mock_repo = MagicMock()
         mock_repo.save.return_value = False
         mock_repo.find_duplicate.return_value = None
-        mock_job_queue = MagicMock()
+        mock_job_queue = AsyncMock()
 
         with self.assertRaises(DomainError) as ctx:
-            submit_generation(
+            asyncio.run(submit_generation(
                 inputs=TEST_INPUTS,
                 user_id='user-123',
                 repo=mock_repo,
                 job_queue=mock_job_queue,
                 force=False,
-            )
+            ))
 
         self.assertIn("Failed to save article", str(ctx.exception))
 
@@ -148,56 +152,137 @@ class TestSubmitGeneration(unittest.TestCase):
         mock_repo.find_duplicate.return_value = None
         mock_repo.update_status.return_value = True
 
-        mock_job_queue = MagicMock()
+        mock_job_queue = AsyncMock()
         mock_job_queue.update_status.return_value = True
         mock_job_queue.enqueue.return_value = False
 
         with self.assertRaises(EnqueueError) as ctx:
-            submit_generation(
+            asyncio.run(submit_generation(
                 inputs=TEST_INPUTS,
                 user_id='user-123',
                 repo=mock_repo,
                 job_queue=mock_job_queue,
                 force=False,
-            )
+            ))
 
         self.assertIn("Failed to enqueue job", str(ctx.exception))
 
 
+class TestReuseAcrossUsers(unittest.TestCase):
+    """Test submit_generation with reuse of other users' articles."""
+
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        self.other = Article.create(TEST_INPUTS, 'user-other')
+        self.other.complete('Shared content')
+        self.repo.save(self.other)
+
+    def test_reuse_copies_completed_article_of_another_user(self):
+        inputs = ArticleInputs(language='german', level='B2', length='500', topic='  ai ')
+        article = asyncio.run(submit_generation(inputs, 'user-123', self.repo, self.job_queue, reuse=True))
+
+        self.assertNotEqual(article.id, self.other.id)
+        self.assertEqual((article.user_id, article.status, article.content), ('user-123', ArticleStatus.COMPLETED, 'Shared content'))
+        self.assertEqual(self.job_queue.statuses[article.job_id]['status'], 'completed')
+        self.assertEqual(len(self.job_queue.queue), 0)
+
+    def test_without_reuse_generates(self):
+        article = asyncio.run(submit_generation(TEST_INPUTS, 'user-123', self.repo, self.job_queue))
+
+        self.assertEqual(article.status, ArticleStatus.RUNNING)
+        self.assertEqual(len(self.job_queue.queue), 1)
+
+    def test_reuse_attaches_to_in_flight_job(self):
+        self.other.status = ArticleStatus.RUNNING
+        leader = asyncio.run(submit_generation(TEST_INPUTS, 'user-other-2', self.repo, self.job_queue, force=True))
+
+        article = asyncio.run(submit_generation(TEST_INPUTS, 'user-123', self.repo, self.job_queue, reuse=True))
+
+        self.assertEqual(article.status, ArticleStatus.RUNNING)
+        self.assertEqual([ctx.job_id for ctx in self.job_queue.queue], [leader.job_id])
+        self.assertEqual(self.job_queue.inner.followers[leader.job_id][0]['job_id'], article.job_id)
+        self.assertEqual(self.job_queue.statuses[article.job_id]['status'], 'queued')
+
+    def test_without_reuse_does_not_attach(self):
+        self.other.status = ArticleStatus.RUNNING
+        asyncio.run(submit_generation(TEST_INPUTS, 'user-other-2', self.repo, self.job_queue, force=True))
+
+        asyncio.run(submit_generation(TEST_INPUTS, 'user-123', self.repo, self.job_queue))
+
+        self.assertEqual(len(self.job_queue.queue), 2)
+
+    def test_cancelling_the_attached_job_promotes_a_follower(self):
+        self.other.status = ArticleStatus.RUNNING
+        leader = asyncio.run(submit_generation(TEST_INPUTS, 'user-other-2', self.repo, self.job_queue, force=True))
+        first = asyncio.run(submit_generation(TEST_INPUTS, 'user-123', self.repo, self.job_queue, reuse=True))
+        second = asyncio.run(submit_generation(TEST_INPUTS, 'user-456', self.repo, self.job_queue, reuse=True))
+
+        self.assertTrue(asyncio.run(cancel_generation(self.repo, self.job_queue, leader)))
+
+        self.assertEqual(self.job_queue.statuses[leader.job_id]['status'], 'cancelled')
+        self.assertEqual([ctx.job_id for ctx in self.job_queue.queue], [first.job_id])
+        self.assertEqual(self.job_queue.inner.inflight[TEST_INPUTS.fingerprint], first.job_id)
+        self.assertEqual(self.job_queue.inner.followers[first.job_id][0]['job_id'], second.job_id)
+        self.assertEqual(self.job_queue.statuses[second.job_id]['status'], 'queued')
+
+    def test_enqueue_failure_releases_followers_that_attached_meanwhile(self):
+        self.other.status = ArticleStatus.RUNNING
+        enqueue = self.job_queue.enqueue
+        attached = []
+
+        async def fail_after_a_follower_attaches(article, priority=None):
+            if not attached:
+                attached.append(await submit_generation(TEST_INPUTS, 'user-456', self.repo, self.job_queue, reuse=True))
+                return False
+            return await enqueue(article, priority)
+
+        self.job_queue.enqueue = fail_after_a_follower_attaches
+
+        with self.assertRaises(EnqueueError):
+            asyncio.run(submit_generation(TEST_INPUTS, 'user-123', self.repo, self.job_queue, reuse=True))
+
+        follower = attached[0]
+        self.assertEqual([ctx.job_id for ctx in self.job_queue.queue], [follower.job_id])
+        self.assertEqual(self.job_queue.inner.inflight[TEST_INPUTS.fingerprint], follower.job_id)
+        self.assertEqual(self.job_queue.statuses[follower.job_id]['message'], QUEUED_MESSAGE)
+
+
+
 class TestCheckDuplicate(unittest.TestCase):
     """Test _check_duplicate function."""
 
     def setUp(self):
         """Set up test fixtures."""
         self.repo = FakeArticleRepository()
-        self.job_queue = FakeJobQueueAdapter()
+        self.job_queue = FakeAsyncJobQueueAdapter()
 
     def test_check_duplicate_returns_if_force_is_true(self):
         """Test that no error is raised when force=True."""
-        _check_duplicate(
+        asyncio.run(_check_duplicate(
             repo=self.repo,
             job_queue=self.job_queue,
             inputs=TEST_INPUTS,
             force=True,
             user_id='user-123',
-        )
+        ))
 
     def test_check_duplicate_returns_if_no_duplicate_exists(self):
         """Test that no error is raised when no duplicate exists."""
-        _check_duplicate(
+        asyncio.run(_check_duplicate(
             repo=self.repo,
             job_queue=self.job_queue,
             inputs=TEST_INPUTS,
             force=False,
             user_id='user-123',
-        )
+        ))
 
     def test_check_duplicate_raises_with_job_status(self):
         """Test that DuplicateArticleError includes job status when available."""
         article = Article.create(TEST_INPUTS, 'user-123')
         self.repo.save(article)
 
-        self.job_queue.update_status(
+        self.job_queue.inner.update_status(
             job_id=article.job_id,
             status='running',
             progress=50,
@@ -205,13 +290,13 @@ class TestCheckDuplicate(unittest.TestCase):
         )
 
         with self.assertRaises(DuplicateArticleError) as ctx:
-            _check_duplicate(
+            asyncio.run(_check_duplicate(
                 repo=self.repo,
                 job_queue=self.job_queue,
                 inputs=TEST_INPUTS,
                 force=False,
                 user_id='user-123',
-            )
+            ))
 
         error = ctx.exception
         self.assertEqual(error.article_id, article.id)
@@ -225,13 +310,13 @@ class TestCheckDuplicate(unittest.TestCase):
         self.repo.save(article)
 
         with self.assertRaises(DuplicateArticleError) as ctx:
-            _check_duplicate(
+            asyncio.run(_check_duplicate(
                 repo=self.repo,
                 job_queue=self.job_queue,
                 inputs=TEST_INPUTS,
                 force=False,
                 user_id='user-123',
-            )
+            ))
 
         error = ctx.exception
         self.assertEqual(error.article_id, article.id)
@@ -244,42 +329,42 @@ class TestEnqueueJob(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.repo = FakeArticleRepository()
-        self.job_queue = FakeJobQueueAdapter()
+        self.job_queue = FakeAsyncJobQueueAdapter()
         self.article = Article.create(TEST_INPUTS, 'user-123')
 
     def test_enqueue_job_success(self):
         """Test successful job enqueueing."""
-        _enqueue_job(
+        asyncio.run(_enqueue_job(
             job_queue=self.job_queue,
             repo=self.repo,
             article=self.article,
-        )
+        ))
 
-        status = self.job_queue.get_status(self.article.job_id)
+        status = self.job_queue.inner.get_status(self.article.job_id)
         self.assertEqual(status['status'], 'queued')
 
-        ctx = self.job_queue.dequeue()
+        ctx = self.job_queue.inner.dequeue()
         self.assertIsNotNone(ctx)
         self.assertEqual(ctx.job_id, self.article.job_id)
         self.assertEqual(ctx.article_id, self.article.id)
 
     def test_enqueue_job_raises_if_update_status_fails(self):
         """Test EnqueueError when update_status fails."""
-        mock_queue = MagicMock()
+        mock_queue = AsyncMock()
         mock_queue.update_status.return_value = False
 
         with self.assertRaises(EnqueueError) as ctx:
-            _enqueue_job(
+            asyncio.run(_enqueue_job(
                 job_queue=mock_queue,
                 repo=self.repo,
                 article=self.article,
-            )
+            ))
 
         self.assertIn("Failed to initialize job status", str(ctx.exception))
 
     def test_enqueue_job_raises_if_enqueue_fails(self):
         """Test EnqueueError when enqueue fails."""
-        mock_queue = MagicMock()
+        mock_queue = AsyncMock()
         mock_queue.update_status.return_value = True
         mock_queue.enqueue.return_value = False
 
@@ -287,29 +372,101 @@ class TestEnqueueJob(unittest.TestCase):
         mock_repo.update_status.return_value = True
 
         with self.assertRaises(EnqueueError) as ctx:
-            _enqueue_job(
+            asyncio.run(_enqueue_job(
                 job_queue=mock_queue,
                 repo=mock_repo,
                 article=self.article,
-            )
+            ))
 
         self.assertIn("Failed to enqueue job", str(ctx.exception))
         mock_repo.update_status.assert_called()
 
     def test_enqueue_job_passes_correct_inputs(self):
         """Test that correct inputs dictionary is passed to enqueue."""
-        _enqueue_job(
+        asyncio.run(_enqueue_job(
             job_queue=self.job_queue,
             repo=self.repo,
             article=self.article,
-        )
+        ))
 
-        ctx = self.job_queue.dequeue()
+        ctx = self.job_queue.inner.dequeue()
         self.assertEqual(ctx.inputs.language, TEST_INPUTS.language)
         self.assertEqual(ctx.inputs.level, TEST_INPUTS.level)
         self.assertEqual(ctx.inputs.length, TEST_INPUTS.length)
         self.assertEqual(ctx.inputs.topic, TEST_INPUTS.topic)
 
 
+class TestSubmitGenerationBatch(unittest.TestCase):
+    """Test submit_generation_batch function."""
+
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeAsyncJobQueueAdapter()
+        self.other_inputs = ArticleInputs(language='French', level='A2', length='300', topic='Food')
+
+    def _submit(self, inputs_list, force=False):
+        return asyncio.run(submit_generation_batch(
+            inputs_list, 'user-123', self.repo, self.job_queue, force,
+        ))
+
+    def test_batch_creates_and_enqueues_each_item(self):
+        results = self._submit([TEST_INPUTS, self.other_inputs])
+
+        self.assertEqual([type(r) for r in results], [Article, Article])
+        self.assertEqual(len(self.repo.store), 2)
+        self.assertEqual(len(self.job_queue.queue), 2)
+        for article in results:
+            self.assertEqual(self.job_queue.statuses[article.job_id]['status'], 'queued')
+            self.assertEqual(self.job_queue.statuses[article.job_id]['article_id'], article.id)
+
+    def test_batch_reports_existing_duplicate_per_item(self):
+        existing = Article.create(TEST_INPUTS, 'user-123')
+        self.repo.save(existing)
+
+        results = self._submit([TEST_INPUTS, self.other_inputs])
+
+        self.assertIsInstance(results[0], DuplicateArticleError)
+        self.assertEqual(results[0].article_id, existing.id)
+        self.assertIsInstance(results[1], Article)
+        self.assertEqual(len(self.job_queue.queue), 1)
+
+    def test_repeated_inputs_in_batch_are_duplicates(self):
+        results = self._submit([TEST_INPUTS, TEST_INPUTS])
+
+        self.assertIsInstance(results[0], Article)
+        self.assertIsInstance(results[1], DuplicateArticleError)
+        self.assertEqual(results[1].article_id, results[0].id)
+
+    def test_force_skips_duplicate_checks(self):
+        results = self._submit([TEST_INPUTS, TEST_INPUTS], force=True)
+
+        self.assertEqual([type(r) for r in results], [Article, Article])
+
+    def test_enqueue_failure_marks_only_that_item_failed(self):
+        self.job_queue.enqueue_many = AsyncMock(return_value=[True, False])
+        self.job_queue.update_status = AsyncMock(return_value=True)
+
+        results = self._submit([TEST_INPUTS, self.other_inputs])
+
+        self.assertIsInstance(results[0], Article)
+        self.assertIsInstance(results[1], EnqueueError)
+        failed = [a for a in self.repo.store.values() if a.status == ArticleStatus.FAILED]
+        self.assertEqual(len(failed), 1)
+        self.job_queue.update_status.assert_awaited_once()
+
+    def test_save_failure_skips_enqueue_for_unsaved_items(self):
+        repo = MagicMock()
+        repo.find_duplicates.return_value = {}
+        repo.save_many.side_effect = lambda articles: {articles[0].id}
+
+        results = asyncio.run(submit_generation_batch(
+            [TEST_INPUTS, self.other_inputs], 'user-123', repo, self.job_queue,
+        ))
+
+        self.assertIsInstance(results[0], Article)
+        self.assertIsInstance(results[1], DomainError)
+        self.assertEqual(len(self.job_queue.queue), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+"""Unit tests for lemma_extraction module (NLP path rules and routing)."""
+
+import asyncio
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from services.lemma_extraction import extract_lemma, resolve_lemma
+from adapter.fake.llm import FakeLLMAdapter
+from adapter.fake.nlp import FakeNLPAdapter
+
+
+def _verb_info(lemma, text, prefix=None, reflexive=None, parts=None):
+    return {
+        "text": text, "lemma": lemma, "pos": "verb", "xpos": None,
+        "gender": None, "prefix": prefix, "reflexive": reflexive,
+        "parts": parts or [text],
+    }
+
+
+class TestResolveLemma(unittest.TestCase):
+    """Test per-language resolve_lemma rules."""
+
+    def test_german_separable_reflexive(self):
+        info = _verb_info("bereiten", "bereitet", prefix="vor", reflexive="sich",
+                          parts=["bereitet", "sich", "vor"])
+
+        lemma, related = resolve_lemma(info, "bereitet", "German")
+
+        self.assertEqual(lemma, "sich vorbereiten")
+        self.assertEqual(related, ["bereitet", "sich", "vor"])
+
+    def test_german_article_lowercased(self):
+        info = {"text": "Die", "lemma": "der", "pos": "det", "xpos": "ART"}
+
+        self.assertEqual(resolve_lemma(info, "Die", "German"), ("die", ["Die"]))
+
+    def test_english_phrasal_particle(self):
+        info = _verb_info("give", "gave", prefix="up", parts=["gave", "up"])
+
+        lemma, related = resolve_lemma(info, "gave", "English")
+
+        self.assertEqual(lemma, "give up")
+        self.assertEqual(related, ["gave", "up"])
+
+    def test_english_article_rule_not_applied(self):
+        info = {"text": "The", "lemma": "the", "pos": "det", "xpos": "ART"}
+
+        self.assertEqual(resolve_lemma(info, "The", "English"), ("the", ["The"]))
+
+    def test_french_reflexive(self):
+        info = _verb_info("lever", "lève", reflexive="se", parts=["se", "lève"])
+
+        self.assertEqual(resolve_lemma(info, "lève", "French")[0], "se lever")
+
+    def test_french_reflexive_elision(self):
+        info = _verb_info("appeler", "appelle", reflexive="m'", parts=["m'", "appelle"])
+
+        self.assertEqual(resolve_lemma(info, "appelle", "French")[0], "s'appeler")
+
+    def test_french_reflexive_aspirated_h(self):
+        mute = _verb_info("habiller", "habille", reflexive="s'", parts=["s'", "habille"])
+        aspirated = _verb_info("hâter", "hâte", reflexive="se", parts=["se", "hâte"])
+
+        self.assertEqual(resolve_lemma(mute, "habille", "French")[0], "s'habiller")
+        self.assertEqual(resolve_lemma(aspirated, "hâte", "French")[0], "se hâter")
+
+    def test_spanish_clitic(self):
+        info = _verb_info("levantar", "levanta", reflexive="se", parts=["se", "levanta"])
+
+        lemma, related = resolve_lemma(info, "levanta", "Spanish")
+
+        self.assertEqual(lemma, "levantarse")
+        self.assertEqual(related, ["se", "levanta"])
+
+    def test_spanish_without_clitic(self):
+        info = _verb_info("comer", "come")
+
+        self.assertEqual(resolve_lemma(info, "come", "Spanish")[0], "comer")
+
+
+class TestExtractLemmaRouting(unittest.TestCase):
+    """Test NLP vs LLM routing in extract_lemma."""
+
+    def test_supported_language_uses_nlp(self):
+        nlp = FakeNLPAdapter(result=_verb_info("give", "gave", prefix="up", parts=["gave", "up"]))
+        llm = FakeLLMAdapter(response='{"level": "B1"}')
+
+        result, _ = asyncio.run(extract_lemma("gave", "She gave up.", "English", llm, nlp=nlp))
+
+        self.assertEqual(result["lemma"], "give up")
+        self.assertEqual(result["level"], "B1")
+        self.assertEqual(len(nlp.calls), 1)
+
+    def test_unsupported_language_skips_nlp(self):
+        nlp = FakeNLPAdapter(result=_verb_info("x", "x"), languages={"German"})
+        llm = FakeLLMAdapter(response='{"lemma": "dom", "related_words": ["dom"], "level": "A1"}')
+
+        result, _ = asyncio.run(extract_lemma("dom", "To jest dom.", "Polish", llm, nlp=nlp))
+
+        self.assertEqual(result["lemma"], "dom")
+        self.assertEqual(nlp.calls, [])
+
+    def test_nlp_not_ready_uses_llm(self):
+        nlp = FakeNLPAdapter(result=_verb_info("geben", "gab"), ready=False)
+        llm = FakeLLMAdapter(response='{"lemma": "aufgeben", "related_words": ["gab", "auf"], "level": "B1"}')
+
+        result, _ = asyncio.run(extract_lemma("gab", "Er gab auf.", "German", llm, nlp=nlp))
+
+        self.assertEqual(result["lemma"], "aufgeben")
+        self.assertEqual(nlp.calls, [])
+
+    def test_nlp_failure_falls_back_to_llm(self):
+        nlp = FakeNLPAdapter(result=None)
+        llm = FakeLLMAdapter(response='{"lemma": "aufgeben", "related_words": ["gab", "auf"], "level": "B1"}')
+
+        result, _ = asyncio.run(extract_lemma("gab", "Er gab auf.", "German", llm, nlp=nlp))
+
+        self.assertEqual(result["lemma"], "aufgeben")
+        self.assertEqual(len(nlp.calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Unit tests for worker_scaling module."""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from services.worker_scaling import DEFAULT_JOB_SECONDS, recommend_worker_count
+
+
+def _metrics(depth=0, in_flight=0, workers=0, slots=0, avg_seconds=None):
+    return {
+        'depth': depth,
+        'in_flight': in_flight,
+        'workers': workers,
+        'slots': slots,
+        'processing_time': {'avg_seconds': avg_seconds},
+    }
+
+
+class TestRecommendWorkerCount(unittest.TestCase):
+    """Test recommend_worker_count function."""
+
+    def test_backlog_sized_by_average_job_time(self):
+        # 2 running + ceil(10 jobs * 120s / 60s) = 22 slots at 4 per worker
+        result = recommend_worker_count(_metrics(depth=10, in_flight=2, workers=2, slots=8, avg_seconds=120))
+
+        self.assertEqual(result['required_slots'], 22)
+        self.assertEqual(result['per_worker_concurrency'], 4)
+        self.assertEqual(result['recommended_workers'], 6)
+
+    def test_default_job_time_without_history(self):
+        result = recommend_worker_count(_metrics(depth=1), target_wait_seconds=DEFAULT_JOB_SECONDS)
+
+        self.assertEqual(result['avg_job_seconds'], DEFAULT_JOB_SECONDS)
+        self.assertEqual(result['recommended_workers'], 1)
+
+    def test_clamped_to_min_and_max(self):
+        self.assertEqual(recommend_worker_count(_metrics(), min_workers=2)['recommended_workers'], 2)
+        busy = _metrics(depth=1000, avg_seconds=300)
+        self.assertEqual(recommend_worker_count(busy, max_workers=5)['recommended_workers'], 5)
+
+    def test_explicit_concurrency_overrides_heartbeats(self):
+        result = recommend_worker_count(_metrics(in_flight=6, workers=1, slots=2), concurrency=3)
+
+        self.assertEqual(result['recommended_workers'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
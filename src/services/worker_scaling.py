@@ -0,0 +1,47 @@
+"""Worker autoscaling recommendation from queue telemetry."""
+
+import math
+import os
+
+# Queued jobs should start within this many seconds
+TARGET_WAIT_SECONDS = int(os.getenv('WORKER_TARGET_WAIT_SECONDS', '60'))
+# Assumed job duration until the processing-time histogram has data
+DEFAULT_JOB_SECONDS = 180
+MIN_WORKERS = int(os.getenv('WORKER_MIN_COUNT', '1'))
+MAX_WORKERS = int(os.getenv('WORKER_MAX_COUNT', '20'))
+
+
+def recommend_worker_count(
+    metrics: dict,
+    concurrency: int | None = None,
+    target_wait_seconds: float = TARGET_WAIT_SECONDS,
+    min_workers: int = MIN_WORKERS,
+    max_workers: int = MAX_WORKERS,
+) -> dict:
+    """Recommend how many worker processes should run.
+
+    Keeps every running job in a slot and adds enough slots to work the
+    backlog off within target_wait_seconds at the average processing time:
+
+        slots = in_flight + ceil(depth * avg_job_seconds / target_wait_seconds)
+
+    Slots are converted to workers with the per-worker concurrency
+    reported in heartbeats (or `concurrency` when no worker is alive).
+    """
+    depth = metrics.get('depth', 0)
+    in_flight = metrics.get('in_flight', 0)
+    avg_job_seconds = metrics.get('processing_time', {}).get('avg_seconds') or DEFAULT_JOB_SECONDS
+    if concurrency is None:
+        workers, slots = metrics.get('workers', 0), metrics.get('slots', 0)
+        concurrency = slots // workers if workers and slots else 1
+    concurrency = max(1, concurrency)
+
+    required_slots = in_flight + math.ceil(depth * avg_job_seconds / max(1, target_wait_seconds))
+    recommended = min(max_workers, max(min_workers, math.ceil(required_slots / concurrency)))
+    return {
+        'recommended_workers': recommended,
+        'required_slots': required_slots,
+        'per_worker_concurrency': concurrency,
+        'avg_job_seconds': avg_job_seconds,
+        'target_wait_seconds': target_wait_seconds,
+    }
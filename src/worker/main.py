@@ -1,8 +1,11 @@
 """Worker service entry point."""
 
 #!/usr/bin/env python
+import os
 import sys
 import logging
+import signal
+import threading
 from pathlib import Path
 
 # Add src to path
@@ -16,6 +19,8 @@ from adapter.mongodb.vocabulary_repository import MongoVocabularyRepository
 from adapter.mongodb.connection import get_mongodb_client, DATABASE_NAME
 from adapter.external.litellm import LiteLLMAdapter
 from adapter.queue.redis_job_queue import RedisJobQueueAdapter
+from adapter.cache.redis_scrape_cache import RedisScrapeCache
+from adapter.cache.redis_search_cache import RedisSearchCache
 from functools import partial
 from adapter.crew.article_generator import CrewAIArticleGenerator
 from services.article_generation_service import generate_article
@@ -26,6 +31,19 @@ setup_structured_logging()
 logger = logging.getLogger(__name__)
 
 
+def _install_stop_handlers() -> threading.Event:
+    """Set the returned event on SIGTERM/SIGINT so the loop drains and exits."""
+    stop = threading.Event()
+
+    def handle(signum, _frame):
+        logger.info("Shutdown signal received, draining jobs", extra={"signal": signal.Signals(signum).name})
+        stop.set()
+
+    signal.signal(signal.SIGTERM, handle)
+    signal.signal(signal.SIGINT, handle)
+    return stop
+
+
 def main():
     """Main entry point for worker service."""
     logger.info("Starting OPAD Worker service...")
@@ -44,7 +62,11 @@ def main():
 
         # Job queue and article generator via ports
         job_queue = RedisJobQueueAdapter()
-        generator = CrewAIArticleGenerator(job_queue)
+        generator = CrewAIArticleGenerator(
+            job_queue,
+            search_cache=RedisSearchCache(),
+            scrape_cache=RedisScrapeCache(),
+        )
         generate = partial(
             generate_article,
             generator=generator,
@@ -54,7 +76,12 @@ def main():
             llm=llm,
         )
 
-        run_worker_loop(repo, job_queue, generate)
+        unfinished = run_worker_loop(repo, job_queue, generate, stop=_install_stop_handlers())
+        if unfinished:
+            # Interpreter shutdown would join the hung job threads; recovery requeues their jobs
+            logger.warning("Exiting with unfinished jobs", extra={"jobIds": unfinished})
+            logging.shutdown()
+            os._exit(1)
     except KeyboardInterrupt:
         logger.info("Worker stopped")
     except Exception as e:
@@ -3,19 +3,99 @@
 Architecture:
     JobQueuePort -> dequeue() -> process_job() -> generate_article() -> ArticleRepository
                                       |
+                              JobQueuePort.close_inflight() (jobs attached to it)
                               JobQueuePort.update_status()
+                              JobQueuePort.heartbeat() (background, while running)
+                              JobQueuePort.ack() (when finished, before the final status)
+
+The loop also calls JobQueuePort.recover_stalled() periodically so jobs
+left behind by a crashed worker are requeued (or dead-lettered), and
+JobQueuePort.claim_due_schedules() to start scheduled generations, and
+refill_pool() to keep the pre-generated article pool stocked. It
+publishes a worker heartbeat (capacity + in-flight job ids) every
+WORKER_HEARTBEAT_INTERVAL and records each job's processing time, which
+is what queue telemetry and autoscaling read. These periodic tasks run
+before waiting for a slot so they keep going while every slot is busy.
+
+Jobs are almost entirely waiting on LLM/search/scrape I/O, so one process
+runs up to WORKER_CONCURRENCY of them on a thread pool. The loop only
+dequeues when a slot is free, so jobs never sit claimed but idle in this
+worker's processing list. On SIGTERM it stops dequeuing and waits up to
+WORKER_DRAIN_TIMEOUT for running jobs. Jobs still running then are left
+to recovery (their heartbeats expire once the process is gone), and
+worker.main exits at once instead of joining their threads.
 """
 
 import logging
+import os
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
 
-from domain.model.job import JobContext
+from domain.model.errors import JobCancelledError
+from domain.model.job import QUEUED_MESSAGE, JobContext
 from port.article_repository import ArticleRepository
 from port.job_queue import JobQueuePort
-from domain.model.article import ArticleStatus
+from services.article_pool_service import POOL_REFILL_INTERVAL, refill_pool
+from domain.model.article import Article, ArticleStatus
 
 logger = logging.getLogger(__name__)
 
+# Must stay well below the queue's visibility timeout
+HEARTBEAT_INTERVAL = int(os.getenv('JOB_HEARTBEAT_INTERVAL', '30'))
+RECOVERY_INTERVAL = int(os.getenv('JOB_RECOVERY_INTERVAL', '60'))
+SCHEDULE_INTERVAL = int(os.getenv('JOB_SCHEDULE_INTERVAL', '30'))
+# Must stay well below the telemetry's worker info TTL (60s)
+WORKER_HEARTBEAT_INTERVAL = int(os.getenv('WORKER_HEARTBEAT_INTERVAL', '15'))
+WORKER_CONCURRENCY = max(1, int(os.getenv('WORKER_CONCURRENCY', '1')))
+WORKER_DRAIN_TIMEOUT = int(os.getenv('WORKER_DRAIN_TIMEOUT', '300'))
+# Long blocking wait per dequeue; must stay below REDIS_SOCKET_TIMEOUT
+DEQUEUE_TIMEOUT = int(os.getenv('JOB_DEQUEUE_TIMEOUT', '10'))
+MAX_ERROR_BACKOFF = 30
+# Scheduled jobs have no one waiting on them, so they yield to interactive ones
+SCHEDULED_PRIORITY = os.getenv('JOB_SCHEDULED_PRIORITY', 'low')
+
+
+class _JobHeartbeat:
+    """Refresh a job's heartbeat on a background thread while it runs.
+
+    release() stops it and acks the job; leaving the block does too.
+    """
+
+    def __init__(self, job_queue: JobQueuePort, job_id: str, interval: float = HEARTBEAT_INTERVAL):
+        self.job_queue = job_queue
+        self.job_id = job_id
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{job_id}", daemon=True)
+        self._released = False
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.job_queue.heartbeat(self.job_id)
+
+    def release(self) -> None:
+        """Stop the heartbeat and ack the job (once).
+
+        Called before the job's terminal status is written, so a retry
+        that sees that status never finds the job still claimed.
+        """
+        if self._released:
+            return
+        self._released = True
+        self._stop.set()
+        self._thread.join(timeout=self.interval)
+        self.job_queue.ack(self.job_id)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
 
 def _translate_error(error: Exception) -> str:
     """Translate technical error to user-friendly message."""
@@ -35,65 +115,274 @@ def process_job(
     job_queue: JobQueuePort,
     generate: Callable[..., bool] | None = None,
 ) -> bool:
-    """Process a single job from the queue."""
+    """Process a single job from the queue.
 
-    def mark_failed(message: str, error: str | None = None):
+    Keeps the job's heartbeat alive while it runs and acks it whatever the
+    outcome, before its terminal status is written. The processing time is
+    recorded for telemetry under the job's final status; jobs skipped
+    because they were cancelled before starting did no work and are left
+    out.
+    """
+    started = time.monotonic()
+    outcome = 'failed'
+    with _JobHeartbeat(job_queue, ctx.job_id) as heartbeat:
+        try:
+            outcome = _run_job(ctx, repo, job_queue, generate, heartbeat.release)
+            return outcome == 'completed'
+        finally:
+            if outcome != 'skipped':
+                job_queue.record_processing_time(time.monotonic() - started, outcome)
+
+
+def _run_job(
+    ctx: JobContext,
+    repo: ArticleRepository,
+    job_queue: JobQueuePort,
+    generate: Callable[..., bool] | None,
+    release: Callable[[], None],
+) -> str:
+    """Run a dequeued job and record its outcome.
+
+    Calls release (ack) before writing the terminal status. Returns
+    'completed', 'failed', 'cancelled' or 'skipped' (cancelled before it
+    started).
+    """
+
+    def mark_failed(message: str, error: str | None = None) -> str:
+        _settle_followers(ctx, repo, job_queue)
+        release()
         job_queue.update_status(ctx.job_id, 'failed', 0, message, error, ctx.article_id)
         if ctx.article_id:
             repo.update_status(ctx.article_id, ArticleStatus.FAILED)
+        return 'failed'
+
+    if job_queue.is_cancelled(ctx.job_id):
+        logger.info("Skipping cancelled job", extra=ctx.log_extra)
+        _settle_followers(ctx, repo, job_queue, requeue=True)
+        return 'skipped'
 
     logger.info("Processing job", extra=ctx.log_extra)
     job_queue.update_status(ctx.job_id, 'running', 0, 'Starting article generation...', article_id=ctx.article_id)
 
     try:
         if not generate:
-            mark_failed('Internal configuration error', 'generate function is None')
-            return False
+            return mark_failed('Internal configuration error', 'generate function is None')
 
         article = repo.get_by_id(ctx.article_id) if ctx.article_id else None
         if not article:
-            mark_failed('Article not found', f'Article {ctx.article_id} not found in database')
-            return False
+            return mark_failed('Article not found', f'Article {ctx.article_id} not found in database')
 
-        success = generate(article=article, user_id=ctx.user_id, inputs=ctx.inputs, job_id=ctx.job_id)
+        if not generate(article=article, user_id=ctx.user_id, inputs=ctx.inputs, job_id=ctx.job_id):
+            return mark_failed('Failed to generate or save article', 'Generation returned False')
 
-        if success:
-            job_queue.update_status(ctx.job_id, 'completed', 100, 'Article generated successfully!', article_id=ctx.article_id)
-            logger.info("Job completed", extra=ctx.log_extra)
-        else:
-            mark_failed('Failed to generate or save article', 'Generation returned False')
-
-        return success
+        _settle_followers(ctx, repo, job_queue, article)
+        release()
+        job_queue.update_status(ctx.job_id, 'completed', 100, 'Article generated successfully!', article_id=ctx.article_id)
+        # Failed or cancelled attempts keep theirs so a retry can resume
+        job_queue.clear_checkpoints(ctx.job_id)
+        logger.info("Job completed", extra=ctx.log_extra)
+        return 'completed'
 
+    except JobCancelledError:
+        logger.info("Job cancelled while running", extra=ctx.log_extra)
+        _settle_followers(ctx, repo, job_queue, requeue=True)
+        release()
+        job_queue.update_status(ctx.job_id, 'cancelled', 0, 'Job cancelled', article_id=ctx.article_id)
+        return 'cancelled'
     except Exception as e:
         logger.error(f"Job failed: {e}", extra={**ctx.log_extra, "error": str(e)})
-        mark_failed(_translate_error(e), f"{type(e).__name__}: {str(e)[:200]}")
-        return False
+        return mark_failed(_translate_error(e), f"{type(e).__name__}: {str(e)[:200]}")
+
+
+def _settle_followers(
+    ctx: JobContext,
+    repo: ArticleRepository,
+    job_queue: JobQueuePort,
+    article: Article | None = None,
+    requeue: bool = False,
+) -> None:
+    """Finish the jobs attached to this one (in-flight fan-in).
+
+    Closes the job's in-flight entry first, so no job attaches after this,
+    and detaches its followers. Each gets a copy of the completed article;
+    without one, requeue enqueues it as a job of its own (this job was
+    cancelled, so its owner's choice does not end theirs), otherwise it is
+    marked failed. Followers cancelled meanwhile are skipped.
+    """
+    for follower in job_queue.close_inflight(ctx.job_id, ctx.inputs):
+        job_id, article_id = follower['job_id'], follower.get('article_id')
+        if job_queue.is_cancelled(job_id) or not article_id:
+            continue
+        copy = repo.get_by_id(article_id)
+        if copy and article is not None and article.status == ArticleStatus.COMPLETED:
+            copy.complete(article.content or '', article.source, list(article.edit_history))
+            repo.save(copy)
+            job_queue.update_status(job_id, 'completed', 100, 'Article generated successfully!', article_id=article_id)
+            continue
+        if copy and requeue and job_queue.update_status(job_id, 'queued', 0, QUEUED_MESSAGE, article_id=article_id):
+            if job_queue.enqueue(copy):
+                logger.info("Follower requeued", extra={**ctx.log_extra, "followerJobId": job_id})
+                continue
+        job_queue.update_status(job_id, 'failed', 0, 'Failed to generate or save article', article_id=article_id)
+        repo.update_status(article_id, ArticleStatus.FAILED)
+
+
+def recover_stalled_jobs(repo: ArticleRepository, job_queue: JobQueuePort) -> int:
+    """Requeue stalled jobs; fail dead-lettered jobs' articles and followers."""
+    dead = job_queue.recover_stalled()
+    for ctx in dead:
+        _settle_followers(ctx, repo, job_queue)
+        if ctx.article_id:
+            repo.update_status(ctx.article_id, ArticleStatus.FAILED)
+    return len(dead)
+
+
+def run_due_schedules(repo: ArticleRepository, job_queue: JobQueuePort) -> int:
+    """Create and enqueue an article for every schedule that is due.
+
+    A run whose article cannot be saved or enqueued is put back
+    (release_schedule), so a Mongo or Redis hiccup retries it on a later
+    pass instead of dropping that day's run or a one-off schedule.
+    """
+    started = 0
+    for schedule in job_queue.claim_due_schedules():
+        article = Article.create(schedule.inputs, schedule.user_id)
+        extra = {"scheduleId": schedule.id, "articleId": article.id, "jobId": article.job_id}
+
+        if not repo.save(article):
+            logger.error("Failed to save scheduled article", extra=extra)
+            job_queue.release_schedule(schedule)
+            continue
+        if not (
+            job_queue.update_status(article.job_id, 'queued', 0, 'Scheduled job queued', article_id=article.id)
+            and job_queue.enqueue(article, priority=SCHEDULED_PRIORITY)
+        ):
+            job_queue.update_status(article.job_id, 'failed', 0, 'Failed to enqueue scheduled job', article_id=article.id)
+            repo.update_status(article.id, ArticleStatus.FAILED)
+            logger.error("Failed to enqueue scheduled job", extra=extra)
+            job_queue.release_schedule(schedule)
+            continue
+
+        logger.info("Scheduled job queued", extra=extra)
+        started += 1
+    return started
+
+
+def _log_pickup(ctx: JobContext) -> None:
+    """Log the job with its pickup latency (submit -> dequeue) as a metric."""
+    extra = dict(ctx.log_extra)
+    if ctx.pickup_latency is not None:
+        extra["pickupLatencyMs"] = round(ctx.pickup_latency * 1000)
+    logger.info("Received job", extra=extra)
 
 
 def run_worker_loop(
     repo: ArticleRepository,
     job_queue: JobQueuePort,
     generate: Callable[..., bool],
-):
-    """Main worker loop - continuously processes jobs from queue."""
-    logger.info("Worker started, waiting for jobs...")
+    concurrency: int = WORKER_CONCURRENCY,
+    stop: threading.Event | None = None,
+    drain_timeout: float = WORKER_DRAIN_TIMEOUT,
+) -> list[str]:
+    """Main worker loop - processes up to `concurrency` jobs at once until `stop` is set.
+
+    Returns the ids of jobs still running when the drain timed out. Their
+    threads cannot be interrupted, so the caller should end the process
+    (os._exit) rather than let interpreter shutdown wait for them.
+    """
+    stop = stop or threading.Event()
+    slots = threading.Semaphore(concurrency)
+    running: dict = {}  # future -> job id
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job")
+    logger.info("Worker started, waiting for jobs...", extra={"concurrency": concurrency})
+    next_recovery = 0.0
+    next_schedule_check = 0.0
+    next_pool_refill = 0.0
+    next_worker_heartbeat = 0.0
+    failures = 0
+
+    def backoff():
+        # Exponential, capped; only after errors, never after an empty wait
+        delay = min(MAX_ERROR_BACKOFF, 2 ** (failures - 1))
+        logger.warning("Job queue unavailable, backing off", extra={"failures": failures, "delaySeconds": delay})
+        stop.wait(delay)
+
+    def run(ctx: JobContext):
+        try:
+            process_job(ctx, repo, job_queue, generate)
+        except Exception as e:
+            logger.error(f"Unhandled error processing job: {e}", extra=ctx.log_extra, exc_info=True)
+        finally:
+            slots.release()
 
-    while True:
+    def periodic_tasks():
+        nonlocal next_recovery, next_schedule_check, next_pool_refill, next_worker_heartbeat, running
         try:
-            ctx = job_queue.dequeue()
-
-            if ctx:
-                logger.info("Received job", extra=ctx.log_extra)
-                process_job(ctx, repo, job_queue, generate)
-            else:
-                import time
-                time.sleep(5)
-
-        except KeyboardInterrupt:
-            logger.info("Worker stopped by user")
-            break
+            if time.monotonic() >= next_worker_heartbeat:
+                running = {f: job_id for f, job_id in running.items() if not f.done()}
+                job_queue.publish_worker_heartbeat(concurrency, list(running.values()))
+                next_worker_heartbeat = time.monotonic() + WORKER_HEARTBEAT_INTERVAL
+            if time.monotonic() >= next_recovery:
+                recover_stalled_jobs(repo, job_queue)
+                next_recovery = time.monotonic() + RECOVERY_INTERVAL
+            if time.monotonic() >= next_schedule_check:
+                run_due_schedules(repo, job_queue)
+                next_schedule_check = time.monotonic() + SCHEDULE_INTERVAL
+            if time.monotonic() >= next_pool_refill:
+                refill_pool(repo, job_queue)
+                next_pool_refill = time.monotonic() + POOL_REFILL_INTERVAL
         except Exception as e:
-            logger.error(f"Error in worker loop: {e}", exc_info=True)
-            import time
-            time.sleep(5)
+            logger.error(f"Error in worker periodic tasks: {e}", exc_info=True)
+
+    try:
+        while not stop.is_set():
+            periodic_tasks()
+            # Wait for a free slot; re-check stop at least once a second
+            if not slots.acquire(timeout=1):
+                continue
+            if stop.is_set():
+                slots.release()
+                break
+            try:
+                waited_from = time.monotonic()
+                ctx = job_queue.dequeue(timeout=DEQUEUE_TIMEOUT)
+
+                if ctx:
+                    failures = 0
+                    _log_pickup(ctx)
+                    running[executor.submit(run, ctx)] = ctx.job_id
+                    running = {f: job_id for f, job_id in running.items() if not f.done()}
+                else:
+                    slots.release()
+                    # The adapter waits out the full timeout on an empty queue;
+                    # an early empty result means Redis is failing
+                    if time.monotonic() - waited_from < DEQUEUE_TIMEOUT / 2:
+                        failures += 1
+                        backoff()
+                    else:
+                        failures = 0
+
+            except KeyboardInterrupt:
+                logger.info("Worker stopped by user")
+                slots.release()
+                break
+            except Exception as e:
+                logger.error(f"Error in worker loop: {e}", exc_info=True)
+                slots.release()
+                failures += 1
+                backoff()
+    finally:
+        running = {f: job_id for f, job_id in running.items() if not f.done()}
+        unfinished: list[str] = []
+        if running:
+            logger.info("Draining running jobs", extra={"count": len(running), "timeout": drain_timeout})
+            _, not_done = wait(running, timeout=drain_timeout)
+            unfinished = [running[f] for f in not_done]
+            if unfinished:
+                logger.warning(
+                    "Drain timed out; unfinished jobs will be recovered",
+                    extra={"count": len(unfinished), "jobIds": unfinished},
+                )
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Worker stopped")
+    return unfinished
@@ -0,0 +1,102 @@
+"""Unit tests for the per-process crew template in adapter.crew.factory."""
+
+import copy
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapter.crew.factory import CrewFactory, resumable_prefix
+
+
+class _FakeLLM:
+    def __init__(self):
+        self.client = object()  # stands in for the provider HTTP client
+        self._token_usage = {'prompt_tokens': 0, 'total_tokens': 0}
+
+
+class _FakeAgent:
+    def __init__(self, llm):
+        self.llm = llm
+
+
+class _FakeCrew:
+    def __init__(self, agents):
+        self.agents = agents
+
+    def copy(self):
+        # Like Crew.copy(): new agents, LLMs shallow-copied
+        return _FakeCrew([_FakeAgent(copy.copy(agent.llm)) for agent in self.agents])
+
+
+class _FakeCreator:
+    builds = 0
+
+    def __init__(self):
+        type(self).builds += 1
+
+    def get_role_to_key_map(self):
+        return {'News article finder': 'article_finder'}
+
+    def crew(self):
+        return _FakeCrew([_FakeAgent(_FakeLLM()), _FakeAgent(_FakeLLM())])
+
+
+class TestCrewFactory(unittest.TestCase):
+    """Test template caching and per-job copies."""
+
+    def setUp(self):
+        _FakeCreator.builds = 0
+        self.factory = CrewFactory(_FakeCreator)
+
+    def test_template_built_once(self):
+        threads = [threading.Thread(target=self.factory.create) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.factory.role_to_key_map()
+
+        self.assertEqual(_FakeCreator.builds, 1)
+
+    def test_copies_share_client_but_not_token_counters(self):
+        first, second = self.factory.create(), self.factory.create()
+        first.agents[0].llm._token_usage['total_tokens'] += 100
+
+        self.assertIsNot(first.agents[0], second.agents[0])
+        self.assertIs(first.agents[0].llm.client, second.agents[0].llm.client)
+        self.assertEqual(second.agents[0].llm._token_usage['total_tokens'], 0)
+        self.assertEqual(self.factory._template.agents[0].llm._token_usage['total_tokens'], 0)
+
+    def test_role_to_key_map_from_template(self):
+        self.assertEqual(self.factory.role_to_key_map(), {'News article finder': 'article_finder'})
+
+
+class _FakeTask:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestResumablePrefix(unittest.TestCase):
+    """Test which tasks a resumed job skips."""
+
+    TASKS = [_FakeTask(name) for name in ('find', 'pick', 'adapt', 'review')]
+
+    def test_skips_leading_checkpointed_tasks(self):
+        self.assertEqual(resumable_prefix(self.TASKS, {'find': {}, 'pick': {}}), 2)
+
+    def test_stops_at_first_gap(self):
+        self.assertEqual(resumable_prefix(self.TASKS, {'find': {}, 'adapt': {}}), 1)
+        self.assertEqual(resumable_prefix(self.TASKS, {}), 0)
+
+    def test_last_task_always_runs(self):
+        checkpoints = {task.name: {} for task in self.TASKS}
+
+        self.assertEqual(resumable_prefix(self.TASKS, checkpoints), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
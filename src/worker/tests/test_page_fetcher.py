@@ -0,0 +1,113 @@
+"""Unit tests for concurrent candidate scraping in adapter.external.page_fetcher."""
+
+import asyncio
+import importlib.util
+import time
+import unittest
+import sys
+from pathlib import Path
+
+import httpx
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapter.cache.keys import scrape_cache_key
+from adapter.fake.scrape_cache import FakeScrapeCache
+
+_HAS_BS4 = importlib.util.find_spec("bs4") is not None
+
+PAGE = "<html><body><h1>Title</h1><p>Body text</p></body></html>"
+
+
+def _transport(delay: float = 0.0, calls: list | None = None, status: dict | None = None):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if calls is not None:
+            calls.append(request)
+        await asyncio.sleep(delay)
+        code = (status or {}).get(str(request.url), 200)
+        return httpx.Response(code, text=PAGE if code != 304 else "", headers={"ETag": '"v2"'})
+    return httpx.MockTransport(handler)
+
+
+@unittest.skipUnless(_HAS_BS4, "beautifulsoup4 not installed")
+class TestFetchPages(unittest.TestCase):
+
+    def _fetch(self, urls, **kwargs):
+        from adapter.external.page_fetcher import fetch_pages
+        return asyncio.run(fetch_pages(urls, **kwargs))
+
+    def test_pages_are_fetched_concurrently_in_order(self):
+        urls = [f"https://example.com/{i}" for i in range(4)]
+
+        started = time.perf_counter()
+        pages = self._fetch(urls, transport=_transport(delay=0.2), concurrency=4)
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual([page.url for page in pages], urls)
+        self.assertIn("Body text", pages[0].text)
+
+    def test_slow_page_times_out_without_failing_the_batch(self):
+        async def handler(request):
+            await asyncio.sleep(1 if request.url.path == "/slow" else 0)
+            return httpx.Response(200, text=PAGE)
+
+        pages = self._fetch(
+            ["https://example.com/fast", "https://example.com/slow"],
+            transport=httpx.MockTransport(handler),
+            timeout=0.1,
+        )
+
+        self.assertIsNone(pages[0].error)
+        self.assertIn("timed out", pages[1].error)
+
+    def test_duplicate_urls_fetched_once(self):
+        calls = []
+
+        pages = self._fetch(
+            ["https://example.com/a?utm_source=x", "https://EXAMPLE.com/a/"],
+            transport=_transport(calls=calls),
+        )
+
+        self.assertEqual((len(pages), len(calls)), (1, 1))
+
+    def test_cache_serves_fresh_and_revalidates_stale_pages(self):
+        cache = FakeScrapeCache()
+        fresh, stale, new = "https://example.com/fresh", "https://example.com/stale", "https://example.com/new"
+        cache.put(scrape_cache_key(fresh), "cached fresh")
+        cache.put(scrape_cache_key(stale), "cached stale", etag='"v1"')
+        cache.stale.add(scrape_cache_key(stale))
+        calls = []
+
+        pages = self._fetch([fresh, stale, new], cache=cache, transport=_transport(calls=calls, status={stale: 304}))
+
+        self.assertEqual([page.source for page in pages], ["cache", "revalidated", "network"])
+        self.assertEqual(pages[1].text, "cached stale")
+        self.assertEqual(calls[0].headers["If-None-Match"], '"v1"')
+        self.assertEqual(cache.pages[scrape_cache_key(new)]["etag"], '"v2"')
+        self.assertEqual(cache.get_stats()["revalidated"], 1)
+
+    def test_error_pages_are_not_cached(self):
+        cache = FakeScrapeCache()
+        url = "https://example.com/gone"
+
+        pages = self._fetch([url], cache=cache, transport=_transport(status={url: 404}))
+
+        self.assertEqual(pages[0].status, 404)
+        self.assertNotIn(scrape_cache_key(url), cache.pages)
+
+    def test_format_pages(self):
+        from adapter.external.page_fetcher import FetchedPage, format_pages
+
+        text = format_pages([
+            FetchedPage("https://a.example", "A text"),
+            FetchedPage("https://b.example", None, error="timed out after 15s"),
+        ])
+
+        self.assertIn("=== [1] https://a.example ===\nA text", text)
+        self.assertIn("=== [2] https://b.example ===\nERROR", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,18 +1,21 @@
 """Unit tests for worker error handling."""
 
+import threading
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import sys
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from worker.processor import process_job
+from worker.processor import process_job, recover_stalled_jobs, run_due_schedules, run_worker_loop
 from adapter.fake.article_repository import FakeArticleRepository
 from adapter.fake.job_queue import FakeJobQueueAdapter
 from domain.model.article import Article, ArticleInputs, ArticleStatus
+from domain.model.errors import JobCancelledError
 from domain.model.job import JobContext
+from domain.model.schedule import Schedule
 
 TEST_INPUTS = ArticleInputs(language='German', level='B2', length='500', topic='AI')
 
@@ -134,5 +137,418 @@ class TestWorkerErrorHandling(unittest.TestCase):
         self.assertEqual(status['status'], 'failed')
 
 
+class TestWorkerReliability(unittest.TestCase):
+    """Test ack and stalled-job recovery wiring in the worker."""
+
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeJobQueueAdapter(max_attempts=2)
+
+    def _enqueue(self):
+        from datetime import datetime, timezone
+        article = Article(
+            id='test-article',
+            inputs=TEST_INPUTS,
+            status=ArticleStatus.RUNNING,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+            job_id='test-job',
+        )
+        self.repo.save(article)
+        self.job_queue.enqueue(article)
+
+    def test_job_is_acked_after_success(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(return_value=True))
+
+        self.assertNotIn('test-job', self.job_queue.processing)
+
+    def test_job_is_acked_after_failure(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(side_effect=RuntimeError('boom')))
+
+        self.assertNotIn('test-job', self.job_queue.processing)
+
+    def test_job_is_acked_before_its_final_status(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+        status_at_ack = []
+        ack = self.job_queue.ack
+        self.job_queue.ack = lambda job_id: status_at_ack.append(self.job_queue.get_status(job_id)['status']) or ack(job_id)
+
+        for generate in (MagicMock(return_value=True), MagicMock(side_effect=RuntimeError('boom'))):
+            self.job_queue.processing['test-job'] = ctx
+            process_job(ctx, self.repo, self.job_queue, generate=generate)
+
+        self.assertEqual(status_at_ack, ['running', 'running'])
+        self.assertEqual(self.job_queue.get_status('test-job')['status'], 'failed')
+
+    def test_cancelled_job_is_skipped(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+        self.job_queue.cancel('test-job', 'test-article')
+        generate = MagicMock(return_value=True)
+
+        self.assertFalse(process_job(ctx, self.repo, self.job_queue, generate=generate))
+
+        generate.assert_not_called()
+        self.assertEqual(self.job_queue.get_status('test-job')['status'], 'cancelled')
+        self.assertNotIn('test-job', self.job_queue.processing)
+
+    def test_cancel_during_generation_ends_cancelled(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(side_effect=JobCancelledError('test-job')))
+
+        self.assertEqual(self.job_queue.get_status('test-job')['status'], 'cancelled')
+        self.assertEqual(self.repo.get_by_id('test-article').status, ArticleStatus.RUNNING)
+
+    def test_checkpoints_cleared_only_on_success(self):
+        self._enqueue()
+        self.job_queue.save_checkpoint('test-job', 'find_news_articles', {'raw': '[]', 'agent': 'finder'})
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(side_effect=RuntimeError('boom')))
+        self.assertIn('find_news_articles', self.job_queue.load_checkpoints('test-job'))
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(return_value=True))
+        self.assertEqual(self.job_queue.load_checkpoints('test-job'), {})
+
+    def test_processing_time_is_recorded(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(side_effect=RuntimeError('boom')))
+
+        self.assertEqual([status for _, status in self.job_queue.processing_times], ['failed'])
+
+    def test_cancelled_jobs_are_not_recorded_as_failed(self):
+        self._enqueue()
+        ctx = self.job_queue.dequeue()
+
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(side_effect=JobCancelledError('test-job')))
+        self.job_queue.cancel('test-job', 'test-article')
+        process_job(ctx, self.repo, self.job_queue, generate=MagicMock(return_value=True))
+
+        # The second run was skipped before starting, so only the first is recorded
+        self.assertEqual([status for _, status in self.job_queue.processing_times], ['cancelled'])
+
+    def test_stalled_job_is_requeued(self):
+        self._enqueue()
+        self.job_queue.dequeue()
+        self.job_queue.stalled.add('test-job')
+
+        self.assertEqual(recover_stalled_jobs(self.repo, self.job_queue), 0)
+        self.assertEqual(self.job_queue.dequeue().attempts, 1)
+
+    def test_dead_lettered_job_marks_article_failed(self):
+        self._enqueue()
+        for _ in range(2):
+            self.job_queue.dequeue()
+            self.job_queue.stalled.add('test-job')
+            dead = recover_stalled_jobs(self.repo, self.job_queue)
+
+        self.assertEqual(dead, 1)
+        self.assertEqual(self.repo.get_by_id('test-article').status, ArticleStatus.FAILED)
+        self.assertEqual(self.job_queue.get_status('test-job')['status'], 'failed')
+
+
+class TestScheduledJobs(unittest.TestCase):
+    """Test turning due schedules into queued jobs."""
+
+    def setUp(self):
+        from datetime import datetime, timedelta, timezone
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeJobQueueAdapter()
+        self.past = datetime.now(timezone.utc) - timedelta(minutes=1)
+
+    def _schedule(self, repeat_daily=True):
+        schedule = Schedule.create(TEST_INPUTS, 'user-1', '06:00', repeat_daily)
+        self.job_queue.schedules[schedule.id] = schedule
+        self.job_queue.next_runs[schedule.id] = self.past
+        return schedule
+
+    def test_due_schedule_creates_article_and_low_priority_job(self):
+        self._schedule()
+
+        self.assertEqual(run_due_schedules(self.repo, self.job_queue), 1)
+
+        ctx = self.job_queue.dequeue()
+        self.assertEqual(ctx.user_id, 'user-1')
+        self.assertEqual(self.job_queue.lanes[ctx.job_id], 'low')
+        self.assertIsNotNone(self.repo.get_by_id(ctx.article_id))
+        self.assertEqual(self.job_queue.get_status(ctx.job_id)['status'], 'queued')
+
+    def test_daily_schedule_moves_to_next_run(self):
+        schedule = self._schedule()
+
+        run_due_schedules(self.repo, self.job_queue)
+
+        self.assertGreater(self.job_queue.next_runs[schedule.id], self.past)
+        self.assertEqual(run_due_schedules(self.repo, self.job_queue), 0)
+
+    def test_one_off_schedule_is_removed(self):
+        schedule = self._schedule(repeat_daily=False)
+
+        run_due_schedules(self.repo, self.job_queue)
+
+        self.assertNotIn(schedule.id, self.job_queue.schedules)
+
+    def test_failed_save_puts_the_run_back(self):
+        schedule = self._schedule(repeat_daily=False)
+        self.repo.save = lambda article: False
+
+        self.assertEqual(run_due_schedules(self.repo, self.job_queue), 0)
+
+        self.assertIn(schedule.id, self.job_queue.schedules)
+        self.assertEqual([s.id for s in self.job_queue.claim_due_schedules()], [schedule.id])
+
+    def test_failed_enqueue_puts_the_run_back(self):
+        schedule = self._schedule()
+        self.job_queue.enqueue = lambda article, priority=None: False
+
+        self.assertEqual(run_due_schedules(self.repo, self.job_queue), 0)
+
+        self.assertEqual(self.job_queue.next_runs[schedule.id], schedule.last_run())
+        self.assertEqual([s.id for s in self.job_queue.claim_due_schedules()], [schedule.id])
+
+
+class TestInflightFollowers(unittest.TestCase):
+    """Test completing the articles of jobs attached to a running job."""
+
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeJobQueueAdapter()
+        self.leader = Article.create(TEST_INPUTS, 'user-1')
+        self.follower = Article.create(TEST_INPUTS, 'user-2')
+        for article in (self.leader, self.follower):
+            self.repo.save(article)
+            self.job_queue.update_status(article.job_id, 'queued', 0, 'queued', article_id=article.id)
+        self.job_queue.join_inflight(self.leader)
+        self.job_queue.join_inflight(self.follower, attach=True)
+        self.ctx = JobContext(self.leader.job_id, self.leader.id, 'user-1', TEST_INPUTS)
+
+    def test_followers_get_a_copy_of_the_result(self):
+        def generate(article, **kwargs):
+            article.complete('Shared content')
+            return True
+
+        self.assertTrue(process_job(self.ctx, self.repo, self.job_queue, generate))
+
+        follower = self.repo.get_by_id(self.follower.id)
+        self.assertEqual((follower.status, follower.content), (ArticleStatus.COMPLETED, 'Shared content'))
+        self.assertEqual(self.job_queue.get_status(self.follower.job_id)['status'], 'completed')
+        self.assertNotIn(TEST_INPUTS.fingerprint, self.job_queue.inflight)
+
+    def test_followers_fail_with_the_job(self):
+        process_job(self.ctx, self.repo, self.job_queue, MagicMock(return_value=False))
+
+        self.assertEqual(self.repo.get_by_id(self.follower.id).status, ArticleStatus.FAILED)
+        self.assertEqual(self.job_queue.get_status(self.follower.job_id)['status'], 'failed')
+
+    def test_followers_of_a_cancelled_queued_job_are_requeued(self):
+        self.job_queue.cancel(self.leader.job_id, self.leader.id)
+        generate = MagicMock(return_value=True)
+
+        self.assertFalse(process_job(self.ctx, self.repo, self.job_queue, generate))
+
+        generate.assert_not_called()
+        self.assertEqual(self.job_queue.get_status(self.follower.job_id)['status'], 'queued')
+        self.assertEqual([ctx.job_id for ctx in self.job_queue.queue], [self.follower.job_id])
+        self.assertNotIn(self.leader.job_id, self.job_queue.followers)
+
+    def test_followers_of_a_job_cancelled_while_running_are_requeued(self):
+        self.assertFalse(process_job(
+            self.ctx, self.repo, self.job_queue, MagicMock(side_effect=JobCancelledError('cancelled')),
+        ))
+
+        self.assertEqual(self.job_queue.get_status(self.leader.job_id)['status'], 'cancelled')
+        self.assertEqual(self.job_queue.get_status(self.follower.job_id)['status'], 'queued')
+        self.assertEqual(self.repo.get_by_id(self.follower.id).status, ArticleStatus.RUNNING)
+        self.assertEqual([ctx.job_id for ctx in self.job_queue.queue], [self.follower.job_id])
+
+    def test_followers_of_a_dead_lettered_job_fail(self):
+        self.job_queue.enqueue(self.leader)
+        for _ in range(self.job_queue.max_attempts):
+            self.job_queue.dequeue()
+            self.job_queue.stalled.add(self.leader.job_id)
+            recover_stalled_jobs(self.repo, self.job_queue)
+
+        self.assertEqual(self.repo.get_by_id(self.follower.id).status, ArticleStatus.FAILED)
+        self.assertEqual(self.job_queue.get_status(self.follower.job_id)['status'], 'failed')
+        self.assertNotIn(TEST_INPUTS.fingerprint, self.job_queue.inflight)
+
+
+class TestConcurrentWorkerLoop(unittest.TestCase):
+    """Test N-way job concurrency and drain on stop."""
+
+    def setUp(self):
+        self.repo = FakeArticleRepository()
+        self.job_queue = FakeJobQueueAdapter()
+        for _ in range(3):
+            article = Article.create(TEST_INPUTS, 'user-1')
+            self.repo.save(article)
+            self.job_queue.enqueue(article)
+
+    def _run_loop(self, generate, stop, concurrency):
+        loop = threading.Thread(
+            target=run_worker_loop,
+            args=(self.repo, self.job_queue, generate),
+            kwargs={'concurrency': concurrency, 'stop': stop, 'drain_timeout': 5},
+        )
+        loop.start()
+        return loop
+
+    def test_runs_jobs_concurrently(self):
+        stop = threading.Event()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate(**kwargs):
+            barrier.wait()  # only passes if all three jobs run at once
+            return True
+
+        loop = self._run_loop(generate, stop, concurrency=3)
+        while self.job_queue.queue and not barrier.broken:
+            stop.wait(0.01)
+        stop.set()
+        loop.join(timeout=10)
+
+        self.assertFalse(loop.is_alive())
+        self.assertFalse(barrier.broken)
+        statuses = [s['status'] for s in self.job_queue.statuses.values()]
+        self.assertEqual(statuses, ['completed'] * 3)
+
+    def test_stop_drains_running_job_and_leaves_rest_queued(self):
+        stop = threading.Event()
+        started = threading.Event()
+        release = threading.Event()
+
+        def generate(**kwargs):
+            started.set()
+            release.wait(5)
+            return True
+
+        loop = self._run_loop(generate, stop, concurrency=1)
+        self.assertTrue(started.wait(5))
+        stop.set()
+        release.set()
+        loop.join(timeout=10)
+
+        self.assertFalse(loop.is_alive())
+        statuses = [s['status'] for s in self.job_queue.statuses.values()]
+        self.assertEqual(statuses, ['completed'])
+        self.assertEqual(len(self.job_queue.queue), 2)
+
+    def test_drain_timeout_returns_unfinished_jobs_without_waiting(self):
+        stop = threading.Event()
+        started = threading.Event()
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def generate(**kwargs):
+            started.set()
+            release.wait(10)
+            return True
+
+        result = []
+        loop = threading.Thread(
+            target=lambda: result.append(run_worker_loop(
+                self.repo, self.job_queue, generate, concurrency=1, stop=stop, drain_timeout=0.1,
+            )),
+        )
+        loop.start()
+        self.assertTrue(started.wait(5))
+        stop.set()
+        loop.join(timeout=5)
+
+        self.assertFalse(loop.is_alive())
+        self.assertEqual(result, [[next(iter(self.job_queue.statuses))]])
+
+    def test_worker_heartbeat_reports_in_flight_jobs_while_slots_are_busy(self):
+        stop = threading.Event()
+        started = threading.Event()
+        release = threading.Event()
+
+        def generate(**kwargs):
+            started.set()
+            release.wait(5)
+            return True
+
+        with patch('worker.processor.WORKER_HEARTBEAT_INTERVAL', 0):
+            loop = self._run_loop(generate, stop, concurrency=1)
+            self.assertTrue(started.wait(5))
+            while not any(in_flight for _, in_flight in self.job_queue.worker_heartbeats):
+                stop.wait(0.01)
+            stop.set()
+            release.set()
+            loop.join(timeout=10)
+
+        self.assertEqual(self.job_queue.worker_heartbeats[0], (1, []))
+        self.assertIn((1, [next(iter(self.job_queue.statuses))]), self.job_queue.worker_heartbeats)
+
+
+class _StopOnWait(threading.Event):
+    """Stop event that records backoff waits and stops the loop on the first one."""
+
+    def __init__(self):
+        super().__init__()
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        self.set()
+        return True
+
+
+class TestDequeueWait(unittest.TestCase):
+    """Test long blocking dequeue, error backoff and pickup latency."""
+
+    def setUp(self):
+        self.job_queue = MagicMock()
+        self.job_queue.recover_stalled.return_value = []
+        self.job_queue.claim_due_schedules.return_value = []
+
+    def test_empty_wait_loops_without_sleeping(self):
+        stop = _StopOnWait()
+        calls = []
+
+        def dequeue(timeout):
+            calls.append(timeout)
+            if len(calls) == 2:
+                stop.set()
+            return None
+
+        self.job_queue.dequeue.side_effect = dequeue
+        with patch('worker.processor.DEQUEUE_TIMEOUT', 0):
+            run_worker_loop(FakeArticleRepository(), self.job_queue, MagicMock(), stop=stop)
+
+        self.assertEqual(calls, [0, 0])
+        self.assertEqual(stop.waits, [])
+
+    def test_failing_dequeue_backs_off(self):
+        stop = _StopOnWait()
+        self.job_queue.dequeue.return_value = None  # returns at once: Redis failing
+
+        run_worker_loop(FakeArticleRepository(), self.job_queue, MagicMock(), stop=stop)
+
+        self.assertEqual(stop.waits, [1])
+
+    def test_pickup_latency_from_created_at(self):
+        ctx = JobContext.from_dict({
+            'job_id': 'j1',
+            'inputs': {'language': 'German', 'level': 'B2', 'length': '500', 'topic': 'AI'},
+            'created_at': '2026-01-08T14:00:00+00:00',
+        })
+        from datetime import datetime, timezone
+        ctx.started_at = datetime(2026, 1, 8, 14, 0, 2, 500000, tzinfo=timezone.utc)
+
+        self.assertEqual(ctx.pickup_latency, 2.5)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+"""Unit tests for the local candidate scorer in adapter.crew.readability."""
+
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import adapter.crew.readability as readability
+from adapter.crew.models import NewsArticle
+from adapter.crew.readability import difficulty, pick_article, score_candidates, topic_keywords
+
+SIMPLE = "The cat is on the mat. It is a good day. We go to the park. "
+DENSE = (
+    "Notwithstanding considerable macroeconomic uncertainty, policymakers "
+    "deliberated extensively regarding prospective monetary tightening measures "
+    "and their implications for sovereign bond valuations across jurisdictions. "
+)
+INPUTS = {'language': 'English', 'level': 'A2', 'length': '60', 'topic': 'Climate change'}
+
+
+def _article(title, content, author='Jane Doe'):
+    return NewsArticle(title=title, source_name='News', source_url='https://example.com', author=author, content=content)
+
+
+class TestDifficulty(unittest.TestCase):
+    def test_short_sentences_and_frequent_words_read_easier(self):
+        self.assertLess(difficulty(SIMPLE * 5, 'English'), difficulty(DENSE * 5, 'English'))
+
+    def test_languages_without_word_list_fall_back_to_word_length(self):
+        self.assertLess(difficulty(SIMPLE * 5, 'Swahili'), difficulty(DENSE * 5, 'Swahili'))
+
+    def test_topic_keywords_skip_frequent_words(self):
+        self.assertEqual(topic_keywords('The future of climate policy'), ['future', 'climate', 'policy'])
+
+
+class TestScoreCandidates(unittest.TestCase):
+    def test_ranks_on_topic_level_and_length(self):
+        on_topic = _article('Climate change hits farms', 'Climate change is here. ' + SIMPLE * 4)
+        off_topic = _article('Football results', SIMPLE * 4)
+        too_hard = _article('Climate change policy', 'Climate change. ' + DENSE * 3)
+
+        scores = score_candidates([off_topic, too_hard, on_topic], INPUTS)
+
+        self.assertEqual([s.index for s in scores], [2, 1, 0])
+        self.assertEqual(scores[-1].topic, 0.0)
+        self.assertGreater(scores[0].difficulty, scores[1].difficulty)
+
+    def test_inflected_topic_words_match(self):
+        [score] = score_candidates([_article('Changing climates', SIMPLE)], INPUTS)
+
+        self.assertAlmostEqual(score.topic, 0.6)  # title only
+
+
+class TestPickArticle(unittest.TestCase):
+    def test_clear_winner_is_selected_without_author(self):
+        winner = _article('Climate change hits farms', 'Climate change is here. ' + SIMPLE * 4)
+
+        selected = pick_article([_article('Football results', SIMPLE * 4), winner], INPUTS)
+
+        self.assertEqual(selected.article.title, winner.title)
+        self.assertIsNone(selected.article.author)
+        self.assertIn('Selected locally', selected.selection_rationale)
+
+    def test_close_scores_defer_to_picker(self):
+        candidates = [_article('Climate change now', SIMPLE * 4), _article('Climate change today', SIMPLE * 4)]
+
+        self.assertIsNone(pick_article(candidates, INPUTS))
+
+    def test_no_topic_match_defers_to_picker(self):
+        candidates = [_article('Football results', SIMPLE * 4), _article('Klimawandel', DENSE)]
+
+        self.assertIsNone(pick_article(candidates, INPUTS))
+
+    def test_margin_of_one_always_uses_picker(self):
+        winner = _article('Climate change hits farms', 'Climate change is here. ' + SIMPLE * 4)
+
+        with patch.object(readability, 'PICKER_TIE_MARGIN', 1.0):
+            self.assertIsNone(pick_article([winner, _article('Football', SIMPLE)], INPUTS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""Unit tests for the shared tool caches (keys and Redis adapters)."""
+
+import base64
+import importlib.util
+import os
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from adapter.cache.keys import canonical_url, normalize_query, scrape_cache_key, search_bucket_ttl, search_cache_key
+from adapter.cache.redis_scrape_cache import SCRAPE_BYTES_KEY, SCRAPE_PAGE_PREFIX, RedisScrapeCache
+from adapter.cache.redis_search_cache import SEARCH_CACHE_PREFIX, RedisSearchCache
+from adapter.fake.search_cache import FakeSearchCache
+
+_HAS_FAKEREDIS_LUA = all(importlib.util.find_spec(m) for m in ("fakeredis", "lupa"))
+
+NOW = 1_700_000_000
+
+
+class TestSearchCacheKey(unittest.TestCase):
+    """Test which searches share a cache entry."""
+
+    def test_normalized_queries_share_a_key(self):
+        self.assertEqual(normalize_query("  Künstliche   Intelligenz, News! "), "künstliche intelligenz news")
+        self.assertEqual(
+            search_cache_key("AI news", "English", "news", now=NOW),
+            search_cache_key(" ai  NEWS?", "english", "news", now=NOW),
+        )
+
+    def test_language_and_search_type_are_part_of_the_key(self):
+        key = search_cache_key("AI", "English", "news", now=NOW)
+
+        self.assertNotEqual(key, search_cache_key("AI", "German", "news", now=NOW))
+        self.assertNotEqual(key, search_cache_key("AI", "English", "search", now=NOW))
+
+    def test_key_changes_with_time_bucket(self):
+        key = search_cache_key("AI", "English", "news", now=NOW, bucket_seconds=3600)
+        start = NOW - NOW % 3600
+
+        self.assertEqual(key, search_cache_key("AI", "English", "news", now=start, bucket_seconds=3600))
+        self.assertNotEqual(key, search_cache_key("AI", "English", "news", now=start + 3600, bucket_seconds=3600))
+
+    def test_entries_expire_with_their_bucket(self):
+        start = NOW - NOW % 3600
+
+        self.assertEqual(search_bucket_ttl(start, bucket_seconds=3600), 3600)
+        self.assertEqual(search_bucket_ttl(start + 3000, bucket_seconds=3600), 600)
+        self.assertEqual(search_bucket_ttl(start + 3599.5, bucket_seconds=3600), 1)
+
+
+class TestScrapeCacheKey(unittest.TestCase):
+    """Test which URLs share a scrape cache entry."""
+
+    def test_canonical_url(self):
+        self.assertEqual(
+            canonical_url("HTTPS://www.Example.com:443/news/story/?utm_source=x&b=2&a=1#top"),
+            "https://www.example.com/news/story?a=1&b=2",
+        )
+        self.assertEqual(canonical_url("http://example.com"), "http://example.com/")
+
+    def test_tracking_variants_share_a_key(self):
+        self.assertEqual(
+            scrape_cache_key("https://example.com/a?id=7"),
+            scrape_cache_key("https://EXAMPLE.com/a/?fbclid=abc&id=7"),
+        )
+        self.assertNotEqual(scrape_cache_key("https://example.com/a?id=7"), scrape_cache_key("https://example.com/a?id=8"))
+
+
+class TestFakeSearchCache(unittest.TestCase):
+
+    def test_hit_rate(self):
+        cache = FakeSearchCache()
+        cache.get("k")
+        cache.put("k", {"news": []}, 60)
+        cache.get("k")
+        cache.get("k")
+
+        self.assertEqual(cache.get_stats(), {'hits': 2, 'misses': 1, 'lookups': 3, 'hit_rate': 0.667})
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestRedisSearchCache(unittest.TestCase):
+    """Run the cache against fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisSearchCache, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = RedisSearchCache()
+
+    def test_roundtrip_counts_hits_and_misses(self):
+        results = {"news": [{"title": "t", "link": "https://example.com"}]}
+
+        self.assertIsNone(self.cache.get("k"))
+        self.assertTrue(self.cache.put("k", results, 600))
+        self.assertEqual(self.cache.get("k"), results)
+
+        self.assertLessEqual(self.redis.ttl(f"{SEARCH_CACHE_PREFIX}k"), 600)
+        self.assertEqual(self.cache.get_stats(), {'hits': 1, 'misses': 1, 'lookups': 2, 'hit_rate': 0.5})
+
+
+
+@unittest.skipUnless(_HAS_FAKEREDIS_LUA, "fakeredis with Lua support not installed")
+class TestRedisScrapeCache(unittest.TestCase):
+    """Run the scrape cache scripts against fakeredis (optional dev dependency)."""
+
+    def setUp(self):
+        import fakeredis
+        self.redis = fakeredis.FakeRedis(decode_responses=True)
+        patcher = patch.object(RedisScrapeCache, '_get_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cache = RedisScrapeCache(max_bytes=10_000)
+
+    def test_text_is_stored_compressed(self):
+        text = "Der Bundestag hat heute beschlossen. " * 200
+
+        self.cache.put("k", text, etag='"v1"')
+        page = self.cache.get("k", fresh_seconds=60)
+
+        self.assertEqual((page['text'], page['etag'], page['fresh']), (text, '"v1"', True))
+        self.assertLess(len(self.redis.hget(f"{SCRAPE_PAGE_PREFIX}k", "text")), len(text) // 5)
+
+    def test_stale_page_is_revalidated(self):
+        self.cache.put("k", "text", last_modified="Mon, 01 Jan 2024 00:00:00 GMT")
+        self.redis.hset(f"{SCRAPE_PAGE_PREFIX}k", "fetched_ms", 0)
+
+        self.assertFalse(self.cache.get("k", fresh_seconds=60)['fresh'])
+        self.assertTrue(self.cache.revalidated("k"))
+        self.assertTrue(self.cache.get("k", fresh_seconds=60)['fresh'])
+        self.assertIsNone(self.cache.get("missing", fresh_seconds=60))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['stale'], stats['misses'], stats['revalidated']), (1, 1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.667)
+
+    def test_least_recently_used_pages_are_evicted(self):
+        for key in ("a", "b", "c"):
+            # Random base64 text barely compresses, so each page takes ~4 KB
+            self.cache.put(key, base64.b64encode(os.urandom(3000)).decode())
+            time.sleep(0.005)  # distinct LRU timestamps (Redis TIME, ms)
+            if key == "b":
+                self.cache.get("a", fresh_seconds=60)
+                time.sleep(0.005)
+
+        self.assertIsNotNone(self.cache.get("a", fresh_seconds=60))
+        self.assertIsNone(self.cache.get("b", fresh_seconds=60))
+        self.assertLessEqual(int(self.redis.get(SCRAPE_BYTES_KEY)), 10_000)
+        self.assertEqual(self.cache.get_stats()['evictions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()